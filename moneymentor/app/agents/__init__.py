@@ -24,6 +24,7 @@ from .tools import (
 from .agent_orchestrator import (
     run_agent_query,
     run_agent_batch,
+    arun_agent_batch,
     get_agent_info
 )
 
@@ -46,5 +47,6 @@ __all__ = [
     # Agent orchestrator
     'run_agent_query',
     'run_agent_batch',
+    'arun_agent_batch',
     'get_agent_info',
 ]
@@ -5,6 +5,8 @@ Lightweight orchestration layer using LangChain agents for intelligent tool sele
 Uses GPT-4o-mini for reasoning and automatic tool routing.
 """
 import os
+import sys
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional
 from langchain.agents import initialize_agent, AgentType
@@ -17,6 +19,9 @@ from .tools import ALL_TOOLS, get_last_tool_invoked, get_all_tools_invoked, rese
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Console banners for the demo/test output
+_SEP = "=" * 70
+
 
 def run_agent_query(query: str, verbose: bool = False) -> Dict[str, Any]:
     """
@@ -176,14 +181,14 @@ Question: "What is inflation and what is the current rate?"
 
 def run_agent_batch(queries: List[str], verbose: bool = False) -> List[Dict[str, Any]]:
     """
-    Run multiple queries through the agent in sequence.
+    Run multiple queries through the agent concurrently.
     
     Args:
         queries: List of user questions
         verbose: If True, print detailed reasoning for each query
         
     Returns:
-        List of result dictionaries
+        List of result dictionaries, in the same order as queries
         
     Example:
         >>> queries = [
@@ -192,17 +197,24 @@ def run_agent_batch(queries: List[str], verbose: bool = False) -> List[Dict[str,
         ... ]
         >>> results = run_agent_batch(queries)
     """
-    results = []
+    return asyncio.run(arun_agent_batch(queries, verbose=verbose))
+
+
+async def arun_agent_batch(queries: List[str], verbose: bool = False) -> List[Dict[str, Any]]:
+    """
+    Async version of run_agent_batch().
     
-    for i, query in enumerate(queries, 1):
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Processing query {i}/{len(queries)}")
-        logger.info(f"{'='*60}")
-        
-        result = run_agent_query(query, verbose=verbose)
-        results.append(result)
+    Each query runs in a worker thread, so their LLM and tool calls overlap
+    instead of running back to back.
+    """
+    def run_one(i: int, query: str) -> Dict[str, Any]:
+        logger.info(f"Processing query {i}/{len(queries)}: '{query[:60]}'")
+        return run_agent_query(query, verbose=verbose)
     
-    return results
+    return await asyncio.gather(*(
+        asyncio.to_thread(run_one, i, query)
+        for i, query in enumerate(queries, 1)
+    ))
 
 
 def get_agent_info() -> Dict[str, Any]:
@@ -225,9 +237,9 @@ if __name__ == "__main__":
     """
     CLI test harness for the agent orchestrator
     """
-    print("=" * 70)
+    print(_SEP)
     print("MoneyMentor - Agent Orchestrator Test")
-    print("=" * 70)
+    print(_SEP)
     print()
     
     # Display agent info
@@ -256,25 +268,29 @@ if __name__ == "__main__":
         }
     ]
     
-    for i, test in enumerate(test_queries, 1):
-        print("=" * 70)
-        print(f"TEST {i}: {test['query'][:60]}...")
-        print(f"Expected tool: {test['expected_tool']}")
-        print("=" * 70)
-        
-        result = run_agent_query(test["query"], verbose=False)
-        
-        print(f"\n✅ Tool used: {result['tool_used']}")
-        print(f"\n📝 Answer:\n{result['answer'][:300]}...")
+    # Run all test queries concurrently, then print in order
+    results = run_agent_batch([test["query"] for test in test_queries])
+    
+    for i, (test, result) in enumerate(zip(test_queries, results), 1):
+        # One write per test instead of one per line
+        lines = [
+            _SEP,
+            f"TEST {i}: {test['query'][:60]}...",
+            f"Expected tool: {test['expected_tool']}",
+            _SEP,
+            f"\n✅ Tool used: {result['tool_used']}",
+            f"\n📝 Answer:\n{result['answer'][:300]}..."
+        ]
         
         if result["intermediate_steps"]:
-            print(f"\n🔍 Intermediate steps:")
+            lines.append(f"\n🔍 Intermediate steps:")
             for step in result["intermediate_steps"]:
-                print(f"  • {step['tool']}: {step['input'][:50]}...")
+                lines.append(f"  • {step['tool']}: {step['input'][:50]}...")
         
-        print("\n")
+        lines.append("\n")
+        sys.stdout.write("\n".join(lines) + "\n")
         
-    print("=" * 70)
+    print(_SEP)
     print("✅ All tests complete!")
-    print("=" * 70)
+    print(_SEP)
 
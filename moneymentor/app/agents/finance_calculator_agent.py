@@ -5,8 +5,36 @@ Provides calculation tools for financial planning queries.
 Includes future value calculations, investment projections, and more.
 """
 import re
+import sys
+import copy
+import functools
 from typing import Dict, Any, Optional, Tuple
 
+# Console banners for the demo/test output
+_SEP = "=" * 60
+_DASH = "-" * 60
+
+# Query parsing patterns, compiled once at import (tried in order)
+_MONTHLY_PATTERNS = [
+    re.compile(r'\$?(\d{1,10}(?:,\d{3})*(?:\.\d{2})?)\s*(?:per month|a month|monthly|/month|month)'),
+    re.compile(r'invest\s+\$?(\d{1,10}(?:,\d{3})*(?:\.\d{2})?)'),
+    re.compile(r'\$?(\d{1,10}(?:,\d{3})*(?:\.\d{2})?)\s*each month'),
+]
+_PRINCIPAL_PATTERNS = [
+    re.compile(r'invest\s+\$?(\d{1,10}(?:,\d{3})*(?:\.\d{2})?)'),
+    re.compile(r'\$(\d{1,10}(?:,\d{3})*(?:\.\d{2})?)\s+at'),
+    re.compile(r'principal\s+(?:of\s+)?\$?(\d{1,10}(?:,\d{3})*(?:\.\d{2})?)'),
+]
+_RATE_PATTERNS = [
+    re.compile(r'(?:at|@|with|earning|return(?:ing)?)\s+(\d+(?:\.\d+)?)\s*%'),
+    re.compile(r'(\d+(?:\.\d+)?)\s*%\s*(?:annual|yearly|per year)?'),
+    re.compile(r'(\d+(?:\.\d+)?)\s*percent'),
+]
+_YEAR_PATTERNS = [
+    re.compile(r'(?:for|over|in)\s+(\d+)\s*years?'),
+    re.compile(r'(\d+)\s*years?'),
+]
+
 
 def calculate_future_value(
     monthly_contrib: float,
@@ -91,44 +119,27 @@ def parse_investment_query(query: str) -> Optional[Dict[str, float]]:
     
     # Pattern 1: Extract monthly contribution
     # Matches: $500, 500, $1,000, 1000, $10000, etc.
-    monthly_patterns = [
-        r'\$?(\d{1,10}(?:,\d{3})*(?:\.\d{2})?)\s*(?:per month|a month|monthly|/month|month)',
-        r'invest\s+\$?(\d{1,10}(?:,\d{3})*(?:\.\d{2})?)',
-        r'\$?(\d{1,10}(?:,\d{3})*(?:\.\d{2})?)\s*each month',
-    ]
-    
     monthly_contrib = None
-    for pattern in monthly_patterns:
-        match = re.search(pattern, query)
+    for pattern in _MONTHLY_PATTERNS:
+        match = pattern.search(query)
         if match:
             monthly_contrib = float(match.group(1).replace(',', ''))
             break
     
     # Pattern 2: Extract annual rate
     # Matches: 7%, 7.5%, at 7%, 7 percent
-    rate_patterns = [
-        r'(?:at|@|with|earning|return(?:ing)?)\s+(\d+(?:\.\d+)?)\s*%',
-        r'(\d+(?:\.\d+)?)\s*%\s*(?:annual|yearly|per year)?',
-        r'(\d+(?:\.\d+)?)\s*percent',
-    ]
-    
     annual_rate = None
-    for pattern in rate_patterns:
-        match = re.search(pattern, query)
+    for pattern in _RATE_PATTERNS:
+        match = pattern.search(query)
         if match:
             annual_rate = float(match.group(1))
             break
     
     # Pattern 3: Extract years
     # Matches: 20 years, for 20 years, over 30 years
-    year_patterns = [
-        r'(?:for|over|in)\s+(\d+)\s*years?',
-        r'(\d+)\s*years?',
-    ]
-    
     years = None
-    for pattern in year_patterns:
-        match = re.search(pattern, query)
+    for pattern in _YEAR_PATTERNS:
+        match = pattern.search(query)
         if match:
             years = int(match.group(1))
             break
@@ -168,30 +179,18 @@ def parse_lump_sum_query(query: str) -> Optional[Dict[str, float]]:
     
     # Pattern 1: Extract principal (lump sum amount)
     # Matches: invest $1000, I invest $5,000, $10000
-    principal_patterns = [
-        r'invest\s+\$?(\d{1,10}(?:,\d{3})*(?:\.\d{2})?)',
-        r'\$(\d{1,10}(?:,\d{3})*(?:\.\d{2})?)\s+at',
-        r'principal\s+(?:of\s+)?\$?(\d{1,10}(?:,\d{3})*(?:\.\d{2})?)',
-    ]
-    
     principal = None
-    for pattern in principal_patterns:
-        match = re.search(pattern, query_lower)
+    for pattern in _PRINCIPAL_PATTERNS:
+        match = pattern.search(query_lower)
         if match:
             principal = float(match.group(1).replace(',', ''))
             break
     
     # Pattern 2: Extract annual rate
     # Try to get "current rates" from context or default
-    rate_patterns = [
-        r'(?:at|@|with|earning|return(?:ing)?)\s+(\d+(?:\.\d+)?)\s*%',
-        r'(\d+(?:\.\d+)?)\s*%\s*(?:annual|yearly|per year)?',
-        r'(\d+(?:\.\d+)?)\s*percent',
-    ]
-    
     annual_rate = None
-    for pattern in rate_patterns:
-        match = re.search(pattern, query_lower)
+    for pattern in _RATE_PATTERNS:
+        match = pattern.search(query_lower)
         if match:
             annual_rate = float(match.group(1))
             break
@@ -202,14 +201,9 @@ def parse_lump_sum_query(query: str) -> Optional[Dict[str, float]]:
         annual_rate = -1  # Special flag for "needs live data"
     
     # Pattern 3: Extract years
-    year_patterns = [
-        r'(?:for|over|in)\s+(\d+)\s*years?',
-        r'(\d+)\s*years?',
-    ]
-    
     years = None
-    for pattern in year_patterns:
-        match = re.search(pattern, query_lower)
+    for pattern in _YEAR_PATTERNS:
+        match = pattern.search(query_lower)
         if match:
             years = int(match.group(1))
             break
@@ -259,6 +253,14 @@ def run_calculation_query(query: str) -> Dict[str, Any]:
         Investing $1,000.00 at 7.0% annual return for 5 years (compounded 12x/year):
         ...
     """
+    # Memoized per normalized query (case and whitespace don't change the
+    # parse); each caller gets its own copy so the cached dict stays intact
+    return copy.deepcopy(_run_calculation_query(" ".join(query.lower().split())))
+
+
+@functools.lru_cache(maxsize=512)
+def _run_calculation_query(query: str) -> Dict[str, Any]:
+    """Uncached run_calculation_query() for an already-normalized query."""
     # Try parsing as lump sum first
     lump_sum_params = parse_lump_sum_query(query)
     
@@ -385,21 +387,21 @@ if __name__ == "__main__":
     """
     Demo script to test the financial calculator
     """
-    print("=" * 60)
+    print(_SEP)
     print("MoneyMentor - Financial Calculator Demo")
-    print("=" * 60)
+    print(_SEP)
     print()
     
     # Test 1: Direct calculation
     print("Test 1: Direct Calculation")
-    print("-" * 60)
+    print(_DASH)
     fv, explanation = calculate_future_value(500, 7, 20)
     print(explanation)
     print()
     
     # Test 2: Natural language query
     print("Test 2: Natural Language Query")
-    print("-" * 60)
+    print(_DASH)
     query = "If I invest $1000 a month at 8% for 30 years, how much?"
     print(f"Query: {query}")
     print()
@@ -415,7 +417,7 @@ if __name__ == "__main__":
     
     # Test 3: Various query formats
     print("Test 3: Various Query Formats")
-    print("-" * 60)
+    print(_DASH)
     test_queries = [
         "Invest 200 per month at 6% for 15 years",
         "$750/month at 7.5% return for 25 years",
@@ -423,22 +425,22 @@ if __name__ == "__main__":
     ]
     
     for query in test_queries:
-        print(f"Query: {query}")
         result = run_calculation_query(query)
         if result['success']:
-            print(f"  → Result: ${result['result']:,.2f}")
+            outcome = f"  → Result: ${result['result']:,.2f}"
         else:
-            print(f"  → Failed to parse")
-        print()
+            outcome = f"  → Failed to parse"
+        # One write per query instead of one per line
+        sys.stdout.write(f"Query: {query}\n{outcome}\n\n")
     
     # Test 4: Compound interest (lump sum)
     print("Test 4: Lump Sum Investment")
-    print("-" * 60)
+    print(_DASH)
     fv, explanation = calculate_compound_interest(10000, 7, 20)
     print(explanation)
     print()
     
-    print("=" * 60)
+    print(_SEP)
     print("✅ Calculator Demo Complete!")
-    print("=" * 60)
+    print(_SEP)
 
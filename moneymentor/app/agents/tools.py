@@ -10,7 +10,8 @@ Each tool wraps an async function that performs a specific task:
 import os
 import sys
 import logging
-from typing import Optional
+from contextvars import ContextVar
+from typing import List, Optional
 from pathlib import Path
 from langchain.tools import Tool
 from langchain_community.tools.tavily_search import TavilySearchResults
@@ -32,24 +33,37 @@ from rag_pipeline import get_finance_answer
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global variable to track tools invoked (for source attribution)
-_tools_invoked = []
+# Console banners for the demo/test output
+_SEP = "=" * 70
+
+# Tools invoked by the current query (for source attribution). A ContextVar,
+# so queries running concurrently in threads or tasks each track their own.
+_tools_invoked: ContextVar[Optional[List[str]]] = ContextVar("tools_invoked", default=None)
+
+
+def _record_tool_invoked(tool_name: str) -> None:
+    """Add a tool to the current query's tracker"""
+    invoked = _tools_invoked.get()
+    if invoked is None:
+        invoked = []
+        _tools_invoked.set(invoked)
+    invoked.append(tool_name)
 
 
 def get_last_tool_invoked() -> Optional[str]:
     """Get the last tool that was invoked"""
-    return _tools_invoked[-1] if _tools_invoked else None
+    invoked = _tools_invoked.get()
+    return invoked[-1] if invoked else None
 
 
 def get_all_tools_invoked() -> list:
     """Get all tools that were invoked"""
-    return _tools_invoked.copy()
+    return list(_tools_invoked.get() or [])
 
 
 def reset_last_tool_invoked():
     """Reset the tool tracker"""
-    global _tools_invoked
-    _tools_invoked = []
+    _tools_invoked.set([])
 
 
 # ============================================================================
@@ -80,8 +94,7 @@ def run_finance_calculator(query: str) -> str:
     Returns:
         Concise plain-English result with calculations
     """
-    global _tools_invoked
-    _tools_invoked.append("finance_calculator_tool")
+    _record_tool_invoked("finance_calculator_tool")
     print(f"🧰 Tool invoked: finance_calculator_tool for query: {query[:50]}...")
     
     try:
@@ -124,8 +137,7 @@ def run_tavily_search(query: str) -> str:
     Returns:
         Top 1-2 summaries (< 300 chars total)
     """
-    global _tools_invoked
-    _tools_invoked.append("tavily_search_tool")
+    _record_tool_invoked("tavily_search_tool")
     print(f"🧰 Tool invoked: tavily_search_tool for query: {query[:50]}...")
     
     try:
@@ -184,8 +196,7 @@ def run_rag_answer(query: str) -> str:
     Returns:
         Answer text from knowledge base
     """
-    global _tools_invoked
-    _tools_invoked.append("rag_tool")
+    _record_tool_invoked("rag_tool")
     print(f"🧰 Tool invoked: rag_tool for query: {query[:50]}...")
     
     try:
@@ -260,13 +271,13 @@ ALL_TOOLS = [
 
 def list_available_tools() -> None:
     """Print all available tools and their descriptions."""
-    print("=" * 70)
+    print(_SEP)
     print("Available Tools for MoneyMentor Agent")
-    print("=" * 70)
+    print(_SEP)
     for tool in ALL_TOOLS:
         print(f"\n🛠️  {tool.name}")
         print(f"   Description: {tool.description}")
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
 
 
 if __name__ == "__main__":
@@ -279,29 +290,29 @@ if __name__ == "__main__":
     list_available_tools()
     
     # Test finance calculator
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("TEST 1: Finance Calculator")
-    print("=" * 70)
+    print(_SEP)
     calc_result = run_finance_calculator(
         "If I invest $500 a month at 7% for 20 years, how much will I have?"
     )
     print(calc_result)
     
     # Test RAG
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("TEST 2: RAG Knowledge Base")
-    print("=" * 70)
+    print(_SEP)
     rag_result = run_rag_answer("What is a budget?")
     print(rag_result[:300] + "..." if len(rag_result) > 300 else rag_result)
     
     # Test Tavily (will fail if no API key, which is expected)
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("TEST 3: Tavily Search")
-    print("=" * 70)
+    print(_SEP)
     search_result = run_tavily_search("current fed interest rates 2024")
     print(search_result)
     
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("✅ Tool testing complete!")
-    print("=" * 70)
+    print(_SEP)
 
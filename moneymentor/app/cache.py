@@ -0,0 +1,147 @@
+"""
+MoneyMentor - Caching Utilities
+In-process caches shared by the RAG pipeline and retrievers
+"""
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, List, Optional, Sequence
+
+import numpy as np
+
+SQLITE_MAX_PARAMS = 500  # Stay well under SQLite's bound-parameter limit
+
+
+def content_hash(text: str) -> str:
+    """Short, stable fingerprint of a chunk's text (stored in point payloads)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded least-recently-used cache.
+
+    Behaves like functools.lru_cache but is keyed explicitly, so callers decide
+    which results are worth caching (e.g. successful answers only) and can
+    clear it when the underlying data changes. For multi-process deployments,
+    swap this for a shared store such as Redis with a TTL.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before the oldest is evicted
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def items(self) -> List[tuple]:
+        """Snapshot of (key, value) pairs, least recently used first."""
+        with self._lock:
+            return list(self._data.items())
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class EmbeddingCache:
+    """
+    Persistent embedding cache backed by SQLite.
+
+    Vectors are keyed by sha256 of the text plus the embedding model, so
+    re-ingesting unchanged chunks costs a lookup instead of an API call.
+    Use as a context manager to wrap an ingest run in a single transaction.
+
+    Example:
+        >>> with EmbeddingCache("./data/.embedding_cache.db", "text-embedding-3-small") as cache:
+        ...     vectors = cache.get_many(texts)
+    """
+
+    def __init__(self, path: str, model: str):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite file
+            model: Embedding model name, part of every cache key
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.model = model
+        # Lookups may run on the ingest event loop's worker thread
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embedding_cache (hash TEXT PRIMARY KEY, vector BLOB)"
+        )
+
+    def key(self, text: str) -> str:
+        """Cache key for a text under this cache's model."""
+        return f"{self.model}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """
+        Look up vectors for many texts at once.
+
+        Returns:
+            List aligned with texts; float32 arrays for hits, None for misses
+        """
+        keys = [self.key(text) for text in texts]
+        found = {}
+        for start in range(0, len(keys), SQLITE_MAX_PARAMS):
+            batch = keys[start:start + SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT hash, vector FROM embedding_cache WHERE hash IN ({placeholders})",
+                batch
+            )
+            found.update(rows)
+        return [
+            np.frombuffer(found[key], dtype=np.float32) if key in found else None
+            for key in keys
+        ]
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """Store vectors for texts (aligned by position)."""
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO embedding_cache (hash, vector) VALUES (?, ?)",
+            [
+                (self.key(text), np.asarray(vector, dtype=np.float32).tobytes())
+                for text, vector in zip(texts, vectors)
+            ]
+        )
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        self._conn.commit()
+        self._conn.close()
+
+    def __enter__(self) -> "EmbeddingCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,83 @@
+"""
+MoneyMentor - Embeddings
+Shared OpenAI embeddings client used for ingestion and query-time retrieval
+"""
+import os
+import asyncio
+import weakref
+from typing import Optional
+
+import httpx
+from langchain_openai import OpenAIEmbeddings
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+# Constants
+EMBEDDING_MODEL = "text-embedding-3-small"
+# Texts per embeddings request. Kept equal to rag_pipeline.EMBEDDING_BATCH_SIZE so
+# each (length-sorted) ingestion batch goes out as one request
+EMBEDDING_CHUNK_SIZE = 500
+EMBEDDING_MAX_CONCURRENCY = 16  # Pooled connections per client
+EMBEDDING_MAX_KEEPALIVE = 8
+
+# Global embeddings instances: one for synchronous callers, one per event loop
+# (an httpx.AsyncClient's pooled connections belong to the loop that opened them)
+_embeddings_instance: Optional[OpenAIEmbeddings] = None
+_loop_instances: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OpenAIEmbeddings]" = (
+    weakref.WeakKeyDictionary()
+)
+_sync_http_client: Optional[httpx.Client] = None
+
+
+def _build_embeddings() -> OpenAIEmbeddings:
+    global _sync_http_client
+
+    limits = httpx.Limits(
+        max_connections=EMBEDDING_MAX_CONCURRENCY,
+        max_keepalive_connections=EMBEDDING_MAX_KEEPALIVE
+    )
+    if _sync_http_client is None:
+        _sync_http_client = httpx.Client(http2=HAS_HTTP2, limits=limits)
+    return OpenAIEmbeddings(
+        model=EMBEDDING_MODEL,
+        chunk_size=EMBEDDING_CHUNK_SIZE,
+        openai_api_key=os.getenv("OPENAI_API_KEY"),
+        http_client=_sync_http_client,
+        http_async_client=httpx.AsyncClient(http2=HAS_HTTP2, limits=limits)
+    )
+
+
+def get_embeddings() -> OpenAIEmbeddings:
+    """
+    Get the shared OpenAI embeddings client.
+
+    Uses singleton pattern so ingestion and repeated queries reuse one
+    HTTP connection pool (HTTP/2 when the h2 package is installed), sized
+    for EMBEDDING_MAX_CONCURRENCY concurrent requests.
+
+    Called from inside a running event loop, returns an instance whose async
+    HTTP client belongs to that loop. Ingestion runs on a short-lived loop
+    (asyncio.run), and sharing one async pool with the server's loop would
+    leave it holding connections bound to a closed loop. Instances are
+    dropped together with their loop; the sync pool is shared by all.
+    """
+    global _embeddings_instance
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if loop is not None:
+        instance = _loop_instances.get(loop)
+        if instance is None:
+            instance = _loop_instances[loop] = _build_embeddings()
+        return instance
+
+    if _embeddings_instance is None:
+        _embeddings_instance = _build_embeddings()
+    return _embeddings_instance
@@ -270,7 +270,7 @@ def evaluate_with_ragas(test_set_path: str, mode: str = "base") -> Dict[str, Any
         
         try:
             # Call RAG pipeline with specified mode
-            rag_response = get_finance_answer(query, k=5, mode=mode)
+            rag_response = get_finance_answer(query, k=5, mode=mode, use_cache=False)
             
             actual_answer = rag_response.get('answer', '')
             sources = rag_response.get('sources', [])
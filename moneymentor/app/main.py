@@ -4,8 +4,10 @@ MoneyMentor - Main FastAPI Application
 API Endpoints:
 - GET  /api/health              - Health check
 - POST /api/chat                - Ask financial questions (RAG + Calculator routing)
+- POST /api/chat/stream         - Stream a RAG answer as plain text
 - POST /api/reload_knowledge    - Reload documents and rebuild index (dev only)
 """
+import re
 import logging
 from pathlib import Path
 from typing import Optional
@@ -13,10 +15,11 @@ from typing import Optional
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 # Import local modules
-from rag_pipeline import get_finance_answer, load_knowledge
+from rag_pipeline import aget_finance_answer, astream_finance_answer, load_knowledge
 from data_loader import DataLoader
 from agents import run_calculation_query, run_agent_query
 
@@ -24,6 +27,16 @@ from agents import run_calculation_query, run_agent_query
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Intent detection: dynamic/calculation/current info phrases that route to the
+# agent (plain substring matches, compiled into one case-insensitive pattern)
+AGENT_KEYWORDS = [
+    "today", "current", "rate", "trend", "market",
+    "calculate", "invest $", "invest ", "grow my",
+    "how much will i have", "future value",
+    "per month at", "monthly at", "per year at"
+]
+_AGENT_KEYWORDS_RE = re.compile("|".join(map(re.escape, AGENT_KEYWORDS)), re.IGNORECASE)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="MoneyMentor API",
@@ -131,17 +144,8 @@ async def chat(request: ChatRequest):
     try:
         logger.info(f"Received chat request: '{request.question}'")
         
-        # Intent detection: Check for dynamic/calculation/current info keywords
-        question_lower = request.question.lower()
-        agent_keywords = [
-            "today", "current", "rate", "trend", "market",
-            "calculate", "invest $", "invest ", "grow my",
-            "how much will i have", "future value", 
-            "per month at", "monthly at", "per year at"
-        ]
-        
-        # Check if query contains agent-triggering keywords
-        should_use_agent = any(keyword in question_lower for keyword in agent_keywords)
+        # Check if query contains agent-triggering keywords (one scan)
+        should_use_agent = _AGENT_KEYWORDS_RE.search(request.question) is not None
         
         # Route to appropriate tool
         if should_use_agent:
@@ -217,7 +221,7 @@ async def chat(request: ChatRequest):
         print("📚 Routed to RAG")
         logger.info("📚 Routing to RAG pipeline")
         
-        result = get_finance_answer(
+        result = await aget_finance_answer(
             query=request.question,
             k=request.k
         )
@@ -241,6 +245,28 @@ async def chat(request: ChatRequest):
         )
 
 
+@app.post("/api/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Ask a financial question and stream the RAG answer as it is generated.
+    
+    Always uses the RAG pipeline (no agent routing). Tokens are sent as
+    plain text chunks, so the first words arrive before the full answer
+    has been generated.
+    
+    Args:
+        request: ChatRequest with user's question
+        
+    Returns:
+        StreamingResponse of answer text
+    """
+    logger.info(f"Received streaming chat request: '{request.question}'")
+    return StreamingResponse(
+        astream_finance_answer(query=request.question, k=request.k),
+        media_type="text/plain"
+    )
+
+
 @app.post("/api/reload_knowledge", response_model=ReloadResponse)
 async def reload_knowledge():
     """
@@ -353,6 +379,7 @@ else:
             "endpoints": {
                 "health": "GET /api/health",
                 "chat": "POST /api/chat",
+                "chat_stream": "POST /api/chat/stream",
                 "reload": "POST /api/reload_knowledge"
             }
         }
@@ -10,11 +10,23 @@ This module orchestrates the RAG (Retrieval-Augmented Generation) pipeline:
 5. Generate answers using LLM with retrieved context
 """
 import os
-import logging
+import re
+import math
+import json
 import time
-from typing import List, Dict, Any, Optional
+import uuid
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Any, Optional, Iterator, AsyncIterator
 from pathlib import Path
 
+import numpy as np
+import openai
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+
 # LangChain imports
 from langchain.text_splitter import CharacterTextSplitter
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
@@ -28,7 +40,7 @@ from langchain_community.vectorstores import Qdrant
 # from langchain.retrievers.document_compressors import LLMChainExtractor
 
 # Qdrant imports
-from qdrant_client.models import PointStruct
+from qdrant_client.models import PointStruct, Filter, FieldCondition, MatchValue, Range
 
 # Configure logging (before LangSmith import so logger is available)
 logging.basicConfig(level=logging.INFO)
@@ -46,12 +58,26 @@ except ImportError:
     logger.warning("LangSmith not available - tracking will be disabled")
 
 # Import local modules
+from cache import LRUCache, EmbeddingCache, content_hash
+from embeddings import get_embeddings, EMBEDDING_MODEL
 from data_loader import DataLoader
 from vectorstore import (
     get_qdrant_client,
     ensure_collection,
     upsert_points,
-    search_points
+    delete_points,
+    upsert_batch,
+    bulk_upload_vectors,
+    set_indexing_threshold,
+    wait_for_collection_green,
+    search_points,
+    ensure_payload_index,
+    fetch_vectors_by_hash,
+    has_sparse_vector,
+    upsert_sparse_vectors,
+    INT8_QUANTIZATION,
+    BM25_SPARSE_CONFIG,
+    QUANTIZED_SEARCH_PARAMS
 )
 
 # Constants
@@ -59,8 +85,325 @@ COLLECTION_NAME = "moneymentor_knowledge"
 VECTOR_SIZE = 1536  # OpenAI text-embedding-3-small dimension
 CHUNK_SIZE = 800
 CHUNK_OVERLAP = 100
-EMBEDDING_MODEL = "text-embedding-3-small"
 CHAT_MODEL = "gpt-4o-mini"  # Fast and cost-effective model
+EMBEDDING_CONCURRENCY = 8  # Max embedding requests in flight during ingestion
+OPENAI_MAX_REQUESTS_PER_MINUTE = int(os.getenv("OPENAI_MAX_REQUESTS_PER_MINUTE", "3500"))
+EMBEDDING_BATCH_SIZE = 500  # Texts per embeddings request (API allows up to 2048)
+EMBEDDING_MAX_BATCH_TOKENS = 250_000  # Stay under the 300K tokens-per-request limit
+EMBEDDING_SORT_WINDOW = EMBEDDING_BATCH_SIZE * EMBEDDING_CONCURRENCY  # Chunks length-sorted together
+PARALLEL_SPLIT_MIN_BYTES = 1 << 20  # Files above 1MB are chunked in a process pool
+EMBEDDING_CACHE_PATH = "./data/.embedding_cache.db"  # Vectors of previously embedded chunks
+SMALL_UPLOAD_THRESHOLD = 100  # Below this, a single plain upsert is cheaper than a process pool
+INDEXING_THRESHOLD = 20000  # Qdrant default, restored after bulk loads
+INDEXING_TIMEOUT_SECONDS = 300  # Max wait for the collection to turn GREEN after a load
+
+# Semantic response cache (answers keyed by query embedding)
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "true").lower() == "true"
+SEMANTIC_CACHE_COLLECTION = "mm_cache"
+SEMANTIC_CACHE_THRESHOLD = 0.97  # Cosine similarity required for a hit
+SEMANTIC_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Exact-match response cache (answers keyed by normalized query text)
+EXACT_CACHE_MAXSIZE = 1024
+_exact_cache = LRUCache(maxsize=EXACT_CACHE_MAXSIZE)
+
+_FILLER_PATTERN = re.compile(
+    r"\b(?:can you|could you|would you|please|tell me|explain to me|"
+    r"i want to know|i would like to know|i'd like to know)\b"
+)
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s$%]")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_semantic_cache_ready = False
+
+# Shared chat client (thread-safe; holds its own HTTP connection pool)
+_chat_llm_instance: Optional[ChatOpenAI] = None
+
+
+def _run_coroutine(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+    
+    load_knowledge() is called both from scripts and from FastAPI endpoints,
+    where an event loop is already running and asyncio.run() would fail; in
+    that case the coroutine runs on a fresh loop in a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def get_chat_llm() -> ChatOpenAI:
+    """
+    Get the shared chat model client.
+    
+    Uses singleton pattern so repeated queries reuse one HTTP connection pool.
+    """
+    global _chat_llm_instance
+    
+    if _chat_llm_instance is None:
+        _chat_llm_instance = ChatOpenAI(
+            model=CHAT_MODEL,
+            temperature=0.7,
+            openai_api_key=os.getenv("OPENAI_API_KEY")
+        )
+    return _chat_llm_instance
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a query so trivially different phrasings share a cache entry.
+    
+    Lowercases, strips punctuation, drops conversational filler ("can you",
+    "please", ...) and collapses whitespace, leaving the intent of the
+    question intact. Currency and percent signs are kept.
+    """
+    normalized = _PUNCTUATION_PATTERN.sub(" ", query.lower())
+    normalized = _FILLER_PATTERN.sub(" ", normalized)
+    return _WHITESPACE_PATTERN.sub(" ", normalized).strip()
+
+
+def _semantic_cache_filter(mode: str, k: int, collection_name: str) -> Filter:
+    """Restrict cache hits to the same retrieval settings and unexpired entries."""
+    return Filter(must=[
+        FieldCondition(key="mode", match=MatchValue(value=mode)),
+        FieldCondition(key="k", match=MatchValue(value=k)),
+        FieldCondition(key="collection_name", match=MatchValue(value=collection_name)),
+        FieldCondition(
+            key="created_at",
+            range=Range(gte=time.time() - SEMANTIC_CACHE_TTL_SECONDS)
+        )
+    ])
+
+
+def _ensure_semantic_cache() -> bool:
+    """Create the cache collection on first use."""
+    global _semantic_cache_ready
+    
+    if not _semantic_cache_ready:
+        _semantic_cache_ready = ensure_collection(SEMANTIC_CACHE_COLLECTION, VECTOR_SIZE)
+    return _semantic_cache_ready
+
+
+def _semantic_cache_lookup(
+    query_vec: List[float],
+    mode: str,
+    k: int,
+    collection_name: str,
+    threshold: float = SEMANTIC_CACHE_THRESHOLD
+) -> Optional[Dict[str, Any]]:
+    """
+    Look up a previously generated answer for a semantically equivalent query.
+    
+    Returns:
+        The cached result dict on a hit, None on a miss
+    """
+    if not _ensure_semantic_cache():
+        return None
+    
+    hits = search_points(
+        SEMANTIC_CACHE_COLLECTION,
+        query_vector=query_vec,
+        top_k=1,
+        score_threshold=threshold,
+        query_filter=_semantic_cache_filter(mode, k, collection_name)
+    )
+    if not hits:
+        return None
+    
+    logger.info(f"⚡ Semantic cache hit (score: {hits[0]['score']:.3f})")
+    return hits[0]["payload"]["result"]
+
+
+def _semantic_cache_store(
+    query_vec: List[float],
+    result: Dict[str, Any],
+    mode: str,
+    k: int,
+    collection_name: str
+) -> None:
+    """Store a generated answer under its query embedding."""
+    if not _ensure_semantic_cache():
+        return
+    
+    upsert_points(SEMANTIC_CACHE_COLLECTION, [
+        PointStruct(
+            id=str(uuid.uuid4()),
+            vector=query_vec,
+            payload={
+                "mode": mode,
+                "k": k,
+                "collection_name": collection_name,
+                "created_at": time.time(),
+                "result": result
+            }
+        )
+    ])
+
+
+class _AsyncRateLimiter:
+    """
+    Token-bucket limiter for requests issued from one event loop.
+    
+    Allows bursts of up to max_rate requests, then paces callers so the
+    long-run rate stays under max_rate per period.
+    """
+    
+    def __init__(self, max_rate: int, period: float = 60.0):
+        """
+        Initialize the limiter.
+        
+        Args:
+            max_rate: Requests allowed per period
+            period: Length of the period in seconds
+        """
+        self.max_rate = max_rate
+        self.period = period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+    
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self.max_rate,
+                self._tokens + (now - self._updated) * self.max_rate / self.period
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) * self.period / self.max_rate)
+    
+    async def __aenter__(self) -> "_AsyncRateLimiter":
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+@retry(
+    stop=stop_after_attempt(6),
+    wait=wait_exponential_jitter(initial=1, max=32),
+    retry=retry_if_exception_type((openai.RateLimitError, openai.APITimeoutError)),
+    reraise=True
+)
+async def _aembed_with_retry(
+    embeddings: OpenAIEmbeddings,
+    texts: List[str],
+    limiter: _AsyncRateLimiter
+) -> List[List[float]]:
+    """
+    Embed texts under the request-rate limit, backing off on 429s and timeouts.
+    
+    The OpenAI client's own retries (which honor Retry-After) run first;
+    this outer backoff covers sustained rate limiting during large ingests.
+    """
+    # One token per HTTP request the embeddings client will make
+    for _ in range(math.ceil(len(texts) / embeddings.chunk_size)):
+        await limiter.acquire()
+    return await embeddings.aembed_documents(texts)
+
+
+@lru_cache(maxsize=1)
+def _embedding_encoding():
+    """Tokenizer for EMBEDDING_MODEL, or None if tiktoken is unavailable."""
+    try:
+        import tiktoken
+        return tiktoken.encoding_for_model(EMBEDDING_MODEL)
+    except Exception as e:
+        logger.warning(f"tiktoken unavailable, estimating tokens from length: {e}")
+        return None
+
+
+def _estimate_tokens(text: str) -> int:
+    """Token count for text under the embedding model's tokenizer."""
+    encoding = _embedding_encoding()
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def _split_by_tokens(batch: List[tuple], max_tokens: int = EMBEDDING_MAX_BATCH_TOKENS) -> Iterator[List[tuple]]:
+    """
+    Split (point_id, chunk) pairs into requests that stay under max_tokens.
+    
+    With the default chunk size a full batch is far below the cap, so this
+    normally yields the batch unchanged.
+    """
+    current = []
+    current_tokens = 0
+    for item in batch:
+        tokens = _estimate_tokens(item[1]["text"])
+        if current and current_tokens + tokens > max_tokens:
+            yield current
+            current = []
+            current_tokens = 0
+        current.append(item)
+        current_tokens += tokens
+    if current:
+        yield current
+
+
+def _read_and_split(file_path: Path, text_splitter: CharacterTextSplitter) -> List[str]:
+    """Read a text file and split it into chunks (empty list for blank files)."""
+    text = file_path.read_text(encoding="utf-8")
+    if not text.strip():
+        return []
+    return text_splitter.split_text(text)
+
+
+def _iter_chunks(
+    txt_files: List[Path],
+    text_splitter: CharacterTextSplitter,
+    stats: Dict[str, int]
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield chunk dicts (text, source, chunk_id) one file at a time.
+    
+    Files larger than PARALLEL_SPLIT_MIN_BYTES are read and split up front in
+    a process pool, so CPU-bound chunking of big files overlaps the embedding
+    requests instead of stalling them. Successfully split files are counted
+    in stats["documents_processed"].
+    """
+    large_files = [p for p in txt_files if p.stat().st_size > PARALLEL_SPLIT_MIN_BYTES]
+    pool = ProcessPoolExecutor() if large_files else None
+    futures = {p: pool.submit(_read_and_split, p, text_splitter) for p in large_files}
+    
+    try:
+        for file_path in txt_files:
+            try:
+                logger.info("\n📄 Processing: %s", file_path.name)
+                
+                future = futures.get(file_path)
+                chunks = future.result() if future else _read_and_split(file_path, text_splitter)
+                
+                if not chunks:
+                    logger.warning("   ⚠️  Empty file, skipping")
+                    continue
+                
+                logger.info("   ✂️  Split into %d chunk(s)", len(chunks))
+                
+            except Exception as e:
+                logger.error("   ❌ Error processing %s: %s", file_path.name, e)
+                continue
+            
+            stats["documents_processed"] += 1
+            
+            for i, chunk_text in enumerate(chunks):
+                yield {
+                    "text": chunk_text,
+                    "source": file_path.name,
+                    "chunk_id": i
+                }
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
 
 
 def load_knowledge(
@@ -120,7 +463,12 @@ def load_knowledge(
         
         # Ensure collection exists
         logger.info(f"📦 Ensuring collection '{collection_name}' exists...")
-        if not ensure_collection(collection_name, VECTOR_SIZE):
+        if not ensure_collection(
+            collection_name,
+            VECTOR_SIZE,
+            quantization_config=INT8_QUANTIZATION,
+            sparse_vectors_config=BM25_SPARSE_CONFIG
+        ):
             return {
                 "success": False,
                 "error": "Failed to create collection",
@@ -128,6 +476,8 @@ def load_knowledge(
                 "chunks_created": 0,
                 "vectors_indexed": 0
             }
+        # Lets re-ingests find already-embedded chunks by content hash
+        ensure_payload_index(collection_name, "content_hash")
         
         # Find all processed text files
         processed_path = Path(processed_dir)
@@ -162,48 +512,113 @@ def load_knowledge(
         )
         logger.info(f"✂️  Text splitter: chunk_size={chunk_size}, overlap={chunk_overlap}")
         
-        # Initialize OpenAI embeddings
-        logger.info(f"🔌 Initializing OpenAI embeddings ({EMBEDDING_MODEL})...")
-        embeddings = OpenAIEmbeddings(
-            model=EMBEDDING_MODEL,
-            openai_api_key=api_key
-        )
+        logger.info(f"🔌 Using OpenAI embeddings ({EMBEDDING_MODEL})")
         
-        # Process each file
-        all_chunks = []
-        documents_processed = 0
+        # Chunks stream from disk straight into the embedding fan-out, so
+        # requests start while later files are still being read and split
+        stats = {"documents_processed": 0}
+        chunk_stream = _iter_chunks(txt_files, text_splitter, stats)
         
-        for file_path in txt_files:
-            try:
-                logger.info(f"\n📄 Processing: {file_path.name}")
-                
-                # Read file
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    text = f.read()
-                
-                if not text.strip():
-                    logger.warning(f"   ⚠️  Empty file, skipping")
-                    continue
+        ids = []
+        vectors = []
+        payloads = []
+        
+        def _collect(point_id: int, chunk: Dict[str, Any], vector) -> None:
+            ids.append(point_id)
+            vectors.append(np.asarray(vector, dtype=np.float32))
+            payloads.append({
+                "text": chunk["text"],
+                "source": chunk["source"],
+                "chunk_id": chunk["chunk_id"],
+                "content_hash": chunk["content_hash"]
+            })
+        
+        logger.info(f"\n🧮 Generating embeddings...")
+        logger.info("   (This may take a moment...)")
+        
+        batch_size = EMBEDDING_BATCH_SIZE
+        
+        with EmbeddingCache(EMBEDDING_CACHE_PATH, EMBEDDING_MODEL) as embedding_cache:
+            
+            async def _embed_stream() -> Dict[str, int]:
+                # Fetched inside the ingest loop so its async HTTP pool belongs to it
+                embeddings = get_embeddings()
+                # Fan out batches concurrently, paced by the account's request limit
+                semaphore = asyncio.Semaphore(EMBEDDING_CONCURRENCY)
+                limiter = _AsyncRateLimiter(OPENAI_MAX_REQUESTS_PER_MINUTE)
+                counts = {"chunks": 0, "cached": 0}
                 
-                # Split into chunks
-                chunks = text_splitter.split_text(text)
-                logger.info(f"   ✂️  Split into {len(chunks)} chunk(s)")
+                async def bounded(batch_num: int, batch: List[tuple]):
+                    async with semaphore:
+                        logger.info("   Processing batch %d", batch_num)
+                        try:
+                            return await _aembed_with_retry(
+                                embeddings, [chunk["text"] for _, chunk in batch], limiter
+                            )
+                        except Exception as e:
+                            logger.error("   ❌ Error generating embeddings for batch %d: %s", batch_num, e)
+                            return None
                 
-                # Create document chunks with metadata
-                for i, chunk_text in enumerate(chunks):
-                    all_chunks.append({
-                        "text": chunk_text,
-                        "source": file_path.name,
-                        "chunk_id": i
-                    })
+                # Point IDs are chunk positions, so they stay stable across runs
+                pending = []
+                # Read a window of several requests' worth of chunks so misses can be
+                # length-sorted before being cut into requests (similar lengths per request)
+                while batch := list(islice(chunk_stream, EMBEDDING_SORT_WINDOW)):
+                    batch = list(enumerate(batch, counts["chunks"]))
+                    counts["chunks"] += len(batch)
+                    
+                    # Reuse vectors for chunks whose text was embedded on a previous run
+                    local_misses = []
+                    cached = embedding_cache.get_many([chunk["text"] for _, chunk in batch])
+                    for (point_id, chunk), vector in zip(batch, cached):
+                        chunk["content_hash"] = content_hash(chunk["text"])
+                        if vector is None:
+                            local_misses.append((point_id, chunk))
+                        else:
+                            _collect(point_id, chunk, vector)
+                    
+                    # Without a local hit, the vector may still be stored in Qdrant
+                    misses = []
+                    reused = []
+                    stored = fetch_vectors_by_hash(
+                        collection_name, [chunk["content_hash"] for _, chunk in local_misses]
+                    )
+                    for point_id, chunk in local_misses:
+                        vector = stored.get(chunk["content_hash"])
+                        if vector is None:
+                            misses.append((point_id, chunk))
+                        else:
+                            _collect(point_id, chunk, vector)
+                            reused.append((chunk["text"], vector))
+                    if reused:
+                        embedding_cache.put_many(*zip(*reused))
+                    counts["cached"] += len(batch) - len(misses)
+                    
+                    misses.sort(key=lambda item: len(item[1]["text"]))
+                    for start in range(0, len(misses), batch_size):
+                        for request_batch in _split_by_tokens(misses[start:start + batch_size]):
+                            pending.append((
+                                request_batch,
+                                asyncio.create_task(bounded(len(pending) + 1, request_batch))
+                            ))
+                            await asyncio.sleep(0)  # Let the request start before reading on
                 
-                documents_processed += 1
+                for batch, task in pending:
+                    batch_result = await task
+                    if batch_result is None:
+                        continue
+                    embedding_cache.put_many([chunk["text"] for _, chunk in batch], batch_result)
+                    for (point_id, chunk), vector in zip(batch, batch_result):
+                        _collect(point_id, chunk, vector)
                 
-            except Exception as e:
-                logger.error(f"   ❌ Error processing {file_path.name}: {e}")
-                continue
+                return counts
+            
+            counts = _run_coroutine(_embed_stream())
         
-        if not all_chunks:
+        documents_processed = stats["documents_processed"]
+        chunks_created = counts["chunks"]
+        
+        if not chunks_created:
             logger.warning("⚠️  No chunks created from any files")
             return {
                 "success": False,
@@ -213,98 +628,91 @@ def load_knowledge(
                 "vectors_indexed": 0
             }
         
-        logger.info(f"\n✅ Created {len(all_chunks)} total chunk(s) from {documents_processed} file(s)")
+        logger.info(f"\n✅ Created {chunks_created} total chunk(s) from {documents_processed} file(s)")
+        logger.info(f"   ♻️  {counts['cached']} embedding(s) reused from cache")
         
-        # Generate embeddings and create points
-        logger.info(f"\n🧮 Generating embeddings for {len(all_chunks)} chunk(s)...")
-        logger.info("   (This may take a moment...)")
+        if not ids:
+            logger.error("❌ No embeddings generated")
+            return {
+                "success": False,
+                "error": "Embedding generation failed",
+                "documents_processed": documents_processed,
+                "chunks_created": chunks_created,
+                "vectors_indexed": 0
+            }
         
-        points = []
-        batch_size = 20  # Process in batches to handle rate limits
+        logger.info(f"✅ Generated {len(ids)} embedding vector(s)")
         
-        for i in range(0, len(all_chunks), batch_size):
-            batch = all_chunks[i:i + batch_size]
-            batch_texts = [chunk["text"] for chunk in batch]
-            
+        logger.info(f"\n💾 Uploading {len(ids)} vector(s) to Qdrant...")
+        # One contiguous float32 matrix instead of lists of Python floats
+        vectors_np = np.stack(vectors)
+        vectors.clear()
+        
+        if len(ids) < SMALL_UPLOAD_THRESHOLD:
+            uploaded = upsert_batch(collection_name, ids, vectors_np, payloads)
+        else:
+            # Defer HNSW construction until every vector is in place; always
+            # restore the threshold so a failed load doesn't leave it unindexed
+            set_indexing_threshold(collection_name, 0)
             try:
-                # Generate embeddings for batch
-                logger.info(f"   Processing batch {i // batch_size + 1}/{(len(all_chunks) + batch_size - 1) // batch_size}")
-                vectors = embeddings.embed_documents(batch_texts)
-                
-                # Create PointStruct objects
-                for j, (chunk, vector) in enumerate(zip(batch, vectors)):
-                    point_id = i + j
-                    points.append(PointStruct(
-                        id=point_id,
-                        vector=vector,
-                        payload={
-                            "text": chunk["text"],
-                            "source": chunk["source"],
-                            "chunk_id": chunk["chunk_id"]
-                        }
-                    ))
-                
-                # Small delay to avoid rate limits
-                if i + batch_size < len(all_chunks):
-                    time.sleep(0.5)
-                    
-            except Exception as e:
-                logger.error(f"   ❌ Error generating embeddings for batch: {e}")
-                # Continue with next batch
-                continue
+                uploaded = bulk_upload_vectors(collection_name, vectors_np, payloads, ids)
+            finally:
+                set_indexing_threshold(collection_name, INDEXING_THRESHOLD)
         
-        if not points:
-            logger.error("❌ No embeddings generated")
+        if not uploaded:
             return {
                 "success": False,
-                "error": "Embedding generation failed",
+                "error": "Failed to upload vectors",
                 "documents_processed": documents_processed,
-                "chunks_created": len(all_chunks),
+                "chunks_created": chunks_created,
                 "vectors_indexed": 0
             }
         
-        logger.info(f"✅ Generated {len(points)} embedding vector(s)")
+        # Collections with a BM25 sparse vector get keyword search server-side
+        from retrievers.fast_bm25 import bm25_sparse_vectors
         
-        # Upsert to Qdrant in batches to avoid timeouts
-        logger.info(f"\n💾 Upserting {len(points)} vector(s) to Qdrant...")
-        upsert_batch_size = 100  # Batch size for upsert operations
-        vectors_indexed = 0
-        
-        for i in range(0, len(points), upsert_batch_size):
-            batch = points[i:i + upsert_batch_size]
-            batch_num = (i // upsert_batch_size) + 1
-            total_batches = (len(points) + upsert_batch_size - 1) // upsert_batch_size
-            
-            logger.info(f"   Upserting batch {batch_num}/{total_batches} ({len(batch)} vectors)...")
-            
-            if not upsert_points(collection_name, batch):
-                logger.error(f"   ❌ Failed to upsert batch {batch_num}")
-                return {
-                    "success": False,
-                    "error": f"Failed to upsert vectors at batch {batch_num}",
-                    "documents_processed": documents_processed,
-                    "chunks_created": len(all_chunks),
-                    "vectors_indexed": vectors_indexed
-                }
-            
-            vectors_indexed += len(batch)
-            logger.info(f"   ✅ Batch {batch_num} complete ({vectors_indexed}/{len(points)} total)")
+        server_side_bm25 = has_sparse_vector(collection_name)
+        if server_side_bm25:
+            logger.info("\n📚 Attaching BM25 sparse vectors...")
+            server_side_bm25 = upsert_sparse_vectors(
+                collection_name,
+                ids,
+                bm25_sparse_vectors(payload["text"] for payload in payloads)
+            )
         
-        if vectors_indexed != len(points):
+        # Wait for the deferred index build so the first query doesn't pay for it
+        if not wait_for_collection_green(collection_name, timeout=INDEXING_TIMEOUT_SECONDS):
             return {
                 "success": False,
-                "error": "Incomplete upsert",
+                "error": "Collection did not finish indexing",
                 "documents_processed": documents_processed,
-                "chunks_created": len(all_chunks),
-                "vectors_indexed": vectors_indexed
+                "chunks_created": chunks_created,
+                "vectors_indexed": 0
             }
         
+        vectors_indexed = len(ids)
+        
+        if not server_side_bm25:
+            # Persist BM25 over the same chunks so the advanced retriever loads it
+            # instead of re-tokenizing the corpus; stale indexes are overwritten
+            from retrievers.hybrid_rerank_retriever import save_bm25_index
+            
+            logger.info("\n📚 Building BM25 index...")
+            save_bm25_index([
+                Document(
+                    page_content=payload["text"],
+                    metadata={key: value for key, value in payload.items() if key != "text"}
+                )
+                for payload in payloads
+            ])
+        clear_retriever_cache(collection_name)
+        
         logger.info("")
         logger.info("=" * 60)
         logger.info("✨ Knowledge Base Loading Complete!")
         logger.info("=" * 60)
         logger.info(f"📊 Documents processed: {documents_processed}")
-        logger.info(f"📊 Chunks created: {len(all_chunks)}")
+        logger.info(f"📊 Chunks created: {chunks_created}")
         logger.info(f"📊 Vectors indexed: {vectors_indexed}")
         logger.info(f"📊 Collection: {collection_name}")
         logger.info("=" * 60)
@@ -312,15 +720,13 @@ def load_knowledge(
         return {
             "success": True,
             "documents_processed": documents_processed,
-            "chunks_created": len(all_chunks),
+            "chunks_created": chunks_created,
             "vectors_indexed": vectors_indexed,
             "collection_name": collection_name
         }
         
     except Exception as e:
-        logger.error(f"❌ Error in load_knowledge: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error in load_knowledge: %s", e)
         return {
             "success": False,
             "error": str(e),
@@ -330,7 +736,7 @@ def load_knowledge(
         }
 
 
-def get_base_retriever(collection_name: str = COLLECTION_NAME, k: int = 5):
+def _build_base_retriever(collection_name: str = COLLECTION_NAME, k: int = 5):
     """
     Create a base similarity search retriever.
     
@@ -345,8 +751,7 @@ def get_base_retriever(collection_name: str = COLLECTION_NAME, k: int = 5):
     
     # Get Qdrant client and embeddings
     client = get_qdrant_client()
-    api_key = os.getenv("OPENAI_API_KEY")
-    embeddings = OpenAIEmbeddings(model=EMBEDDING_MODEL, openai_api_key=api_key)
+    embeddings = get_embeddings()
     
     # Create Qdrant vectorstore
     # Specify content_payload_key="text" to match our stored data format
@@ -358,10 +763,12 @@ def get_base_retriever(collection_name: str = COLLECTION_NAME, k: int = 5):
         content_payload_key="text"
     )
     
-    return vectorstore.as_retriever(search_kwargs={"k": k})
+    return vectorstore.as_retriever(
+        search_kwargs={"k": k, "search_params": QUANTIZED_SEARCH_PARAMS}
+    )
 
 
-def get_advanced_retriever(collection_name: str = COLLECTION_NAME, k: int = 5):
+def _build_advanced_retriever(collection_name: str = COLLECTION_NAME, k: int = 5):
     """
     Create an advanced retriever using Hybrid Search (BM25 + Vector) + Cohere Reranking.
     
@@ -389,7 +796,7 @@ def get_advanced_retriever(collection_name: str = COLLECTION_NAME, k: int = 5):
     from retrievers.hybrid_rerank_retriever import build_hybrid_rerank_retriever
     
     logger.info("🚀 Using Advanced Retriever (Hybrid Search + Reranking)")
-    logger.info("   📊 Pipeline: BM25 + Vector → Ensemble → Cohere Rerank")
+    logger.info("   📊 Pipeline: BM25 + Vector → RRF → Cohere Rerank")
     
     retriever = build_hybrid_rerank_retriever(
         collection_name=collection_name,
@@ -418,14 +825,19 @@ def get_deprecated_multiquery_compression_retriever(collection_name: str = COLLE
     """
     raise NotImplementedError(
         "MultiQuery + Compression retriever is deprecated. "
-        "Use get_advanced_retriever() for Hybrid + Reranking instead."
+        "Use get_retriever(mode=\"advanced\") for Hybrid + Reranking instead."
     )
 
 
+@lru_cache(maxsize=8)
 def get_retriever(mode: str = "base", collection_name: str = COLLECTION_NAME, k: int = 5):
     """
     Get retriever based on mode selection.
     
+    Retrievers are memoized per (mode, collection_name, k) so the embeddings
+    client, Qdrant wrapper, BM25 index and Cohere client are built once rather
+    than on every query. Call clear_retriever_cache() after re-indexing.
+    
     Args:
         mode: "base" for similarity search, "advanced" for Hybrid + Reranking
         collection_name: Qdrant collection name
@@ -439,8 +851,170 @@ def get_retriever(mode: str = "base", collection_name: str = COLLECTION_NAME, k:
         - advanced: BM25 + Vector + Cohere Rerank (better quality, reasonable cost)
     """
     if mode == "advanced":
-        return get_advanced_retriever(collection_name, k)
-    return get_base_retriever(collection_name, k)
+        return _build_advanced_retriever(collection_name, k)
+    return _build_base_retriever(collection_name, k)
+
+
+def clear_retriever_cache(collection_name: Optional[str] = None) -> None:
+    """
+    Drop memoized retrievers and cached answers after the collection changes.
+    
+    Args:
+        collection_name: Collection that was re-indexed; its semantic-cache
+            answers are deleted. None clears the whole semantic cache.
+    """
+    get_retriever.cache_clear()
+    _exact_cache.clear()
+    
+    cache_filter = None
+    if collection_name is not None:
+        cache_filter = Filter(must=[
+            FieldCondition(key="collection_name", match=MatchValue(value=collection_name))
+        ])
+    if not delete_points(SEMANTIC_CACHE_COLLECTION, cache_filter):
+        logger.warning(f"⚠️  Could not clear semantic cache '{SEMANTIC_CACHE_COLLECTION}'")
+
+
+FINANCE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are MoneyMentor, a knowledgeable and friendly financial advisor assistant. 
+Your role is to provide clear, accurate, and helpful financial advice based on the provided context.
+
+Guidelines:
+- Use the context below to answer questions accurately
+- Provide practical, actionable advice when appropriate
+- If the context doesn't contain enough information, say so honestly
+- Use a warm, professional, and encouraging tone
+- Break down complex concepts into easy-to-understand explanations
+- When relevant, provide examples or analogies
+
+Context from knowledge base:
+{context}
+
+Remember: You are MoneyMentor, here to help people make informed financial decisions."""),
+    ("user", "{question}")
+])
+
+NO_RESULTS_ANSWER = "I apologize, but I couldn't find relevant information in my knowledge base to answer your question. Please ensure the knowledge base has been loaded, or try rephrasing your question."
+
+
+def _error_result(query: str, mode: str, message: str) -> Dict[str, Any]:
+    """Response returned when the pipeline cannot produce an answer."""
+    return {
+        "answer": message,
+        "sources": [],
+        "query": query,
+        "model": "error",
+        "mode": mode
+    }
+
+
+def _serve_cached(cached: Dict[str, Any], query: str, return_context: bool) -> Dict[str, Any]:
+    """Adapt a cached result to the current query."""
+    cached = dict(cached, query=query)
+    if not return_context:
+        cached.pop("contexts", None)
+    return cached
+
+
+def _no_results_result(query: str, mode: str) -> Dict[str, Any]:
+    """Log and build the response for a query with no retrieved documents."""
+    logger.warning("⚠️  No relevant context found in knowledge base")
+    
+    if HAS_LANGSMITH:
+        try:
+            langsmith_client.create_run(
+                name=f"MoneyMentor_RAG_{mode}",
+                run_type="chain",
+                inputs={"query": query, "mode": mode},
+                outputs={"answer": NO_RESULTS_ANSWER, "num_docs": 0},
+                tags=["moneymentor", "rag", f"{mode}_retriever", "no_results"]
+            )
+        except Exception as e:
+            logger.warning(f"LangSmith logging failed: {e}")
+    
+    return {
+        "answer": NO_RESULTS_ANSWER,
+        "sources": [],
+        "query": query,
+        "model": CHAT_MODEL,
+        "mode": mode
+    }
+
+
+def _build_context(docs: List[Document]) -> tuple:
+    """
+    Format retrieved documents for the prompt.
+    
+    Returns:
+        Tuple of (context string, list of source dicts)
+    """
+    context_chunks = []
+    sources = []
+    
+    for i, doc in enumerate(docs):
+        chunk_text = doc.page_content
+        metadata = doc.metadata
+        source_file = metadata.get("source", "unknown")
+        chunk_id = metadata.get("chunk_id", 0)
+        
+        context_chunks.append(f"[Source {i+1}: {source_file}]\n{chunk_text}")
+        sources.append({
+            "source": source_file,
+            "chunk_id": chunk_id,
+            "score": metadata.get("score", 0.0),
+            "text": chunk_text[:200] + "..." if len(chunk_text) > 200 else chunk_text
+        })
+    
+    return "\n\n---\n\n".join(context_chunks), sources
+
+
+def _build_result(
+    answer_text: str,
+    sources: List[Dict[str, Any]],
+    docs: List[Document],
+    query: str,
+    mode: str,
+    k: int
+) -> Dict[str, Any]:
+    """Assemble the response dictionary for a generated answer."""
+    return {
+        "answer": answer_text,
+        "sources": sources,
+        "query": query,
+        "model": CHAT_MODEL,
+        "mode": mode,
+        "metadata": {
+            "retriever_mode": mode,
+            "num_docs": len(docs),
+            "num_sources": len(sources),
+            "k": k
+        }
+    }
+
+
+def _remember_answer(
+    exact_key: tuple,
+    cache_vector: Optional[List[float]],
+    result: Dict[str, Any],
+    contexts: List[str],
+    mode: str,
+    k: int,
+    collection_name: str
+) -> None:
+    """Store a generated answer in the exact and semantic caches."""
+    _exact_cache.put(exact_key, json.dumps(dict(result, contexts=contexts)))
+    
+    if cache_vector is not None:
+        try:
+            _semantic_cache_store(
+                cache_vector,
+                dict(result, contexts=contexts),
+                mode,
+                k,
+                collection_name
+            )
+        except Exception as e:
+            logger.warning(f"Semantic cache store failed: {e}")
 
 
 @traceable(
@@ -453,7 +1027,8 @@ def get_finance_answer(
     k: int = 5,
     collection_name: str = COLLECTION_NAME,
     mode: str = "base",
-    return_context: bool = False
+    return_context: bool = False,
+    use_cache: bool = True
 ) -> Dict[str, Any]:
     """
     Get an answer to a financial question using RAG pipeline.
@@ -467,12 +1042,17 @@ def get_finance_answer(
     4. Generate answer using GPT-4o-mini with context
     5. Log to LangSmith for tracking and comparison
     
+    For async callers, aget_finance_answer() overlaps the cache lookup with
+    retrieval, and astream_finance_answer() streams the answer tokens.
+    
     Args:
         query: User's financial question
         k: Number of relevant chunks to retrieve (after reranking if advanced)
         collection_name: Qdrant collection to search
         mode: "base" for similarity search, "advanced" for Hybrid + Reranking
         return_context: If True, return contexts for evaluation
+        use_cache: If False, bypass the exact and semantic answer caches
+            (neither read nor written), e.g. when evaluating retrievers
         
     Returns:
         Dictionary containing answer, sources, and metadata
@@ -482,16 +1062,33 @@ def get_finance_answer(
     
     try:
         # Check for OpenAI API key
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
+        if not os.getenv("OPENAI_API_KEY"):
             logger.error("❌ OPENAI_API_KEY not found in environment")
-            return {
-                "answer": "Error: OpenAI API key not configured. Please set OPENAI_API_KEY environment variable.",
-                "sources": [],
-                "query": query,
-                "model": "error",
-                "mode": mode
-            }
+            return _error_result(
+                query, mode,
+                "Error: OpenAI API key not configured. Please set OPENAI_API_KEY environment variable."
+            )
+        
+        # Literal duplicates (modulo case/punctuation) are served from memory
+        exact_key = (normalize_query(query), mode, k, collection_name)
+        cached_json = _exact_cache.get(exact_key) if use_cache else None
+        if cached_json is not None:
+            logger.info("⚡ Exact cache hit")
+            return _serve_cached(json.loads(cached_json), query, return_context)
+        
+        # Check the semantic cache before paying for retrieval + generation
+        cache_vector = None
+        if use_cache and SEMANTIC_CACHE_ENABLED:
+            try:
+                cache_vector = get_embeddings().embed_query(normalize_query(query))
+                cached = _semantic_cache_lookup(cache_vector, mode, k, collection_name)
+            except Exception as e:
+                logger.warning(f"Semantic cache lookup failed: {e}")
+                cached = None
+            
+            if cached is not None:
+                _exact_cache.put(exact_key, json.dumps(cached))
+                return _serve_cached(cached, query, return_context)
         
         # Get retriever based on mode
         retriever = get_retriever(mode=mode, collection_name=collection_name, k=k)
@@ -501,126 +1098,261 @@ def get_finance_answer(
         docs = retriever.get_relevant_documents(query)
         
         if not docs:
-            logger.warning("⚠️  No relevant context found in knowledge base")
-            answer = "I apologize, but I couldn't find relevant information in my knowledge base to answer your question. Please ensure the knowledge base has been loaded, or try rephrasing your question."
-            
-            if HAS_LANGSMITH:
-                try:
-                    langsmith_client.create_run(
-                        name=f"MoneyMentor_RAG_{mode}",
-                        run_type="chain",
-                        inputs={"query": query, "mode": mode},
-                        outputs={"answer": answer, "num_docs": 0},
-                        tags=["moneymentor", "rag", f"{mode}_retriever", "no_results"]
-                    )
-                except Exception as e:
-                    logger.warning(f"LangSmith logging failed: {e}")
-            
-            return {
-                "answer": answer,
-                "sources": [],
-                "query": query,
-                "model": CHAT_MODEL,
-                "mode": mode
-            }
+            return _no_results_result(query, mode)
         
         logger.info(f"✅ Found {len(docs)} relevant document(s)")
         
-        # Extract context and prepare sources
-        context_chunks = []
-        sources = []
+        context, sources = _build_context(docs)
         
-        for i, doc in enumerate(docs):
-            chunk_text = doc.page_content
-            metadata = doc.metadata
-            source_file = metadata.get("source", "unknown")
-            chunk_id = metadata.get("chunk_id", 0)
-            
-            context_chunks.append(f"[Source {i+1}: {source_file}]\n{chunk_text}")
-            sources.append({
-                "source": source_file,
-                "chunk_id": chunk_id,
-                "score": metadata.get("score", 0.0),
-                "text": chunk_text[:200] + "..." if len(chunk_text) > 200 else chunk_text
-            })
+        # Generate answer
+        logger.info("💬 Generating answer with GPT-4o-mini...")
+        chain = FINANCE_PROMPT | get_chat_llm()
+        response = chain.invoke({
+            "context": context,
+            "question": query
+        })
         
-        # Build context string
-        context = "\n\n---\n\n".join(context_chunks)
+        logger.info("✅ Answer generated successfully")
         
-        # Create prompt with context
-        logger.info("💬 Generating answer with GPT-4o-mini...")
+        result = _build_result(response.content, sources, docs, query, mode, k)
+        contexts = [doc.page_content for doc in docs]
+        if use_cache:
+            _remember_answer(exact_key, cache_vector, result, contexts, mode, k, collection_name)
         
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are MoneyMentor, a knowledgeable and friendly financial advisor assistant. 
-Your role is to provide clear, accurate, and helpful financial advice based on the provided context.
+        # Add contexts for evaluation if requested
+        if return_context:
+            result["contexts"] = contexts
+        
+        logger.info(f"   📊 LangSmith auto-tracking enabled (mode: {mode})")
+        
+        return result
+        
+    except Exception as e:
+        logger.exception("❌ Error in get_finance_answer: %s", e)
+        
+        return _error_result(
+            query, mode,
+            f"I apologize, but I encountered an error while processing your question: {str(e)}"
+        )
 
-Guidelines:
-- Use the context below to answer questions accurately
-- Provide practical, actionable advice when appropriate
-- If the context doesn't contain enough information, say so honestly
-- Use a warm, professional, and encouraging tone
-- Break down complex concepts into easy-to-understand explanations
-- When relevant, provide examples or analogies
 
-Context from knowledge base:
-{context}
+async def _asemantic_cache_check(
+    query: str,
+    mode: str,
+    k: int,
+    collection_name: str
+) -> tuple:
+    """
+    Embed the query and look it up in the semantic cache.
+    
+    Returns:
+        Tuple of (query vector or None, cached result or None)
+    """
+    cache_vector = None
+    try:
+        cache_vector = await get_embeddings().aembed_query(normalize_query(query))
+        cached = await asyncio.to_thread(_semantic_cache_lookup, cache_vector, mode, k, collection_name)
+        return cache_vector, cached
+    except Exception as e:
+        logger.warning(f"Semantic cache lookup failed: {e}")
+        return cache_vector, None
 
-Remember: You are MoneyMentor, here to help people make informed financial decisions."""),
-            ("user", "{question}")
-        ])
+
+async def _aretrieve(query: str, mode: str, collection_name: str, k: int) -> List[Document]:
+    """Build (or reuse) the retriever off the event loop and fetch documents."""
+    retriever = await asyncio.to_thread(get_retriever, mode=mode, collection_name=collection_name, k=k)
+    logger.info(f"🔍 Retrieving documents using {mode} retriever...")
+    return await retriever.aget_relevant_documents(query)
+
+
+async def _aretrieve_or_cached(
+    query: str,
+    mode: str,
+    k: int,
+    collection_name: str,
+    exact_key: tuple
+) -> tuple:
+    """
+    Start retrieval immediately and race it against the semantic cache.
+    
+    Retrieval is cancelled on a cache hit; otherwise its documents are used
+    without having waited for the cache lookup first.
+    
+    Returns:
+        Tuple of (cached result or None, query vector or None, documents)
+    """
+    retrieve_task = asyncio.create_task(_aretrieve(query, mode, collection_name, k))
+    
+    cache_vector = None
+    if SEMANTIC_CACHE_ENABLED:
+        cache_vector, cached = await _asemantic_cache_check(query, mode, k, collection_name)
+        if cached is not None:
+            retrieve_task.cancel()
+            _exact_cache.put(exact_key, json.dumps(cached))
+            return cached, cache_vector, []
+    
+    return None, cache_vector, await retrieve_task
+
+
+@traceable(
+    name="MoneyMentor_RAG",
+    run_type="chain",
+    tags=["moneymentor", "rag", "async"]
+)
+async def aget_finance_answer(
+    query: str,
+    k: int = 5,
+    collection_name: str = COLLECTION_NAME,
+    mode: str = "base",
+    return_context: bool = False,
+    use_cache: bool = True
+) -> Dict[str, Any]:
+    """
+    Async version of get_finance_answer().
+    
+    Retrieval starts as soon as the exact cache misses and runs concurrently
+    with the semantic cache lookup, so a cache miss no longer pays for the
+    query embedding and the retrieval back to back.
+    
+    Args:
+        query: User's financial question
+        k: Number of relevant chunks to retrieve (after reranking if advanced)
+        collection_name: Qdrant collection to search
+        mode: "base" for similarity search, "advanced" for Hybrid + Reranking
+        return_context: If True, return contexts for evaluation
+        use_cache: If False, bypass the exact and semantic answer caches
+            (neither read nor written), e.g. when evaluating retrievers
         
-        # Initialize LLM
-        llm = ChatOpenAI(
-            model=CHAT_MODEL,
-            temperature=0.7,
-            openai_api_key=api_key
-        )
+    Returns:
+        Dictionary containing answer, sources, and metadata
+    """
+    logger.info(f"🔍 Processing query: '{query}'")
+    logger.info(f"   Mode: {mode.upper()}")
+    
+    try:
+        if not os.getenv("OPENAI_API_KEY"):
+            logger.error("❌ OPENAI_API_KEY not found in environment")
+            return _error_result(
+                query, mode,
+                "Error: OpenAI API key not configured. Please set OPENAI_API_KEY environment variable."
+            )
         
-        # Generate answer
-        chain = prompt | llm
-        response = chain.invoke({
-            "context": context,
-            "question": query
-        })
+        exact_key = (normalize_query(query), mode, k, collection_name)
+        cached_json = _exact_cache.get(exact_key) if use_cache else None
+        if cached_json is not None:
+            logger.info("⚡ Exact cache hit")
+            return _serve_cached(json.loads(cached_json), query, return_context)
+        
+        if use_cache:
+            cached, cache_vector, docs = await _aretrieve_or_cached(query, mode, k, collection_name, exact_key)
+            if cached is not None:
+                return _serve_cached(cached, query, return_context)
+        else:
+            cache_vector, docs = None, await _aretrieve(query, mode, collection_name, k)
+        
+        if not docs:
+            return _no_results_result(query, mode)
         
-        answer_text = response.content
+        logger.info(f"✅ Found {len(docs)} relevant document(s)")
+        
+        context, sources = _build_context(docs)
+        
+        logger.info("💬 Generating answer with GPT-4o-mini...")
+        # Not micro-batched: the chat completions API takes one conversation per
+        # request, so ChatOpenAI.abatch() would still send one call per prompt
+        response = await get_chat_llm().ainvoke(
+            FINANCE_PROMPT.format_messages(context=context, question=query)
+        )
         
         logger.info("✅ Answer generated successfully")
         
-        result = {
-            "answer": answer_text,
-            "sources": sources,
-            "query": query,
-            "model": CHAT_MODEL,
-            "mode": mode,
-            "metadata": {
-                "retriever_mode": mode,
-                "num_docs": len(docs),
-                "num_sources": len(sources),
-                "k": k
-            }
-        }
+        result = _build_result(response.content, sources, docs, query, mode, k)
+        contexts = [doc.page_content for doc in docs]
+        if use_cache:
+            await asyncio.to_thread(
+                _remember_answer, exact_key, cache_vector, result, contexts, mode, k, collection_name
+            )
         
-        # Add contexts for evaluation if requested
         if return_context:
-            result["contexts"] = [doc.page_content for doc in docs]
-        
-        logger.info(f"   📊 LangSmith auto-tracking enabled (mode: {mode})")
+            result["contexts"] = contexts
         
         return result
         
     except Exception as e:
-        logger.error(f"❌ Error in get_finance_answer: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error in aget_finance_answer: %s", e)
         
-        return {
-            "answer": f"I apologize, but I encountered an error while processing your question: {str(e)}",
-            "sources": [],
-            "query": query,
-            "model": "error",
-            "mode": mode
-        }
+        return _error_result(
+            query, mode,
+            f"I apologize, but I encountered an error while processing your question: {str(e)}"
+        )
+
+
+async def astream_finance_answer(
+    query: str,
+    k: int = 5,
+    collection_name: str = COLLECTION_NAME,
+    mode: str = "base"
+) -> AsyncIterator[str]:
+    """
+    Stream the answer to a financial question token by token.
+    
+    Follows the same cache → retrieve → generate flow as aget_finance_answer(),
+    but yields answer text as the model produces it, so the first token
+    reaches the client without waiting for the full completion. Cached
+    answers are yielded in one piece. The complete answer is cached once the
+    stream finishes.
+    
+    Args:
+        query: User's financial question
+        k: Number of relevant chunks to retrieve (after reranking if advanced)
+        collection_name: Qdrant collection to search
+        mode: "base" for similarity search, "advanced" for Hybrid + Reranking
+        
+    Yields:
+        Pieces of the answer text
+    """
+    logger.info(f"🔍 Streaming query: '{query}'")
+    
+    if not os.getenv("OPENAI_API_KEY"):
+        logger.error("❌ OPENAI_API_KEY not found in environment")
+        yield "Error: OpenAI API key not configured. Please set OPENAI_API_KEY environment variable."
+        return
+    
+    try:
+        exact_key = (normalize_query(query), mode, k, collection_name)
+        cached_json = _exact_cache.get(exact_key)
+        if cached_json is not None:
+            logger.info("⚡ Exact cache hit")
+            yield json.loads(cached_json)["answer"]
+            return
+        
+        cached, cache_vector, docs = await _aretrieve_or_cached(query, mode, k, collection_name, exact_key)
+        if cached is not None:
+            yield cached["answer"]
+            return
+        
+        if not docs:
+            yield _no_results_result(query, mode)["answer"]
+            return
+        
+        context, sources = _build_context(docs)
+        
+        chain = FINANCE_PROMPT | get_chat_llm()
+        answer_parts = []
+        async for chunk in chain.astream({"context": context, "question": query}):
+            if chunk.content:
+                answer_parts.append(chunk.content)
+                yield chunk.content
+        
+        result = _build_result("".join(answer_parts), sources, docs, query, mode, k)
+        contexts = [doc.page_content for doc in docs]
+        await asyncio.to_thread(
+            _remember_answer, exact_key, cache_vector, result, contexts, mode, k, collection_name
+        )
+        
+    except Exception as e:
+        logger.exception("❌ Error in astream_finance_answer: %s", e)
+        yield f"I apologize, but I encountered an error while processing your question: {str(e)}"
 
 
 # Backward compatibility aliases
@@ -661,7 +1393,7 @@ class RAGPipeline:
             Dictionary containing response and metadata
         """
         # Wrapper around functional API
-        return get_finance_answer(user_query, k=k, collection_name=self.collection_name)
+        return await aget_finance_answer(user_query, k=k, collection_name=self.collection_name)
     
     def build_index(self, **kwargs) -> Dict[str, Any]:
         """Build embeddings and index documents"""
@@ -3,7 +3,19 @@ MoneyMentor - Advanced Retrievers
 Contains implementations of hybrid and reranking retrieval strategies
 """
 
-from .hybrid_rerank_retriever import build_hybrid_rerank_retriever
+from .fast_bm25 import FastBM25Retriever
+from .hybrid_rerank_retriever import (
+    build_hybrid_rerank_retriever,
+    get_bm25_retriever,
+    save_bm25_index,
+    load_bm25_index
+)
 
-__all__ = ["build_hybrid_rerank_retriever"]
+__all__ = [
+    "FastBM25Retriever",
+    "build_hybrid_rerank_retriever",
+    "get_bm25_retriever",
+    "save_bm25_index",
+    "load_bm25_index"
+]
 
@@ -0,0 +1,265 @@
+"""
+MoneyMentor - Fast BM25 Retriever
+
+BM25 keyword retriever backed by an inverted index.
+
+rank_bm25 (used by LangChain's BM25Retriever) scores every document in the
+corpus for every query. This retriever keeps postings lists
+(term -> {doc_id: term frequency}) so only documents that contain at least
+one query term are scored, and selects the top-k with a heap instead of a
+full sort.
+"""
+
+import heapq
+import math
+import mmap
+import os
+import re
+import zlib
+from collections import Counter, defaultdict
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from langchain.callbacks.manager import CallbackManagerForRetrieverRun
+from langchain.schema import BaseRetriever, Document
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_BYTES_TOKEN_PATTERN = re.compile(rb"[a-z0-9]+", re.IGNORECASE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokenizer shared by indexing and querying."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def sparse_term_index(term: str) -> int:
+    """Stable uint32 id of a term for sparse vectors (crc32, no vocabulary needed)."""
+    return zlib.crc32(term.encode("utf-8"))
+
+
+def bm25_sparse_vectors(
+    texts: Iterable[str],
+    k1: float = 1.5,
+    b: float = 0.75
+) -> List[Tuple[List[int], List[float]]]:
+    """
+    Encode documents as BM25 term-frequency sparse vectors.
+
+    Each weight is the BM25 tf component, tf * (k1 + 1) / (tf + k1 * norm);
+    the IDF factor is applied by Qdrant (Modifier.IDF) at query time, so
+    adding documents doesn't require re-encoding the others.
+
+    Args:
+        texts: Document texts
+        k1: Term frequency saturation
+        b: Length normalization strength
+
+    Returns:
+        (indices, values) per document
+    """
+    token_lists = [tokenize(text) for text in texts]
+    avgdl = sum(len(tokens) for tokens in token_lists) / len(token_lists) if token_lists else 0.0
+
+    vectors = []
+    for tokens in token_lists:
+        norm = k1 * (1 - b + b * len(tokens) / avgdl) if avgdl else k1
+        weights: Dict[int, float] = {}
+        for term, tf in Counter(tokens).items():
+            index = sparse_term_index(term)
+            weights[index] = weights.get(index, 0.0) + tf * (k1 + 1) / (tf + norm)
+        vectors.append((list(weights), list(weights.values())))
+    return vectors
+
+
+def bm25_sparse_query(text: str) -> Tuple[List[int], List[float]]:
+    """Encode a query as a sparse vector of its unique terms (weight 1 each)."""
+    indices = sorted({sparse_term_index(term) for term in tokenize(text)})
+    return indices, [1.0] * len(indices)
+
+
+class FastBM25Retriever(BaseRetriever):
+    """
+    BM25 (Okapi) retriever over an in-memory inverted index.
+
+    Drop-in replacement for BM25Retriever inside an EnsembleRetriever.
+    Per-query cost is proportional to the postings lengths of the query
+    terms rather than to the corpus size.
+
+    Example:
+        >>> retriever = FastBM25Retriever.from_documents(documents, k=20)
+        >>> docs = retriever.get_relevant_documents("roth ira limits")
+    """
+
+    docs: List[Document]
+    postings: Dict[str, Dict[int, int]]
+    idf: Dict[str, float]
+    doc_norm: List[float]  # k1 * (1 - b + b * doc_len / avgdl), per document
+    avgdl: float
+    k: int = 4
+    k1: float = 1.5
+    b: float = 0.75
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: Iterable[str],
+        metadatas: Optional[Iterable[Dict[str, Any]]] = None,
+        k1: float = 1.5,
+        b: float = 0.75,
+        **kwargs: Any
+    ) -> "FastBM25Retriever":
+        """
+        Build the index from raw texts.
+
+        Args:
+            texts: Texts to index
+            metadatas: Metadata dicts aligned with texts (optional)
+            k1: Term frequency saturation
+            b: Length normalization strength
+            **kwargs: Passed to the retriever (e.g. k)
+
+        Returns:
+            FastBM25Retriever over the texts
+        """
+        texts = list(texts)
+        metadatas = list(metadatas) if metadatas is not None else [{} for _ in texts]
+        return cls.from_tokens(
+            [tokenize(text) for text in texts],
+            [Document(page_content=text, metadata=metadata) for text, metadata in zip(texts, metadatas)],
+            k1=k1,
+            b=b,
+            **kwargs
+        )
+
+    @classmethod
+    def from_tokens(
+        cls,
+        token_lists: Iterable[List[str]],
+        documents: Iterable[Document],
+        k1: float = 1.5,
+        b: float = 0.75,
+        **kwargs: Any
+    ) -> "FastBM25Retriever":
+        """
+        Build the index from pre-tokenized documents.
+
+        Token lists are consumed into postings and not retained.
+
+        Args:
+            token_lists: Tokens of each document (see tokenize())
+            documents: Documents returned for matches, aligned with token_lists
+            k1: Term frequency saturation
+            b: Length normalization strength
+            **kwargs: Passed to the retriever (e.g. k)
+
+        Returns:
+            Retriever over the documents
+        """
+        docs = []
+        doc_len = []
+        postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        for doc_id, (tokens, document) in enumerate(zip(token_lists, documents)):
+            for term, tf in Counter(tokens).items():
+                postings[term][doc_id] = tf
+            doc_len.append(len(tokens))
+            docs.append(document)
+
+        n_docs = len(docs)
+        avgdl = sum(doc_len) / n_docs if n_docs else 0.0
+
+        # Lucene-style IDF, always positive even for very common terms
+        idf = {
+            term: math.log(1 + (n_docs - len(docs_with_term) + 0.5) / (len(docs_with_term) + 0.5))
+            for term, docs_with_term in postings.items()
+        }
+        doc_norm = [
+            k1 * (1 - b + b * length / avgdl) if avgdl else k1
+            for length in doc_len
+        ]
+
+        return cls(
+            docs=docs,
+            postings=dict(postings),
+            idf=idf,
+            doc_norm=doc_norm,
+            avgdl=avgdl,
+            k1=k1,
+            b=b,
+            **kwargs
+        )
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[Document], **kwargs: Any) -> "FastBM25Retriever":
+        """Build the index from Documents (page_content and metadata are kept)."""
+        documents = list(documents)
+        return cls.from_texts(
+            [doc.page_content for doc in documents],
+            [doc.metadata for doc in documents],
+            **kwargs
+        )
+
+    def _top_doc_ids(self, query: str) -> List[int]:
+        scores: Dict[int, float] = defaultdict(float)
+        k1_plus_1 = self.k1 + 1
+
+        for term in dict.fromkeys(tokenize(query)):
+            docs_with_term = self.postings.get(term)
+            if not docs_with_term:
+                continue
+            idf = self.idf[term]
+            for doc_id, tf in docs_with_term.items():
+                scores[doc_id] += idf * tf * k1_plus_1 / (tf + self.doc_norm[doc_id])
+
+        top = heapq.nlargest(self.k, scores.items(), key=itemgetter(1))
+        return [doc_id for doc_id, _ in top]
+
+    def _get_relevant_documents(
+        self,
+        query: str,
+        *,
+        run_manager: Optional[CallbackManagerForRetrieverRun] = None
+    ) -> List[Document]:
+        return [self.docs[doc_id] for doc_id in self._top_doc_ids(query)]
+
+
+def tokenize_file(file_path: str) -> List[str]:
+    """
+    Tokenize a UTF-8 text file without decoding it into one string.
+
+    Matches tokenize() for ASCII text; the file is memory-mapped and scanned
+    at the byte level, so only the tokens themselves are allocated.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return [match.lower().decode("ascii") for match in _BYTES_TOKEN_PATTERN.findall(mm)]
+
+
+def read_text(file_path: str) -> str:
+    """Read a UTF-8 text file."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+class FileBackedBM25Retriever(FastBM25Retriever):
+    """
+    FastBM25Retriever whose documents live on disk.
+
+    Stored documents carry only metadata (including "file_path"); the text
+    of a match is read when it is returned, so whole-file corpora are not
+    held in memory alongside the index. Build it with from_tokens() and
+    Documents whose page_content is empty.
+    """
+
+    def _get_relevant_documents(
+        self,
+        query: str,
+        *,
+        run_manager: Optional[CallbackManagerForRetrieverRun] = None
+    ) -> List[Document]:
+        results = []
+        for doc_id in self._top_doc_ids(query):
+            metadata = self.docs[doc_id].metadata
+            results.append(Document(page_content=read_text(metadata["file_path"]), metadata=dict(metadata)))
+        return results
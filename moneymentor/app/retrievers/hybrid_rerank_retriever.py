@@ -7,26 +7,59 @@ then reranks results using Cohere for optimal precision.
 Architecture:
 1. BM25 Retriever: Captures exact keyword matches (e.g., "401k", "Roth IRA")
 2. Vector Retriever: Captures semantic similarity
-3. Ensemble: Combines both with weighted fusion (40% BM25, 60% Vector)
+3. Fusion: Reciprocal rank fusion of both lists - unweighted and server-side
+   (Qdrant FusionQuery RRF) for collections with a sparse BM25 vector, which
+   fresh ingests create; weighted client-side (40% BM25, 60% Vector) for
+   older collections with a local BM25 index
 4. Cohere Reranker: Cross-encoder reranks top-20 results to get best top-5
 """
 
 import os
+import atexit
+import asyncio
+import hashlib
+import pickle
 import logging
-from typing import List, Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
 from langchain.schema import Document
-from langchain.retrievers import EnsembleRetriever
-from langchain_community.retrievers import BM25Retriever
-from langchain_openai import OpenAIEmbeddings
 from langchain_community.vectorstores import Qdrant
 import cohere
+import httpx
+import numpy as np
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+from .fast_bm25 import FastBM25Retriever, FileBackedBM25Retriever, tokenize_file, bm25_sparse_query
+from .local_reranker import LocalReranker, get_local_reranker
 
 # Import from parent modules
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
-from vectorstore import get_qdrant_client
+from vectorstore import (
+    get_qdrant_client,
+    get_async_qdrant_client,
+    scroll_payloads,
+    has_sparse_vector,
+    hybrid_query,
+    ahybrid_query,
+    QUANTIZED_SEARCH_PARAMS,
+    BM25_SPARSE_VECTOR
+)
+from cache import LRUCache, content_hash
+from embeddings import get_embeddings
 
 logger = logging.getLogger(__name__)
 
@@ -37,17 +70,98 @@ BM25_WEIGHT = 0.4  # 40% weight for keyword matching
 VECTOR_WEIGHT = 0.6  # 60% weight for semantic similarity
 INITIAL_K = 20  # Retrieve more docs for reranking
 FINAL_K = 5  # Return top 5 after reranking
+RRF_C = 60  # Reciprocal rank fusion constant (EnsembleRetriever's default)
+COHERE_MAX_CONNECTIONS = 32
+COHERE_MAX_KEEPALIVE = 16
+BM25_INDEX_PATH = "./data/.bm25_index.pkl"  # Written by load_knowledge()
+RERANK_MODEL = os.getenv("RERANK_MODEL", "rerank-english-v3.0")
+RERANK_MAX_DOC_CHARS = 2000  # ~500 tokens; rerank latency grows with passage length
+RERANK_CACHE_PATH = "./.cache/rerank_cache.pkl"
+RERANK_CACHE_MAXSIZE = 512
+BM25_CACHE_DIR = "./.cache"  # Fallback indexes built without an ingest, one file per signature
+BM25_CACHE_ZSTD_LEVEL = 3
+
+# Fused candidates as parallel lists: (texts, payloads). Documents are only
+# built for the reranked top-k that is returned.
+Candidates = Tuple[List[str], List[Dict[str, Any]]]
+
+# Built BM25 retrievers keyed by the signature of their source data
+_BM25_CACHE: Dict[tuple, FastBM25Retriever] = {}
+
+# Cohere rerank results keyed by query + candidate texts. Content-addressed,
+# so entries stay valid across re-ingests and are persisted between runs.
+_rerank_cache: Optional[LRUCache] = None
+
+def save_bm25_index(documents: List[Document], path: str = BM25_INDEX_PATH) -> bool:
+    """
+    Fit a BM25 index over documents and persist it to disk.
+    
+    Called at the end of ingestion so retriever construction only has to
+    unpickle term frequencies and IDF instead of re-tokenizing the corpus.
+    The file is written atomically, replacing any previous index.
+    
+    Args:
+        documents: Documents to index (typically the ingested chunks)
+        path: Destination file
+        
+    Returns:
+        True if the index was written, False otherwise
+    """
+    try:
+        retriever = FastBM25Retriever.from_documents(documents, k=INITIAL_K)
+        
+        index_path = Path(path)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = index_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(retriever, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, index_path)
+        
+        logger.info(f"✅ Saved BM25 index over {len(documents)} document(s) to {path}")
+        return True
+    except Exception as e:
+        logger.error(f"❌ Error saving BM25 index: {e}")
+        return False
 
 
-def load_documents_for_bm25(processed_dir: str = "./data/processed") -> List[Document]:
+def load_bm25_index(path: str = BM25_INDEX_PATH) -> Optional[FastBM25Retriever]:
     """
-    Load all processed documents for BM25 indexing.
+    Load a BM25 index persisted by save_bm25_index().
+    
+    Args:
+        path: Index file
+        
+    Returns:
+        FastBM25Retriever, or None if the file is missing or unreadable
+    """
+    if not Path(path).exists():
+        return None
+    try:
+        with open(path, "rb") as f:
+            retriever = pickle.load(f)
+        if not isinstance(retriever, FastBM25Retriever):
+            logger.warning(f"⚠️  Ignoring BM25 index in an old format at {path}")
+            return None
+        logger.info(f"   ✓ Loaded persisted BM25 index from {path}")
+        return retriever
+    except Exception as e:
+        logger.warning(f"⚠️  Could not load BM25 index from {path}: {e}")
+        return None
+
+
+def load_documents_for_bm25(processed_dir: str = "./data/processed") -> List[Tuple[List[str], Dict[str, Any]]]:
+    """
+    Tokenize all processed documents for BM25 indexing.
+    
+    Files are memory-mapped and tokenized as they are read; their text is
+    not kept, since BM25 only needs tokens and matches are re-read from
+    "file_path" when returned.
     
     Args:
         processed_dir: Directory containing processed text files
         
     Returns:
-        List of Document objects with text and metadata
+        List of (tokens, metadata) tuples, one per non-empty file
     """
     logger.info(f"📂 Loading documents from {processed_dir} for BM25 indexing...")
     
@@ -61,19 +175,14 @@ def load_documents_for_bm25(processed_dir: str = "./data/processed") -> List[Doc
     
     for file_path in txt_files:
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
+            tokens = tokenize_file(str(file_path))
             
-            if text.strip():
-                doc = Document(
-                    page_content=text,
-                    metadata={
-                        "source": file_path.name,
-                        "file_path": str(file_path)
-                    }
-                )
-                documents.append(doc)
-                logger.info(f"   ✓ Loaded {file_path.name} ({len(text)} chars)")
+            if tokens:
+                documents.append((tokens, {
+                    "source": file_path.name,
+                    "file_path": str(file_path)
+                }))
+                logger.info(f"   ✓ Loaded {file_path.name} ({len(tokens)} tokens)")
         except Exception as e:
             logger.error(f"   ❌ Error loading {file_path.name}: {e}")
     
@@ -81,6 +190,253 @@ def load_documents_for_bm25(processed_dir: str = "./data/processed") -> List[Doc
     return documents
 
 
+def _save_rerank_cache() -> None:
+    """Persist the rerank cache on interpreter exit."""
+    if not _rerank_cache:
+        return
+    try:
+        cache_path = Path(RERANK_CACHE_PATH)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump(_rerank_cache.items(), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        logger.warning(f"⚠️  Could not save rerank cache: {e}")
+
+
+def get_rerank_cache() -> LRUCache:
+    """
+    Get the process-wide rerank cache, loading it from disk on first use.
+    
+    Returns:
+        LRUCache mapping rerank keys to [(index, relevance_score), ...]
+    """
+    global _rerank_cache
+    
+    if _rerank_cache is None:
+        _rerank_cache = LRUCache(maxsize=RERANK_CACHE_MAXSIZE)
+        if Path(RERANK_CACHE_PATH).exists():
+            try:
+                with open(RERANK_CACHE_PATH, "rb") as f:
+                    for key, value in pickle.load(f):
+                        _rerank_cache.put(key, value)
+                logger.info(f"   ✓ Loaded {len(_rerank_cache)} cached rerank result(s)")
+            except Exception as e:
+                logger.warning(f"⚠️  Could not load rerank cache: {e}")
+        atexit.register(_save_rerank_cache)
+    
+    return _rerank_cache
+
+
+def build_bm25_from_collection(collection_name: str = COLLECTION_NAME) -> Optional[FastBM25Retriever]:
+    """
+    Fit BM25 over the chunks stored in a Qdrant collection.
+    
+    Payloads are streamed with the native scroll API (text, source and
+    chunk_id only, no vectors), so BM25 indexes exactly the chunks the
+    vector retriever returns.
+    
+    Args:
+        collection_name: Qdrant collection name
+        
+    Returns:
+        FastBM25Retriever, or None if the collection is empty or unreachable
+    """
+    texts = []
+    metadatas = []
+    try:
+        for payload in scroll_payloads(collection_name, fields=("text", "source", "chunk_id")):
+            text = payload.pop("text", None)
+            if text:
+                texts.append(text)
+                metadatas.append(payload)
+    except Exception as e:
+        logger.warning(f"⚠️  Could not scroll '{collection_name}' for BM25: {e}")
+        return None
+    
+    if not texts:
+        return None
+    
+    logger.info(f"   ✓ Indexed {len(texts)} chunk(s) from '{collection_name}' for BM25")
+    return FastBM25Retriever.from_texts(texts, metadatas=metadatas, k=INITIAL_K)
+
+
+def _bm25_signature(collection_name: str, processed_dir: str) -> tuple:
+    """Identify the data a BM25 index would be built from, changing when it does."""
+    index_path = Path(BM25_INDEX_PATH)
+    if index_path.exists():
+        return ("index", str(index_path.resolve()), index_path.stat().st_mtime)
+    
+    # Hash every file name and mtime so additions, edits and deletions all count
+    digest = hashlib.sha1()
+    for file_path in sorted(Path(processed_dir).glob("*.txt")):
+        digest.update(f"{file_path.name}\0{file_path.stat().st_mtime}\0".encode("utf-8"))
+    return ("corpus", collection_name, str(Path(processed_dir).resolve()), digest.hexdigest())
+
+
+def _bm25_cache_path(signature: tuple) -> Path:
+    """On-disk cache file for a signature (zstd-compressed when zstandard is installed)."""
+    key = hashlib.sha1(repr(signature).encode("utf-8")).hexdigest()[:16]
+    suffix = ".pkl.zst" if HAS_ZSTD else ".pkl"
+    return Path(BM25_CACHE_DIR) / f"bm25-{key}{suffix}"
+
+
+def _load_bm25_cache(signature: tuple) -> Optional[FastBM25Retriever]:
+    """Load a fallback BM25 index pickled for this signature, if any."""
+    cache_path = _bm25_cache_path(signature)
+    if not cache_path.exists():
+        return None
+    try:
+        with open(cache_path, "rb") as f:
+            data = f.read()
+        if HAS_ZSTD:
+            data = zstandard.ZstdDecompressor().decompress(data)
+        retriever = pickle.loads(data)
+        if not isinstance(retriever, FastBM25Retriever):
+            return None
+        logger.info(f"   ✓ Loaded cached BM25 index from {cache_path}")
+        return retriever
+    except Exception as e:
+        logger.warning(f"⚠️  Could not load BM25 cache: {e}")
+        return None
+
+
+def _save_bm25_cache(signature: tuple, retriever: FastBM25Retriever) -> None:
+    """Pickle a fallback BM25 index for this signature, replacing older ones."""
+    try:
+        cache_path = _bm25_cache_path(signature)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        data = pickle.dumps(retriever, protocol=pickle.HIGHEST_PROTOCOL)
+        if HAS_ZSTD:
+            data = zstandard.ZstdCompressor(level=BM25_CACHE_ZSTD_LEVEL).compress(data)
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+        
+        for stale_path in cache_path.parent.glob("bm25-*.pkl*"):
+            if stale_path != cache_path:
+                stale_path.unlink(missing_ok=True)
+    except Exception as e:
+        logger.warning(f"⚠️  Could not save BM25 cache: {e}")
+
+
+def get_bm25_retriever(collection_name: str, processed_dir: str) -> FastBM25Retriever:
+    """
+    Get a BM25 retriever, building it only when its source data has changed.
+    
+    Sources, in order of preference:
+    1. The index persisted by load_knowledge() (BM25_INDEX_PATH)
+    2. Chunks scrolled from the Qdrant collection
+    3. Raw files in processed_dir
+    
+    Built retrievers are kept in memory keyed by a signature of their source
+    (file paths and mtimes), and fallback builds are also pickled under
+    BM25_CACHE_DIR (zstd-compressed when zstandard is installed) with the
+    signature in the filename, so a cold start with unchanged data skips
+    tokenization.
+    
+    Args:
+        collection_name: Qdrant collection name
+        processed_dir: Directory with processed documents
+        
+    Returns:
+        FastBM25Retriever configured for top-INITIAL_K
+    """
+    signature = _bm25_signature(collection_name, processed_dir)
+    if signature in _BM25_CACHE:
+        logger.info("   ✓ Reusing cached BM25 index")
+        return _BM25_CACHE[signature]
+    
+    if signature[0] == "index":
+        bm25_retriever = load_bm25_index()
+    else:
+        bm25_retriever = _load_bm25_cache(signature)
+        
+        if bm25_retriever is None:
+            # No index from a previous ingest; fit one over the stored chunks
+            bm25_retriever = build_bm25_from_collection(collection_name)
+            
+            if bm25_retriever is None:
+                # Collection unavailable; fall back to the raw files
+                documents = load_documents_for_bm25(processed_dir)
+                
+                if not documents:
+                    raise ValueError(f"No documents found in {processed_dir}")
+                
+                bm25_retriever = FileBackedBM25Retriever.from_tokens(
+                    [tokens for tokens, _ in documents],
+                    [Document(page_content="", metadata=metadata) for _, metadata in documents],
+                    k=INITIAL_K
+                )
+            
+            _save_bm25_cache(signature, bm25_retriever)
+    
+    if bm25_retriever is None:
+        raise ValueError(f"BM25 index at {BM25_INDEX_PATH} could not be loaded")
+    
+    bm25_retriever.k = INITIAL_K
+    _BM25_CACHE.clear()  # Only the current signature is ever useful
+    _BM25_CACHE[signature] = bm25_retriever
+    return bm25_retriever
+
+
+def build_cohere_clients(api_key: str) -> tuple:
+    """
+    Create sync and async Cohere clients on persistent HTTP connection pools.
+    
+    Both clients keep connections alive between rerank calls (HTTP/2 when the
+    h2 package is installed), so queries after the first skip the TCP and
+    TLS handshakes. Transient connection errors are retried by the transport.
+    
+    Args:
+        api_key: Cohere API key
+        
+    Returns:
+        Tuple of (cohere.Client, cohere.AsyncClient)
+    """
+    limits = httpx.Limits(
+        max_connections=COHERE_MAX_CONNECTIONS,
+        max_keepalive_connections=COHERE_MAX_KEEPALIVE
+    )
+    httpx_client = httpx.Client(
+        transport=httpx.HTTPTransport(retries=3, http2=HAS_HTTP2, limits=limits)
+    )
+    async_httpx_client = httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(retries=3, http2=HAS_HTTP2, limits=limits)
+    )
+    
+    return (
+        cohere.Client(api_key=api_key, httpx_client=httpx_client),
+        cohere.AsyncClient(api_key=api_key, httpx_client=async_httpx_client)
+    )
+
+
+def warm_up_cohere(cohere_client: cohere.Client) -> threading.Thread:
+    """
+    Send a tiny rerank request in a background thread.
+    
+    Opens the pooled connection (TCP + TLS) and absorbs the model's
+    cold-start latency while the rest of the pipeline initializes, so the
+    first user query hits a warm path. Failures are ignored; the real
+    request will surface them.
+    
+    Args:
+        cohere_client: Client whose connection pool should be warmed
+        
+    Returns:
+        The started daemon thread
+    """
+    def warm() -> None:
+        try:
+            cohere_client.rerank(query="warm", documents=["hello"], top_n=1, model=RERANK_MODEL)
+        except Exception as e:
+            logger.debug(f"Cohere warm-up failed: {e}")
+    
+    thread = threading.Thread(target=warm, name="cohere-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
 def build_hybrid_rerank_retriever(
     collection_name: str = COLLECTION_NAME,
     processed_dir: str = "app/data/processed",
@@ -92,12 +448,19 @@ def build_hybrid_rerank_retriever(
     This creates a multi-stage retrieval pipeline:
     1. BM25 retrieves top-20 by keyword relevance
     2. Vector retrieves top-20 by semantic similarity  
-    3. Ensemble combines both (40% BM25, 60% Vector) → top-20 diverse docs
+    3. Reciprocal rank fusion combines both → top-20 diverse docs
     4. Cohere reranks top-20 → return top-k best matches
     
+    Collections ingested with sparse BM25 vectors are searched with a single
+    Qdrant hybrid query (server-side, unweighted RRF) and need no local BM25
+    index. Only the local path fuses with BM25_WEIGHT/VECTOR_WEIGHT.
+    For older collections the BM25 index is loaded from BM25_INDEX_PATH when
+    load_knowledge() has written one. Otherwise it is fitted over the chunks scrolled from the
+    collection, and only as a last resort over the files in processed_dir.
+    
     Args:
         collection_name: Qdrant collection name
-        processed_dir: Directory with processed documents
+        processed_dir: Directory with processed documents (fallback for BM25)
         k: Final number of documents to return (after reranking)
         
     Returns:
@@ -116,88 +479,385 @@ def build_hybrid_rerank_retriever(
     if not cohere_key:
         raise ValueError("COHERE_API_KEY not found in environment")
     
-    # Step 1: Build BM25 Retriever (keyword-based)
+    # Step 1: BM25 (keyword-based) - server-side when the collection has sparse vectors
     logger.info("\n📚 Step 1: Building BM25 Retriever (keyword search)...")
-    documents = load_documents_for_bm25(processed_dir)
-    
-    if not documents:
-        raise ValueError(f"No documents found in {processed_dir}")
-    
-    bm25_retriever = BM25Retriever.from_documents(documents)
-    bm25_retriever.k = INITIAL_K
-    logger.info(f"   ✓ BM25 configured to retrieve top-{INITIAL_K} by keyword relevance")
+    sparse_vector_name = BM25_SPARSE_VECTOR if has_sparse_vector(collection_name) else None
+    if sparse_vector_name:
+        bm25_retriever = None
+        logger.info(f"   ✓ Using Qdrant sparse vector '{sparse_vector_name}' (no local index needed)")
+    else:
+        bm25_retriever = get_bm25_retriever(collection_name, processed_dir)
+        logger.info(f"   ✓ BM25 configured to retrieve top-{INITIAL_K} by keyword relevance")
     
     # Step 2: Build Vector Retriever (semantic)
     logger.info("\n🔍 Step 2: Building Vector Retriever (semantic search)...")
     client = get_qdrant_client()
-    embeddings = OpenAIEmbeddings(model=EMBEDDING_MODEL, openai_api_key=api_key)
+    embeddings = get_embeddings()
     
     vectorstore = Qdrant(
         client=client,
+        async_client=get_async_qdrant_client(),
         collection_name=collection_name,
         embeddings=embeddings,
         content_payload_key="text"
     )
     
-    vector_retriever = vectorstore.as_retriever(search_kwargs={"k": INITIAL_K})
-    logger.info(f"   ✓ Vector retriever configured to retrieve top-{INITIAL_K} by cosine similarity")
+    logger.info(f"   ✓ Vector search configured to retrieve top-{INITIAL_K} by cosine similarity")
     
-    # Step 3: Create Ensemble (Hybrid) Retriever
-    logger.info("\n🔄 Step 3: Creating Ensemble Retriever (hybrid)...")
-    hybrid_retriever = EnsembleRetriever(
-        retrievers=[bm25_retriever, vector_retriever],
-        weights=[BM25_WEIGHT, VECTOR_WEIGHT]
-    )
-    logger.info(f"   ✓ Ensemble: {int(BM25_WEIGHT*100)}% BM25 + {int(VECTOR_WEIGHT*100)}% Vector")
+    # Step 3: Hybrid fusion happens per query (reciprocal rank fusion)
+    logger.info("\n🔄 Step 3: Configuring hybrid fusion...")
+    if sparse_vector_name:
+        logger.info("   ✓ Fusion: unweighted RRF in Qdrant (sparse + dense)")
+    else:
+        logger.info(f"   ✓ Fusion: weighted RRF, {int(BM25_WEIGHT*100)}% BM25 + {int(VECTOR_WEIGHT*100)}% Vector")
     logger.info(f"   ✓ Will retrieve ~{INITIAL_K} diverse documents")
     
     # Step 4: Initialize Cohere Reranker
     logger.info("\n🎯 Step 4: Initializing Cohere Reranker...")
-    cohere_client = cohere.Client(cohere_key)
-    logger.info(f"   ✓ Cohere client initialized (model: rerank-english-v2.0)")
+    cohere_client, async_cohere_client = build_cohere_clients(cohere_key)
+    warm_up_cohere(cohere_client)
+    logger.info(f"   ✓ Cohere client initialized (model: {RERANK_MODEL}, HTTP/2: {HAS_HTTP2})")
     logger.info(f"   ✓ Will rerank to return top-{k} documents")
     
     # Create custom reranker wrapper
     reranker = HybridReranker(
-        base_retriever=hybrid_retriever,
+        bm25_retriever=bm25_retriever,
+        vectorstore=vectorstore,
         cohere_client=cohere_client,
-        top_k=k
+        async_cohere_client=async_cohere_client,
+        top_k=k,
+        sparse_vector_name=sparse_vector_name,
+        local_fallback=get_local_reranker()
     )
     
     logger.info("\n" + "=" * 70)
     logger.info("✅ Hybrid Rerank Retriever Ready!")
     logger.info("=" * 70)
-    logger.info(f"Pipeline: BM25 + Vector → Ensemble → Cohere Rerank → Top-{k}")
+    logger.info(f"Pipeline: BM25 + Vector → RRF → Cohere Rerank → Top-{k}")
     logger.info("=" * 70 + "\n")
     
     return reranker
 
 
+def fast_rrf(
+    id_lists: List[List[str]],
+    weights: List[float],
+    top_k: Optional[int] = None,
+    c: int = RRF_C
+) -> List[str]:
+    """
+    Weighted reciprocal rank fusion over ranked lists of identifiers.
+    
+    Each identifier scores sum(weight / (rank + c)) over the lists it appears
+    in. Identifiers are mapped to dense ints so the accumulation is a single
+    np.bincount, and the top-k are selected with np.argpartition before
+    sorting only those.
+    
+    Args:
+        id_lists: Ranked identifier lists, one per retriever
+        weights: Weight of each list
+        top_k: Number of identifiers to return (all if None)
+        c: Rank offset that damps the influence of top positions
+        
+    Returns:
+        Unique identifiers, best fused score first
+    """
+    id_to_index: Dict[str, int] = {}
+    indices = []
+    contributions = []
+    
+    for ids, weight in zip(id_lists, weights):
+        ranks = np.arange(1, len(ids) + 1, dtype=np.float64)
+        contributions.append(weight / (ranks + c))
+        indices.extend(id_to_index.setdefault(doc_id, len(id_to_index)) for doc_id in ids)
+    
+    if not id_to_index:
+        return []
+    
+    scores = np.bincount(
+        np.asarray(indices, dtype=np.intp),
+        weights=np.concatenate(contributions),
+        minlength=len(id_to_index)
+    )
+    
+    if top_k is not None and top_k < len(scores):
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        candidates = np.arange(len(scores))
+    # Stable sort keeps first-seen order for ties (when ranking all ids)
+    order = candidates[np.argsort(-scores[candidates], kind="stable")]
+    
+    ids_by_index = list(id_to_index)
+    return [ids_by_index[i] for i in order]
+
+
+def dedupe_candidates(texts: List[str], payloads: List[Dict[str, Any]]) -> Candidates:
+    """
+    Drop candidates whose text was already seen, keeping the first (best-ranked).
+    
+    The same chunk can be stored more than once (e.g. overlapping source
+    files), and Cohere bills and scores every document sent, so duplicates
+    are removed before reranking. Uses the content_hash payload field when
+    present.
+    
+    Args:
+        texts: Candidate texts, best first
+        payloads: Payloads aligned with texts
+        
+    Returns:
+        (texts, payloads) with duplicates removed
+    """
+    seen = set()
+    unique_texts = []
+    unique_payloads = []
+    for text, payload in zip(texts, payloads):
+        key = payload.get("content_hash") or content_hash(text)
+        if key in seen:
+            continue
+        seen.add(key)
+        unique_texts.append(text)
+        unique_payloads.append(payload)
+    return unique_texts, unique_payloads
+
+
+def reciprocal_rank_fusion(
+    doc_lists: List[List[Document]],
+    weights: List[float],
+    c: int = RRF_C
+) -> List[Document]:
+    """
+    Merge ranked document lists with weighted reciprocal rank fusion.
+    
+    Same scoring as LangChain's EnsembleRetriever (see fast_rrf()), with
+    duplicates merged by page_content.
+    
+    Args:
+        doc_lists: Ranked document lists, one per retriever
+        weights: Weight of each list
+        c: Rank offset that damps the influence of top positions
+        
+    Returns:
+        Unique documents, best fused score first
+    """
+    docs_by_content: Dict[str, Document] = {}
+    for docs in doc_lists:
+        for doc in docs:
+            docs_by_content.setdefault(doc.page_content, doc)
+    
+    fused = fast_rrf(
+        [[doc.page_content for doc in docs] for docs in doc_lists],
+        weights,
+        c=c
+    )
+    return [docs_by_content[content] for content in fused]
+
+
 class HybridReranker:
     """
     Custom retriever that combines hybrid search with Cohere reranking.
     
-    This wraps an EnsembleRetriever and adds Cohere reranking on top.
-    Compatible with LangChain's retriever interface.
+    Holds the BM25 retriever and the Qdrant vectorstore separately, fuses
+    their results with weighted reciprocal rank fusion, and adds Cohere
+    reranking on top. The async path runs BM25 and vector search
+    concurrently. When sparse_vector_name is set, candidates instead come
+    from one Qdrant query that fuses sparse BM25 and dense results
+    server-side with unweighted RRF (weights are then unused). Compatible with LangChain's retriever interface.
     """
     
     def __init__(
         self,
-        base_retriever: EnsembleRetriever,
+        bm25_retriever: Optional[FastBM25Retriever],
+        vectorstore: Qdrant,
         cohere_client: cohere.Client,
-        top_k: int = 5
+        top_k: int = 5,
+        async_cohere_client: Optional[cohere.AsyncClient] = None,
+        initial_k: int = INITIAL_K,
+        weights: tuple = (BM25_WEIGHT, VECTOR_WEIGHT),
+        sparse_vector_name: Optional[str] = None,
+        local_fallback: Optional[LocalReranker] = None
     ):
         """
         Initialize the hybrid reranker.
         
         Args:
-            base_retriever: Ensemble retriever (BM25 + Vector)
+            bm25_retriever: Keyword retriever (None when using server-side hybrid)
+            vectorstore: Qdrant vectorstore for semantic search
             cohere_client: Cohere API client
             top_k: Number of final documents to return
+            async_cohere_client: Async Cohere client for aget_relevant_documents (optional)
+            initial_k: Candidates fetched from vector search before fusion
+            weights: (BM25 weight, vector weight) for client-side fusion
+            sparse_vector_name: Qdrant sparse vector for server-side hybrid (optional)
+            local_fallback: Local cross-encoder used when Cohere fails (optional)
         """
-        self.base_retriever = base_retriever
+        self.bm25 = bm25_retriever
+        self.vectorstore = vectorstore
         self.cohere_client = cohere_client
+        self.async_cohere_client = async_cohere_client
         self.top_k = top_k
+        self.initial_k = initial_k
+        self.weights = list(weights)
+        self.sparse_vector_name = sparse_vector_name
+        self.local_fallback = local_fallback
+        # Final results per query; dropped with the retriever on re-index
+        self._cache = LRUCache(maxsize=RERANK_CACHE_MAXSIZE)
+        self._rerank_cache = get_rerank_cache()
+    
+    def _rerank_key(self, query: str, doc_texts: List[str]) -> str:
+        digest = hashlib.sha1(f"{RERANK_MODEL}\0{self.top_k}\0{query}".encode("utf-8"))
+        for text in doc_texts:
+            digest.update(b"\0")
+            digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+    
+    def _rerank(self, query: str, doc_texts: List[str]) -> List[tuple]:
+        """
+        Rerank candidate texts with Cohere, reusing cached responses.
+        
+        Returns:
+            List of (index into doc_texts, relevance_score), best first
+        """
+        key = self._rerank_key(query, doc_texts)
+        ranking = self._rerank_cache.get(key)
+        if ranking is None:
+            rerank_response = self.cohere_client.rerank(
+                query=query,
+                documents=doc_texts,
+                top_n=self.top_k,
+                model=RERANK_MODEL
+            )
+            ranking = [(result.index, result.relevance_score) for result in rerank_response.results]
+            self._rerank_cache.put(key, ranking)
+        else:
+            logger.debug("   ⚡ Rerank cache hit")
+        
+        return ranking
+    
+    async def _arerank(self, query: str, doc_texts: List[str]) -> List[tuple]:
+        """Async version of _rerank() using the async Cohere client when available."""
+        if self.async_cohere_client is None:
+            return await asyncio.to_thread(self._rerank, query, doc_texts)
+        
+        key = self._rerank_key(query, doc_texts)
+        ranking = self._rerank_cache.get(key)
+        if ranking is None:
+            rerank_response = await self.async_cohere_client.rerank(
+                query=query,
+                documents=doc_texts,
+                top_n=self.top_k,
+                model=RERANK_MODEL
+            )
+            ranking = [(result.index, result.relevance_score) for result in rerank_response.results]
+            self._rerank_cache.put(key, ranking)
+        else:
+            logger.debug("   ⚡ Rerank cache hit")
+        
+        return ranking
+    
+    def _apply_ranking(
+        self,
+        texts: List[str],
+        payloads: List[Dict[str, Any]],
+        ranking: List[tuple]
+    ) -> List[Document]:
+        """Build Documents for the reranked top-k, with scores in metadata."""
+        reranked_docs = [
+            Document(
+                page_content=texts[index],
+                metadata={**payloads[index], "rerank_score": relevance_score, "rerank_position": position}
+            )
+            for position, (index, relevance_score) in enumerate(ranking, 1)
+        ]
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"   ✓ Reranked to top-{len(reranked_docs)} documents")
+            logger.debug(f"   📊 Best score: {reranked_docs[0].metadata['rerank_score']:.3f}")
+        return reranked_docs
+    
+    def _fallback(self, query: str, texts: List[str], payloads: List[Dict[str, Any]]) -> List[Document]:
+        """
+        Results when Cohere reranking fails.
+        
+        Ranks with the local cross-encoder when one is configured, otherwise
+        returns the first top_k fused candidates.
+        """
+        if self.local_fallback is not None:
+            try:
+                ranking = self.local_fallback.rank(
+                    query, [text[:RERANK_MAX_DOC_CHARS] for text in texts], self.top_k
+                )
+                logger.debug("   ✓ Reranked locally")
+                return self._apply_ranking(texts, payloads, ranking)
+            except Exception as e:
+                logger.error(f"   ❌ Local reranking failed: {e}")
+        
+        logger.warning(f"   ⚠️  Falling back to base retriever results")
+        return [
+            Document(page_content=text, metadata=dict(payload))
+            for text, payload in zip(texts[:self.top_k], payloads[:self.top_k])
+        ]
+    
+    def _points_to_candidates(self, points: list) -> Candidates:
+        texts = []
+        payloads = []
+        for point in points:
+            payload = dict(point.payload or {})
+            texts.append(payload.pop("text", ""))
+            payloads.append(payload)
+        return dedupe_candidates(texts, payloads)
+    
+    def _hybrid_candidates(self, query: str, dense_vector: List[float]) -> Candidates:
+        """Fused candidates from a server-side sparse + dense Qdrant query."""
+        points = hybrid_query(
+            self.vectorstore.collection_name,
+            dense_vector,
+            bm25_sparse_query(query),
+            limit=self.initial_k,
+            vector_name=self.sparse_vector_name,
+            search_params=QUANTIZED_SEARCH_PARAMS
+        )
+        return self._points_to_candidates(points)
+    
+    async def _ahybrid_candidates(self, query: str, dense_vector: List[float]) -> Candidates:
+        """Async version of _hybrid_candidates() using the async Qdrant client."""
+        points = await ahybrid_query(
+            self.vectorstore.collection_name,
+            dense_vector,
+            bm25_sparse_query(query),
+            limit=self.initial_k,
+            vector_name=self.sparse_vector_name,
+            search_params=QUANTIZED_SEARCH_PARAMS
+        )
+        return self._points_to_candidates(points)
+    
+    @staticmethod
+    def _split(docs: List[Document]) -> Candidates:
+        return dedupe_candidates([doc.page_content for doc in docs], [doc.metadata for doc in docs])
+    
+    def _candidates(self, query: str) -> Candidates:
+        """Fused BM25 + vector candidates for a query, as parallel (texts, payloads)."""
+        if self.sparse_vector_name:
+            return self._hybrid_candidates(query, self.vectorstore.embeddings.embed_query(query))
+        
+        bm25_docs = self.bm25.get_relevant_documents(query)
+        vector_docs = self.vectorstore.similarity_search(
+            query, k=self.initial_k, search_params=QUANTIZED_SEARCH_PARAMS
+        )
+        return self._split(reciprocal_rank_fusion([bm25_docs, vector_docs], self.weights))
+    
+    async def _acandidates(self, query: str) -> Candidates:
+        """Async version of _candidates(); BM25 and vector search run concurrently."""
+        if self.sparse_vector_name:
+            dense_vector = await self.vectorstore.embeddings.aembed_query(query)
+            return await self._ahybrid_candidates(query, dense_vector)
+        
+        bm25_docs, vector_docs = await asyncio.gather(
+            asyncio.to_thread(self.bm25.get_relevant_documents, query),
+            self.vectorstore.asimilarity_search(
+                query, k=self.initial_k, search_params=QUANTIZED_SEARCH_PARAMS
+            )
+        )
+        return self._split(reciprocal_rank_fusion([bm25_docs, vector_docs], self.weights))
     
     def get_relevant_documents(self, query: str) -> List[Document]:
         """
@@ -209,54 +869,77 @@ class HybridReranker:
         Returns:
             Top-k reranked documents
         """
-        logger.info(f"🔍 Hybrid Rerank: Retrieving for query: '{query[:50]}...'")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"🔍 Hybrid Rerank: Retrieving for query: '{query[:50]}...'")
+        
+        cache_key = hashlib.sha1(query.encode("utf-8")).hexdigest()
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug("   ⚡ Retrieval cache hit")
+            return list(cached)
         
-        # Step 1: Get initial documents from hybrid retriever
-        docs = self.base_retriever.get_relevant_documents(query)
-        logger.info(f"   ✓ Retrieved {len(docs)} documents from ensemble")
+        # Step 1: Get candidates from BM25 and vector search, then fuse
+        texts, payloads = self._candidates(query)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"   ✓ Retrieved {len(texts)} documents from hybrid search")
         
-        if not docs:
+        if not texts:
             logger.warning("   ⚠️  No documents retrieved from base retriever")
             return []
         
         # Step 2: Rerank with Cohere
         try:
-            # Prepare documents for Cohere
-            doc_texts = [doc.page_content for doc in docs]
-            
-            # Call Cohere Rerank API
-            rerank_response = self.cohere_client.rerank(
-                query=query,
-                documents=doc_texts,
-                top_n=self.top_k,
-                model="rerank-english-v2.0"
-            )
-            
-            # Extract reranked documents in new order
-            reranked_docs = []
-            for result in rerank_response.results:
-                original_doc = docs[result.index]
-                
-                # Add rerank score to metadata
-                original_doc.metadata["rerank_score"] = result.relevance_score
-                original_doc.metadata["rerank_position"] = len(reranked_docs) + 1
-                
-                reranked_docs.append(original_doc)
-            
-            logger.info(f"   ✓ Reranked to top-{len(reranked_docs)} documents")
-            logger.info(f"   📊 Best score: {reranked_docs[0].metadata['rerank_score']:.3f}")
-            
-            return reranked_docs
-            
+            # Call Cohere Rerank API (or reuse a cached ranking)
+            ranking = self._rerank(query, [text[:RERANK_MAX_DOC_CHARS] for text in texts])
+            reranked_docs = self._apply_ranking(texts, payloads, ranking)
         except Exception as e:
             logger.error(f"   ❌ Reranking failed: {e}")
-            logger.warning(f"   ⚠️  Falling back to base retriever results")
-            # Fallback: return original results limited to top_k
-            return docs[:self.top_k]
+            # Fallback: local cross-encoder, or original results limited to top_k
+            return self._fallback(query, texts, payloads)
+        
+        self._cache.put(cache_key, reranked_docs)
+        return list(reranked_docs)
     
     async def aget_relevant_documents(self, query: str) -> List[Document]:
-        """Async version - currently just calls sync version."""
-        return self.get_relevant_documents(query)
+        """
+        Async version of get_relevant_documents().
+        
+        BM25 (CPU-bound, in a worker thread) and vector search (embedding +
+        Qdrant round-trips) run concurrently, then the fused candidates are
+        reranked with the async Cohere client.
+        
+        Args:
+            query: User's search query
+            
+        Returns:
+            Top-k reranked documents
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"🔍 Hybrid Rerank (async): Retrieving for query: '{query[:50]}...'")
+        
+        cache_key = hashlib.sha1(query.encode("utf-8")).hexdigest()
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug("   ⚡ Retrieval cache hit")
+            return list(cached)
+        
+        texts, payloads = await self._acandidates(query)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"   ✓ Retrieved {len(texts)} documents from hybrid search")
+        
+        if not texts:
+            logger.warning("   ⚠️  No documents retrieved from base retriever")
+            return []
+        
+        try:
+            ranking = await self._arerank(query, [text[:RERANK_MAX_DOC_CHARS] for text in texts])
+            reranked_docs = self._apply_ranking(texts, payloads, ranking)
+        except Exception as e:
+            logger.error(f"   ❌ Reranking failed: {e}")
+            return await asyncio.to_thread(self._fallback, query, texts, payloads)
+        
+        self._cache.put(cache_key, reranked_docs)
+        return list(reranked_docs)
 
 
 def test_retriever():
@@ -0,0 +1,141 @@
+"""
+MoneyMentor - Local Cross-Encoder Reranker
+
+Offline fallback for Cohere reranking: an int8-quantized ONNX export of a
+MS MARCO cross-encoder (e.g. Xenova/ms-marco-MiniLM-L-6-v2) run with
+onnxruntime on CPU. Used when the Cohere API is unavailable so results are
+still ranked by relevance rather than returned in fusion order.
+
+The model directory must contain the ONNX model and its tokenizer.json:
+
+    LOCAL_RERANK_MODEL_DIR/
+        model_quantized.onnx
+        tokenizer.json
+"""
+
+import os
+import logging
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+try:
+    import onnxruntime
+    from tokenizers import Tokenizer
+    HAS_ONNX = True
+except ImportError:
+    HAS_ONNX = False
+
+logger = logging.getLogger(__name__)
+
+# Constants
+LOCAL_RERANK_MODEL_DIR = os.getenv("LOCAL_RERANK_MODEL_DIR", "./models/ms-marco-MiniLM-L-6-v2")
+LOCAL_RERANK_MODEL_FILE = "model_quantized.onnx"
+LOCAL_RERANK_BATCH_SIZE = 32
+LOCAL_RERANK_MAX_LENGTH = 512  # Query + passage tokens per pair
+
+# Global reranker instance (singleton pattern); False once loading has failed
+_local_reranker_instance = None
+
+
+class LocalReranker:
+    """
+    Cross-encoder reranker running an ONNX model on CPU.
+
+    Query/passage pairs are tokenized together, padded per batch and scored
+    in one session run per batch; the top-n are selected from the score
+    array with NumPy.
+
+    Example:
+        >>> reranker = LocalReranker("./models/ms-marco-MiniLM-L-6-v2")
+        >>> reranker.rank("what is a roth ira", passages, top_n=5)
+        [(3, 8.12), (0, 6.95), ...]
+    """
+
+    def __init__(self, model_dir: str, batch_size: int = LOCAL_RERANK_BATCH_SIZE):
+        """
+        Load the model and tokenizer.
+
+        Args:
+            model_dir: Directory with the ONNX model and tokenizer.json
+            batch_size: Pairs scored per session run
+        """
+        model_path = Path(model_dir)
+        self.batch_size = batch_size
+        self.session = onnxruntime.InferenceSession(
+            str(model_path / LOCAL_RERANK_MODEL_FILE),
+            providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+
+        self.tokenizer = Tokenizer.from_file(str(model_path / "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=LOCAL_RERANK_MAX_LENGTH)
+        self.tokenizer.enable_padding()
+
+    def score(self, query: str, passages: List[str]) -> np.ndarray:
+        """
+        Relevance logits for each passage against the query.
+
+        Args:
+            query: Search query
+            passages: Candidate passages
+
+        Returns:
+            float32 array aligned with passages (higher is more relevant)
+        """
+        scores = []
+        for start in range(0, len(passages), self.batch_size):
+            encodings = self.tokenizer.encode_batch(
+                [(query, passage) for passage in passages[start:start + self.batch_size]]
+            )
+            inputs = {
+                "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+                "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64),
+                "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+            }
+            logits = self.session.run(
+                None,
+                {name: array for name, array in inputs.items() if name in self.input_names}
+            )[0]
+            scores.append(logits.reshape(len(encodings), -1)[:, 0])
+
+        if not scores:
+            return np.empty(0, dtype=np.float32)
+        return np.concatenate(scores).astype(np.float32)
+
+    def rank(self, query: str, passages: List[str], top_n: int) -> List[tuple]:
+        """
+        Rank passages against the query.
+
+        Returns:
+            List of (index into passages, score), best first, at most top_n
+        """
+        scores = self.score(query, passages)
+        order = np.argsort(-scores, kind="stable")[:top_n]
+        return [(int(index), float(scores[index])) for index in order]
+
+
+def get_local_reranker() -> Optional[LocalReranker]:
+    """
+    Get the shared local reranker, or None if it is not available.
+
+    Requires onnxruntime and tokenizers, and a model in LOCAL_RERANK_MODEL_DIR.
+    A failed load is remembered so it is not retried on every call.
+    """
+    global _local_reranker_instance
+
+    if _local_reranker_instance is None:
+        _local_reranker_instance = False
+        if not HAS_ONNX:
+            logger.info("   ℹ️  onnxruntime/tokenizers not installed; no local rerank fallback")
+        elif not (Path(LOCAL_RERANK_MODEL_DIR) / LOCAL_RERANK_MODEL_FILE).exists():
+            logger.info(f"   ℹ️  No local rerank model in {LOCAL_RERANK_MODEL_DIR}; no local rerank fallback")
+        else:
+            try:
+                _local_reranker_instance = LocalReranker(LOCAL_RERANK_MODEL_DIR)
+                logger.info(f"   ✓ Local rerank fallback loaded from {LOCAL_RERANK_MODEL_DIR}")
+            except Exception as e:
+                logger.warning(f"⚠️  Could not load local reranker: {e}")
+
+    return _local_reranker_instance or None
@@ -3,18 +3,70 @@ MoneyMentor - Vector Store Management
 Handles vector database operations with Qdrant
 """
 import os
+import time
 import logging
-from typing import List, Dict, Any, Optional
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+from typing import List, Dict, Any, Optional, Iterator, Sequence, Union
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.models import (
+    Distance,
+    VectorParams,
+    PointStruct,
+    Batch,
+    CollectionStatus,
+    OptimizersConfigDiff,
+    Filter,
+    FilterSelector,
+    FieldCondition,
+    MatchAny,
+    PayloadSchemaType,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    QuantizationConfig,
+    SearchParams,
+    QuantizationSearchParams,
+    SparseVectorParams,
+    SparseVector,
+    Modifier,
+    PointVectors,
+    Prefetch,
+    FusionQuery,
+    Fusion,
+    ScoredPoint
+)
 from qdrant_client.http import exceptions as qdrant_exceptions
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global client instance (singleton pattern)
+# int8 scalar quantization: 4x smaller vectors kept in RAM, originals on disk
+INT8_QUANTIZATION = ScalarQuantization(
+    scalar=ScalarQuantizationConfig(
+        type=ScalarType.INT8,
+        quantile=0.99,
+        always_ram=True
+    )
+)
+
+# Search over quantized vectors, then rescore an oversampled top-k with the
+# original fp32 vectors so recall is preserved
+QUANTIZED_SEARCH_PARAMS = SearchParams(
+    quantization=QuantizationSearchParams(rescore=True, oversampling=2.0)
+)
+
+# Sparse BM25 term weights; Qdrant applies IDF server-side
+BM25_SPARSE_VECTOR = "bm25"
+BM25_SPARSE_CONFIG = {BM25_SPARSE_VECTOR: SparseVectorParams(modifier=Modifier.IDF)}
+
+QDRANT_TIMEOUT_SECONDS = 10
+
+# Global client instances (singleton pattern)
 _client_instance: Optional[QdrantClient] = None
+_async_client_instance: Optional[AsyncQdrantClient] = None
+_client_uses_grpc = False  # Transport the sync client settled on
 
 
 def get_qdrant_client() -> Optional[QdrantClient]:
@@ -31,27 +83,44 @@ def get_qdrant_client() -> Optional[QdrantClient]:
     Environment Variables:
         QDRANT_URL: URL of Qdrant instance (default: http://localhost:6333)
         QDRANT_API_KEY: API key for Qdrant Cloud (optional, for cloud deployments)
+        QDRANT_PREFER_GRPC: Use gRPC when the server supports it (default: true)
+        QDRANT_GRPC_PORT: gRPC port (default: 6334)
     """
-    global _client_instance
+    global _client_instance, _client_uses_grpc
     
     if _client_instance is not None:
         return _client_instance
     
     qdrant_url = os.getenv("QDRANT_URL", "http://localhost:6333")
     qdrant_api_key = os.getenv("QDRANT_API_KEY")
+    prefer_grpc = os.getenv("QDRANT_PREFER_GRPC", "true").lower() == "true"
+    grpc_port = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
     
     try:
         logger.info(f"🔌 Connecting to Qdrant at {qdrant_url}...")
         
         # Create client with or without API key
+        client_kwargs = {"url": qdrant_url, "timeout": QDRANT_TIMEOUT_SECONDS}
         if qdrant_api_key:
             logger.info("   Using API key authentication (Qdrant Cloud)")
-            client = QdrantClient(url=qdrant_url, api_key=qdrant_api_key)
-        else:
-            client = QdrantClient(url=qdrant_url)
+            client_kwargs["api_key"] = qdrant_api_key
         
-        # Test connection by fetching collections
-        client.get_collections()
+        client = None
+        if prefer_grpc:
+            # gRPC sends vectors as binary protobuf instead of JSON floats
+            try:
+                client = QdrantClient(prefer_grpc=True, grpc_port=grpc_port, **client_kwargs)
+                client.get_collections()
+                _client_uses_grpc = True
+                logger.info(f"   Using gRPC transport (port {grpc_port})")
+            except Exception as e:
+                logger.warning(f"⚠️  gRPC unavailable ({e}), falling back to HTTP")
+                client = None
+        
+        if client is None:
+            client = QdrantClient(**client_kwargs)
+            # Test connection by fetching collections
+            client.get_collections()
         
         logger.info("✅ Successfully connected to Qdrant")
         _client_instance = client
@@ -71,10 +140,44 @@ def get_qdrant_client() -> Optional[QdrantClient]:
         return None
 
 
+def get_async_qdrant_client() -> AsyncQdrantClient:
+    """
+    Get or create the async Qdrant client.
+    
+    Mirrors get_qdrant_client() for the async retrieval path, so vector
+    search can be awaited alongside BM25 and rerank calls instead of
+    occupying a worker thread. It uses the same environment variables and
+    the transport the sync client settled on: gRPC only if the sync client's
+    gRPC probe succeeded, HTTP otherwise (e.g. when only 6333 is exposed).
+    
+    Returns:
+        AsyncQdrantClient instance
+    """
+    global _async_client_instance
+    
+    if _async_client_instance is None:
+        # Runs (or reuses) the sync client's gRPC probe
+        get_qdrant_client()
+        client_kwargs = {
+            "url": os.getenv("QDRANT_URL", "http://localhost:6333"),
+            "timeout": QDRANT_TIMEOUT_SECONDS,
+            "prefer_grpc": _client_uses_grpc,
+            "grpc_port": int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+        }
+        qdrant_api_key = os.getenv("QDRANT_API_KEY")
+        if qdrant_api_key:
+            client_kwargs["api_key"] = qdrant_api_key
+        _async_client_instance = AsyncQdrantClient(**client_kwargs)
+    
+    return _async_client_instance
+
+
 def ensure_collection(
     collection_name: str,
     vector_size: int,
-    distance: Distance = Distance.COSINE
+    distance: Distance = Distance.COSINE,
+    quantization_config: Optional[QuantizationConfig] = None,
+    sparse_vectors_config: Optional[Dict[str, SparseVectorParams]] = None
 ) -> bool:
     """
     Ensure a collection exists in Qdrant, creating it if necessary.
@@ -83,6 +186,10 @@ def ensure_collection(
         collection_name: Name of the collection
         vector_size: Dimension of the vectors (e.g., 1536 for OpenAI embeddings)
         distance: Distance metric to use (COSINE, EUCLID, or DOT)
+        quantization_config: Vector quantization for new collections (optional,
+                             e.g. INT8_QUANTIZATION)
+        sparse_vectors_config: Named sparse vectors for new collections (optional,
+                               e.g. BM25_SPARSE_CONFIG)
         
     Returns:
         True if collection exists or was created successfully, False otherwise
@@ -113,7 +220,9 @@ def ensure_collection(
             vectors_config=VectorParams(
                 size=vector_size,
                 distance=distance
-            )
+            ),
+            quantization_config=quantization_config,
+            sparse_vectors_config=sparse_vectors_config
         )
         
         logger.info(f"✅ Collection '{collection_name}' created successfully")
@@ -185,11 +294,222 @@ def upsert_points(
         return False
 
 
+def delete_points(collection_name: str, points_filter: Optional[Filter] = None) -> bool:
+    """
+    Delete the points matching a filter (or every point when no filter is given).
+    
+    Args:
+        collection_name: Name of the collection
+        points_filter: Payload filter selecting the points to delete
+        
+    Returns:
+        True if successful (or the collection does not exist), False otherwise
+    """
+    client = get_qdrant_client()
+    if client is None:
+        logger.error("❌ Cannot delete points: Qdrant client not available")
+        return False
+    
+    try:
+        if not client.collection_exists(collection_name):
+            return True
+        
+        client.delete(
+            collection_name=collection_name,
+            points_selector=FilterSelector(filter=points_filter or Filter())
+        )
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Failed to delete points from '{collection_name}': {e}")
+        return False
+
+
+def upsert_batch(
+    collection_name: str,
+    ids: Sequence[int],
+    vectors: Union[np.ndarray, Sequence[Sequence[float]]],
+    payloads: Sequence[Dict[str, Any]]
+) -> bool:
+    """
+    Upsert points given as parallel arrays (Qdrant's Batch format).
+    
+    Equivalent to upsert_points() without building a PointStruct per vector.
+    
+    Args:
+        collection_name: Name of the collection
+        ids: Point IDs
+        vectors: Embedding vectors aligned with ids (list or float32 matrix)
+        payloads: Payload dicts aligned with ids
+        
+    Returns:
+        True if upsert successful, False otherwise
+    """
+    client = get_qdrant_client()
+    if client is None:
+        logger.error("❌ Cannot upsert points: Qdrant client not available")
+        return False
+    
+    if len(ids) == 0:
+        logger.warning("⚠️  No points to upsert")
+        return True
+    
+    if isinstance(vectors, np.ndarray):
+        vectors = vectors.tolist()
+    
+    try:
+        logger.info(f"💾 Upserting {len(ids)} point(s) to '{collection_name}'...")
+        
+        client.upsert(
+            collection_name=collection_name,
+            points=Batch(ids=list(ids), vectors=vectors, payloads=list(payloads))
+        )
+        
+        logger.info(f"✅ Successfully upserted {len(ids)} point(s)")
+        return True
+        
+    except qdrant_exceptions.UnexpectedResponse as e:
+        logger.error(f"❌ Failed to upsert points to '{collection_name}': {e}")
+        logger.error(f"   💡 Make sure the collection exists and vector dimensions match")
+        return False
+        
+    except Exception as e:
+        logger.error(f"❌ Unexpected error upserting points: {e}")
+        return False
+
+
+def bulk_upload_vectors(
+    collection_name: str,
+    vectors: Union[np.ndarray, Sequence[Sequence[float]]],
+    payloads: Sequence[Dict[str, Any]],
+    ids: Sequence[int],
+    batch_size: int = 512,
+    parallel: Optional[int] = None
+) -> bool:
+    """
+    Upload parallel arrays of vectors, payloads and ids with upload_collection.
+    
+    Spreads the upload across worker processes and avoids building one
+    PointStruct per vector. Batches are not awaited individually; follow up
+    with wait_for_collection_green().
+    
+    Args:
+        collection_name: Name of the collection
+        vectors: Embedding vectors, one per point (a float32 matrix is sent as-is)
+        payloads: Payload dicts, aligned with vectors
+        ids: Point IDs, aligned with vectors
+        batch_size: Number of points per request
+        parallel: Number of upload processes (default: CPU count)
+        
+    Returns:
+        True if upload was accepted, False otherwise
+    """
+    client = get_qdrant_client()
+    if client is None:
+        logger.error("❌ Cannot upload vectors: Qdrant client not available")
+        return False
+    
+    try:
+        client.upload_collection(
+            collection_name=collection_name,
+            vectors=vectors,
+            payload=payloads,
+            ids=ids,
+            batch_size=batch_size,
+            parallel=parallel or os.cpu_count() or 1
+        )
+        return True
+        
+    except qdrant_exceptions.UnexpectedResponse as e:
+        logger.error(f"❌ Failed to upload vectors to '{collection_name}': {e}")
+        logger.error(f"   💡 Make sure the collection exists and vector dimensions match")
+        return False
+        
+    except Exception as e:
+        logger.error(f"❌ Unexpected error uploading vectors: {e}")
+        return False
+
+
+def set_indexing_threshold(collection_name: str, threshold: int) -> bool:
+    """
+    Update the HNSW indexing threshold of a collection.
+    
+    Setting the threshold to 0 disables indexing, which avoids the optimizer
+    rebuilding the graph while a bulk load is still in progress.
+    
+    Args:
+        collection_name: Name of the collection
+        threshold: Indexing threshold in kilobytes (0 disables indexing)
+        
+    Returns:
+        True if the collection was updated, False otherwise
+    """
+    client = get_qdrant_client()
+    if client is None:
+        logger.error("❌ Cannot update collection: Qdrant client not available")
+        return False
+    
+    try:
+        client.update_collection(
+            collection_name=collection_name,
+            optimizers_config=OptimizersConfigDiff(indexing_threshold=threshold)
+        )
+        return True
+    except Exception as e:
+        logger.error(f"❌ Failed to update indexing threshold for '{collection_name}': {e}")
+        return False
+
+
+def wait_for_collection_green(
+    collection_name: str,
+    timeout: float = 60.0,
+    poll_interval: float = 0.5
+) -> bool:
+    """
+    Block until a collection's status is GREEN (optimizers idle, index built).
+    
+    Used after bulk_upload_vectors(), whose batches are acknowledged before
+    the HNSW index is rebuilt. Point counts are not checked: a re-ingest
+    overwrites the same IDs, so the count says nothing about the new upload.
+    
+    Args:
+        collection_name: Name of the collection
+        timeout: Maximum number of seconds to wait
+        poll_interval: Seconds between polls
+        
+    Returns:
+        True once the collection is GREEN, False on timeout or error
+    """
+    client = get_qdrant_client()
+    if client is None:
+        logger.error("❌ Cannot poll collection: Qdrant client not available")
+        return False
+    
+    deadline = time.monotonic() + timeout
+    status = None
+    try:
+        while True:
+            status = client.get_collection(collection_name).status
+            if status == CollectionStatus.GREEN:
+                return True
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(poll_interval)
+    except Exception as e:
+        logger.error(f"❌ Failed to poll collection '{collection_name}': {e}")
+        return False
+    
+    logger.error(f"❌ Timed out waiting for '{collection_name}' (status: {status})")
+    return False
+
+
 def search_points(
     collection_name: str,
     query_vector: List[float],
     top_k: int = 5,
-    score_threshold: Optional[float] = None
+    score_threshold: Optional[float] = None,
+    query_filter: Optional[Filter] = None,
+    search_params: Optional[SearchParams] = None
 ) -> Optional[List[Dict[str, Any]]]:
     """
     Search for similar vectors in a collection.
@@ -199,6 +519,8 @@ def search_points(
         query_vector: Query embedding vector
         top_k: Number of results to return
         score_threshold: Minimum similarity score (optional)
+        query_filter: Payload filter applied before scoring (optional)
+        search_params: Search-time parameters, e.g. QUANTIZED_SEARCH_PARAMS (optional)
         
     Returns:
         List of search results with scores and payloads, or None if error
@@ -218,7 +540,9 @@ def search_points(
             collection_name=collection_name,
             query_vector=query_vector,
             limit=top_k,
-            score_threshold=score_threshold
+            score_threshold=score_threshold,
+            query_filter=query_filter,
+            search_params=search_params
         )
         
         # Convert to more usable format
@@ -243,6 +567,289 @@ def search_points(
         return None
 
 
+def ensure_payload_index(collection_name: str, field_name: str) -> bool:
+    """
+    Create a keyword payload index so filters on field_name don't scan points.
+    
+    Args:
+        collection_name: Name of the collection
+        field_name: Payload key to index
+        
+    Returns:
+        True if the index exists or was created, False otherwise
+    """
+    client = get_qdrant_client()
+    if client is None:
+        return False
+    
+    try:
+        client.create_payload_index(
+            collection_name=collection_name,
+            field_name=field_name,
+            field_schema=PayloadSchemaType.KEYWORD
+        )
+        return True
+    except Exception as e:
+        logger.error(f"❌ Failed to index payload field '{field_name}': {e}")
+        return False
+
+
+def _dense_vector(vector: Any) -> Optional[List[float]]:
+    """
+    The unnamed dense vector of a scrolled record.
+    
+    Collections with named sparse vectors (e.g. BM25_SPARSE_VECTOR) return
+    every vector as a dict keyed by name; the dense one is under "".
+    """
+    if isinstance(vector, dict):
+        return vector.get("")
+    return vector
+
+
+def fetch_vectors_by_hash(
+    collection_name: str,
+    hashes: Sequence[str],
+    batch_size: int = 256
+) -> Dict[str, List[float]]:
+    """
+    Look up stored vectors by their payload content_hash.
+    
+    Lets an ingest reuse vectors already in Qdrant for unchanged chunks even
+    when the local embedding cache is missing.
+    
+    Args:
+        collection_name: Name of the collection
+        hashes: content_hash values to look for
+        batch_size: Hashes per filtered scroll
+        
+    Returns:
+        Mapping of content_hash to vector for the hashes that were found
+    """
+    client = get_qdrant_client()
+    if client is None or not hashes:
+        return {}
+    
+    found = {}
+    try:
+        for start in range(0, len(hashes), batch_size):
+            wanted = list(hashes[start:start + batch_size])
+            hash_filter = Filter(must=[FieldCondition(key="content_hash", match=MatchAny(any=wanted))])
+            next_offset = None
+            while True:
+                records, next_offset = client.scroll(
+                    collection_name=collection_name,
+                    scroll_filter=hash_filter,
+                    offset=next_offset,
+                    limit=len(wanted),
+                    with_payload=["content_hash"],
+                    with_vectors=True
+                )
+                for record in records:
+                    vector = _dense_vector(record.vector)
+                    if vector is not None:
+                        found[record.payload["content_hash"]] = vector
+                if next_offset is None:
+                    break
+    except Exception as e:
+        logger.warning(f"⚠️  Could not look up stored vectors in '{collection_name}': {e}")
+    
+    return found
+
+
+def scroll_payloads(
+    collection_name: str,
+    fields: Sequence[str] = ("text",),
+    batch_size: int = 1000
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream stored payloads from a collection, page by page.
+    
+    Walks the whole collection with the native scroll API, requesting only the
+    given payload fields and no vectors, so large collections can be scanned
+    without materializing every record at once.
+    
+    Args:
+        collection_name: Name of the collection
+        fields: Payload keys to fetch
+        batch_size: Points per scroll request
+        
+    Yields:
+        Payload dictionaries restricted to fields
+    """
+    client = get_qdrant_client()
+    if client is None:
+        return
+    
+    next_offset = None
+    while True:
+        records, next_offset = client.scroll(
+            collection_name=collection_name,
+            offset=next_offset,
+            limit=batch_size,
+            with_payload=list(fields),
+            with_vectors=False
+        )
+        for record in records:
+            yield record.payload or {}
+        if next_offset is None:
+            break
+
+
+def has_sparse_vector(collection_name: str, vector_name: str = BM25_SPARSE_VECTOR) -> bool:
+    """
+    Check whether a collection was created with a given named sparse vector.
+    
+    Collections created before sparse vectors were introduced don't have one
+    and keep using client-side BM25.
+    
+    Args:
+        collection_name: Name of the collection
+        vector_name: Sparse vector name
+        
+    Returns:
+        True if the sparse vector is configured, False otherwise
+    """
+    client = get_qdrant_client()
+    if client is None:
+        return False
+    
+    try:
+        sparse_config = client.get_collection(collection_name).config.params.sparse_vectors
+        return bool(sparse_config) and vector_name in sparse_config
+    except Exception as e:
+        logger.warning(f"⚠️  Could not read sparse config of '{collection_name}': {e}")
+        return False
+
+
+def upsert_sparse_vectors(
+    collection_name: str,
+    ids: Sequence[Union[int, str]],
+    sparse_vectors: Sequence[tuple],
+    vector_name: str = BM25_SPARSE_VECTOR,
+    batch_size: int = 256
+) -> bool:
+    """
+    Attach sparse vectors to existing points.
+    
+    Args:
+        collection_name: Name of the collection
+        ids: Point IDs
+        sparse_vectors: (indices, values) pairs aligned with ids
+        vector_name: Sparse vector name
+        batch_size: Points per request
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    client = get_qdrant_client()
+    if client is None:
+        logger.error("❌ Cannot upsert sparse vectors: Qdrant client not available")
+        return False
+    
+    try:
+        for start in range(0, len(ids), batch_size):
+            client.update_vectors(
+                collection_name=collection_name,
+                points=[
+                    PointVectors(
+                        id=point_id,
+                        vector={vector_name: SparseVector(indices=indices, values=values)}
+                    )
+                    for point_id, (indices, values) in zip(
+                        ids[start:start + batch_size],
+                        sparse_vectors[start:start + batch_size]
+                    )
+                ],
+                wait=False
+            )
+        logger.info(f"✅ Attached {len(ids)} sparse vector(s) in '{collection_name}'")
+        return True
+    except Exception as e:
+        logger.error(f"❌ Failed to upsert sparse vectors: {e}")
+        return False
+
+
+def _hybrid_request(
+    dense_vector: List[float],
+    sparse_vector: tuple,
+    limit: int,
+    vector_name: str,
+    search_params: Optional[SearchParams]
+) -> Dict[str, Any]:
+    """query_points() arguments for a dense + sparse RRF query."""
+    indices, values = sparse_vector
+    return {
+        "prefetch": [
+            Prefetch(
+                query=SparseVector(indices=indices, values=values),
+                using=vector_name,
+                limit=limit
+            ),
+            Prefetch(query=dense_vector, limit=limit, params=search_params)
+        ],
+        "query": FusionQuery(fusion=Fusion.RRF),
+        "limit": limit,
+        "with_payload": True
+    }
+
+
+def hybrid_query(
+    collection_name: str,
+    dense_vector: List[float],
+    sparse_vector: tuple,
+    limit: int = 20,
+    vector_name: str = BM25_SPARSE_VECTOR,
+    search_params: Optional[SearchParams] = None
+) -> List[ScoredPoint]:
+    """
+    Dense + sparse hybrid search with reciprocal rank fusion done by Qdrant.
+    
+    Args:
+        collection_name: Name of the collection
+        dense_vector: Query embedding
+        sparse_vector: (indices, values) of the query's sparse vector
+        limit: Candidates per branch and results returned
+        vector_name: Sparse vector name
+        search_params: Search parameters for the dense branch (optional)
+        
+    Returns:
+        Fused points with payloads, best first (empty on error)
+    """
+    client = get_qdrant_client()
+    if client is None:
+        return []
+    
+    try:
+        response = client.query_points(
+            collection_name=collection_name,
+            **_hybrid_request(dense_vector, sparse_vector, limit, vector_name, search_params)
+        )
+        return response.points
+    except Exception as e:
+        logger.error(f"❌ Hybrid query failed in '{collection_name}': {e}")
+        return []
+
+
+async def ahybrid_query(
+    collection_name: str,
+    dense_vector: List[float],
+    sparse_vector: tuple,
+    limit: int = 20,
+    vector_name: str = BM25_SPARSE_VECTOR,
+    search_params: Optional[SearchParams] = None
+) -> List[ScoredPoint]:
+    """Async version of hybrid_query() using the async Qdrant client."""
+    try:
+        response = await get_async_qdrant_client().query_points(
+            collection_name=collection_name,
+            **_hybrid_request(dense_vector, sparse_vector, limit, vector_name, search_params)
+        )
+        return response.points
+    except Exception as e:
+        logger.error(f"❌ Hybrid query failed in '{collection_name}': {e}")
+        return []
+
+
 def get_collection_info(collection_name: str) -> Optional[Dict[str, Any]]:
     """
     Get information about a collection.
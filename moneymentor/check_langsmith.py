@@ -2,6 +2,7 @@
 """Check if LangSmith has MoneyMentor runs."""
 
 import os
+from itertools import islice
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -15,16 +16,18 @@ try:
     print("🔍 Checking LangSmith for MoneyMentor runs...")
     print("=" * 60)
     
-    runs = list(client.list_runs(
+    # Only the 5 most recent are shown; limit caps the API page size and
+    # islice stops the paginating generator after them
+    runs = list(islice(client.list_runs(
         project_name="MoneyMentor",
-        limit=20
-    ))
+        limit=5
+    ), 5))
     
     if runs:
-        print(f"✅ Found {len(runs)} runs in LangSmith!")
+        print(f"✅ Found {len(runs)} recent runs in LangSmith!")
         print()
         print("Recent runs:")
-        for i, run in enumerate(runs[:5], 1):
+        for i, run in enumerate(runs, 1):
             print(f"  {i}. {run.name}")
             print(f"     Created: {run.start_time}")
             if run.inputs:
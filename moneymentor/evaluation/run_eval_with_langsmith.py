@@ -11,6 +11,8 @@ Usage:
 import os
 import sys
 import json
+import asyncio
+import orjson
 from pathlib import Path
 from datetime import datetime
 
@@ -30,28 +32,27 @@ except ImportError:
     print("❌ LangSmith not installed. Run: pip install langsmith")
     HAS_LANGSMITH = False
 
-from rag_pipeline import get_finance_answer
+from rag_pipeline import aget_finance_answer
+
+EVAL_CONCURRENCY = int(os.getenv("EVAL_CONCURRENCY", "16"))  # Queries in flight at once
 
 
 def load_golden_set(filepath: str):
-    """Load test queries."""
-    entries = []
-    with open(filepath, 'r') as f:
-        for line in f:
-            if line.strip():
-                entries.append(json.loads(line))
-    return entries
+    """Load test queries (one read, parsed with orjson)."""
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    return [orjson.loads(line) for line in data.splitlines() if line.strip()]
 
 
 @traceable(name="MoneyMentor_RAG_Evaluation", run_type="chain")
-def evaluate_query(query: str, expected_answer: str):
+async def evaluate_query(query: str, expected_answer: str):
     """
     Evaluate a single query with LangSmith tracing.
     
     This decorator ensures the entire evaluation is logged to LangSmith.
     """
     # Get answer from RAG pipeline
-    result = get_finance_answer(query, k=5)
+    result = await aget_finance_answer(query, k=5, use_cache=False)
     
     # Extract data
     answer = result.get('answer', '')
@@ -73,7 +74,7 @@ def evaluate_query(query: str, expected_answer: str):
     }
 
 
-def main():
+async def main():
     """Run evaluation with LangSmith."""
     print("=" * 80)
     print("MoneyMentor Evaluation with LangSmith")
@@ -111,24 +112,29 @@ def main():
     print("=" * 80)
     print()
     
-    # Run evaluation
-    results = []
-    for i, entry in enumerate(golden_entries, 1):
+    # Run evaluation concurrently; each query is still its own LangSmith run
+    semaphore = asyncio.Semaphore(EVAL_CONCURRENCY)
+    
+    async def bounded(i: int, entry: dict):
         query = entry['query']
-        expected = entry['expected_answer']
+        async with semaphore:
+            try:
+                result = await evaluate_query(query, entry['expected_answer'])
+            except Exception as e:
+                print(f"[{i}/{len(golden_entries)}] {query[:60]}...")
+                print(f"  ❌ Error: {e}")
+                print()
+                return {"query": query, "error": str(e)}
         
         print(f"[{i}/{len(golden_entries)}] {query[:60]}...")
-        
-        try:
-            result = evaluate_query(query, expected)
-            results.append(result)
-            print(f"  ✅ Answer length: {result['answer_length']} words")
-            print(f"  ✅ Sources: {result['num_sources']}")
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-            results.append({"query": query, "error": str(e)})
-        
+        print(f"  ✅ Answer length: {result['answer_length']} words")
+        print(f"  ✅ Sources: {result['num_sources']}")
         print()
+        return result
+    
+    results = await asyncio.gather(*(
+        bounded(i, entry) for i, entry in enumerate(golden_entries, 1)
+    ))
     
     # Save results
     output_path = "evaluation/eval_results_langsmith.json"
@@ -155,5 +161,5 @@ def main():
 if __name__ == "__main__":
     if not HAS_LANGSMITH:
         sys.exit(1)
-    main()
+    asyncio.run(main())
 
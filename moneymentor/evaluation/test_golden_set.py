@@ -6,35 +6,57 @@ Usage:
     python evaluation/test_golden_set.py
 """
 
-import json
+import mmap
+import os
+import orjson
 import requests
 import sys
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List
+
+from requests.adapters import HTTPAdapter
 
 API_URL = "http://localhost:8000/api/chat"
 GOLDEN_SET_PATH = "evaluation/golden_set.jsonl"
+MAX_WORKERS = 8  # Queries in flight at once
+_SEP = "-" * 80
+
+# Shared session: keep-alive connections reused across all queries
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=3))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=3))
+
+
+def iter_jsonl(filepath: str) -> Iterator[Dict]:
+    """Yield records from a JSONL file, reading lines from a memory map."""
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                if line.strip():
+                    yield orjson.loads(line)
 
 
 def load_golden_set(filepath: str) -> List[Dict]:
     """Load golden set from JSONL file."""
-    entries = []
-    with open(filepath, 'r') as f:
-        for line in f:
-            if line.strip():
-                entries.append(json.loads(line))
-    return entries
+    return list(iter_jsonl(filepath))
 
 
 def query_moneymentor(question: str) -> Dict:
     """Send query to MoneyMentor API."""
     try:
-        response = requests.post(
+        response = _SESSION.post(
             API_URL,
             json={"question": question, "k": 5},
-            timeout=30
+            timeout=30,
+            stream=True
         )
-        response.raise_for_status()
-        return response.json()
+        try:
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        finally:
+            response.close()
     except Exception as e:
         return {"error": str(e), "answer": "ERROR"}
 
@@ -54,7 +76,7 @@ def main():
     
     # Check API availability
     try:
-        health = requests.get("http://localhost:8000/api/health", timeout=5)
+        health = _SESSION.get("http://localhost:8000/api/health", timeout=5)
         if health.status_code != 200:
             print("❌ MoneyMentor API is not available!")
             print("   Please start the backend: cd app && python -m uvicorn main:app --reload")
@@ -71,19 +93,26 @@ def main():
     print("=" * 80)
     print()
     
+    # Query API concurrently; map() keeps responses in golden-set order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        responses = list(executor.map(
+            query_moneymentor,
+            [entry['query'] for entry in golden_entries]
+        ))
+    
     results = []
-    for i, entry in enumerate(golden_entries, 1):
+    lines = []
+    total = len(golden_entries)
+    for i, (entry, response) in enumerate(zip(golden_entries, responses), 1):
         query = entry['query']
         expected = entry['expected_answer']
         
-        print(f"[{i}/{len(golden_entries)}] {query}")
-        print(f"Expected: {expected[:100]}...")
-        
-        # Query API
-        response = query_moneymentor(query)
+        lines.append(f"[{i}/{total}] {query}")
+        lines.append(f"Expected: {expected[:100]}...")
         
-        if "error" in response:
-            print(f"❌ Error: {response['error']}")
+        error = response.get('error')
+        if error is not None:
+            lines.append(f"❌ Error: {error}")
             results.append({
                 "query": query,
                 "expected": expected,
@@ -93,10 +122,11 @@ def main():
         else:
             actual = response.get('answer', 'No answer')
             tool = response.get('tool', 'unknown')
-            sources_count = len(response.get('sources', []))
+            sources = response.get('sources')
+            sources_count = len(sources) if sources else 0
             
-            print(f"Actual: {actual[:100]}...")
-            print(f"Tool: {tool} | Sources: {sources_count}")
+            lines.append(f"Actual: {actual[:100]}...")
+            lines.append(f"Tool: {tool} | Sources: {sources_count}")
             
             results.append({
                 "query": query,
@@ -107,8 +137,11 @@ def main():
                 "passed": None  # Manual evaluation needed
             })
         
-        print("-" * 80)
-        print()
+        lines.append(_SEP)
+        lines.append("")
+    
+    # One write for the whole report instead of several prints per query
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Summary
     print("=" * 80)
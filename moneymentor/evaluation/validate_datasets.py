@@ -10,9 +10,22 @@ Checks:
 - Reasonable lengths
 """
 
-import json
+import mmap
+import os
 import sys
 from pathlib import Path
+from typing import Iterator
+
+import orjson
+
+
+def iter_lines(file_path: str) -> Iterator[bytes]:
+    """Yield the raw lines of a file, read from a memory map."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b"")
 
 
 def validate_dataset(file_path: str, expected_count: int) -> bool:
@@ -34,56 +47,72 @@ def validate_dataset(file_path: str, expected_count: int) -> bool:
         print(f"❌ Error: File not found: {file_path}")
         return False
     
-    queries = []
-    query_texts = set()
+    # Running statistics; queries are not kept in memory
+    count = 0
+    seen_queries = set()  # For duplicate detection
+    samples = []
+    query_min = answer_min = float('inf')
+    query_max = answer_max = 0
+    query_sum = answer_sum = 0
     errors = []
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, 1):
-            # Skip empty lines
-            if not line.strip():
-                continue
-            
-            # Parse JSON
-            try:
-                data = json.loads(line)
-            except json.JSONDecodeError as e:
-                errors.append(f"Line {line_num}: Invalid JSON - {e}")
-                continue
-            
-            # Check required fields
-            if 'query' not in data:
-                errors.append(f"Line {line_num}: Missing 'query' field")
-                continue
-            if 'expected_answer' not in data:
-                errors.append(f"Line {line_num}: Missing 'expected_answer' field")
-                continue
-            
-            # Check data types
-            if not isinstance(data['query'], str):
-                errors.append(f"Line {line_num}: 'query' must be a string")
-                continue
-            if not isinstance(data['expected_answer'], str):
-                errors.append(f"Line {line_num}: 'expected_answer' must be a string")
-                continue
-            
-            # Check for extra fields (warning only)
+    for line_num, line in enumerate(iter_lines(file_path), 1):
+        # Skip empty lines
+        if not line.strip():
+            continue
+        
+        # Parse JSON
+        try:
+            data = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            errors.append(f"Line {line_num}: Invalid JSON - {e}")
+            continue
+        
+        # Check required fields
+        if 'query' not in data:
+            errors.append(f"Line {line_num}: Missing 'query' field")
+            continue
+        if 'expected_answer' not in data:
+            errors.append(f"Line {line_num}: Missing 'expected_answer' field")
+            continue
+        query = data['query']
+        answer = data['expected_answer']
+        
+        # Check data types
+        if type(query) is not str:
+            errors.append(f"Line {line_num}: 'query' must be a string")
+            continue
+        if type(answer) is not str:
+            errors.append(f"Line {line_num}: 'expected_answer' must be a string")
+            continue
+        
+        # Check for extra fields (warning only)
+        if len(data) > 2:
             extra_fields = set(data.keys()) - {'query', 'expected_answer'}
-            if extra_fields:
-                print(f"⚠️  Line {line_num}: Extra fields found: {extra_fields}")
-            
-            # Check lengths
-            if len(data['query']) < 5:
-                errors.append(f"Line {line_num}: Query too short ({len(data['query'])} chars)")
-            if len(data['expected_answer']) < 10:
-                errors.append(f"Line {line_num}: Answer too short ({len(data['expected_answer'])} chars)")
-            
-            # Check for duplicates
-            if data['query'] in query_texts:
-                errors.append(f"Line {line_num}: Duplicate query: {data['query'][:50]}...")
-            
-            query_texts.add(data['query'])
-            queries.append(data)
+            print(f"⚠️  Line {line_num}: Extra fields found: {extra_fields}")
+        
+        # Check lengths
+        query_len = len(query)
+        answer_len = len(answer)
+        if query_len < 5:
+            errors.append(f"Line {line_num}: Query too short ({query_len} chars)")
+        if answer_len < 10:
+            errors.append(f"Line {line_num}: Answer too short ({answer_len} chars)")
+        
+        # Check for duplicates
+        if query in seen_queries:
+            errors.append(f"Line {line_num}: Duplicate query: {query[:50]}...")
+        seen_queries.add(query)
+        
+        count += 1
+        query_min = min(query_min, query_len)
+        query_max = max(query_max, query_len)
+        query_sum += query_len
+        answer_min = min(answer_min, answer_len)
+        answer_max = max(answer_max, answer_len)
+        answer_sum += answer_len
+        if len(samples) < 3:
+            samples.append(query)
     
     # Print errors
     if errors:
@@ -93,35 +122,35 @@ def validate_dataset(file_path: str, expected_count: int) -> bool:
         print()
         return False
     
+    if count == 0:
+        print(f"❌ Error: No queries found in {file_path}")
+        return False
+    
     # Check count
-    actual_count = len(queries)
-    if actual_count != expected_count:
-        print(f"⚠️  Warning: Expected {expected_count} queries, found {actual_count}")
+    if count != expected_count:
+        print(f"⚠️  Warning: Expected {expected_count} queries, found {count}")
     
     # Print summary
     print(f"✅ Validation successful!")
     print(f"\nStatistics:")
-    print(f"  Total queries: {actual_count}")
-    print(f"  Unique queries: {len(query_texts)}")
+    print(f"  Total queries: {count}")
+    print(f"  Unique queries: {len(seen_queries)}")
     
     # Query length stats
-    query_lengths = [len(q['query']) for q in queries]
-    answer_lengths = [len(q['expected_answer']) for q in queries]
-    
     print(f"\nQuery lengths:")
-    print(f"  Min: {min(query_lengths)} chars")
-    print(f"  Max: {max(query_lengths)} chars")
-    print(f"  Avg: {sum(query_lengths) / len(query_lengths):.1f} chars")
+    print(f"  Min: {query_min} chars")
+    print(f"  Max: {query_max} chars")
+    print(f"  Avg: {query_sum / count:.1f} chars")
     
     print(f"\nAnswer lengths:")
-    print(f"  Min: {min(answer_lengths)} chars")
-    print(f"  Max: {max(answer_lengths)} chars")
-    print(f"  Avg: {sum(answer_lengths) / len(answer_lengths):.1f} chars")
+    print(f"  Min: {answer_min} chars")
+    print(f"  Max: {answer_max} chars")
+    print(f"  Avg: {answer_sum / count:.1f} chars")
     
     # Sample queries
     print(f"\nSample queries:")
-    for i, query in enumerate(queries[:3], 1):
-        print(f"  {i}. {query['query'][:60]}...")
+    for i, query in enumerate(samples, 1):
+        print(f"  {i}. {query[:60]}...")
     
     return True
 
@@ -17,12 +17,18 @@ Usage:
 
 import os
 import sys
-import json
+import hashlib
+import functools
+import importlib.util
 import logging
+import mmap
+import threading
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 import argparse
+import csv
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -31,116 +37,312 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Import dependencies
-try:
-    from sentence_transformers import SentenceTransformer, util
-    import pandas as pd
+SEMANTIC_MODEL_NAME = 'all-MiniLM-L6-v2'  # Fast, lightweight model
+EMBEDDING_CACHE_DIR = Path(".cache")  # Reference embeddings reused across runs
+ENCODE_BATCH_SIZE = 64
+REQUIRED_MODULES = ("sentence_transformers", "torch", "numpy", "orjson", "dotenv")
+
+# Retriever passes run concurrently; the model is shared, so encodes are serialized
+_ENCODE_LOCK = threading.Lock()
+
+# Heavy dependencies and the model are loaded by load_dependencies() once
+# arguments are parsed, so --help and bad invocations return immediately
+torch = None
+np = None
+orjson = None
+util = None
+get_finance_answer = None
+langsmith_client = None
+HAS_LANGSMITH = False
+SEMANTIC_DEVICE = "cpu"
+semantic_model = None
+encode_fn = None
+
+
+def check_dependencies() -> bool:
+    """Check that required packages are installed, without importing them."""
+    missing = [name for name in REQUIRED_MODULES if importlib.util.find_spec(name) is None]
+    if missing:
+        logger.error(f"Missing dependency: {', '.join(missing)}")
+        logger.error("Install with: pip install sentence-transformers")
+        return False
+    return True
+
+
+def load_semantic_model(model_name: str = SEMANTIC_MODEL_NAME) -> "SentenceTransformer":
+    """
+    Load the sentence-transformers model at reduced precision.
+    
+    FP16 on CUDA; on CPU the Linear layers are dynamically quantized to
+    int8. Embeddings are normalized at encode time, so cosine scores stay
+    stable under the lower precision.
+    """
+    from sentence_transformers import SentenceTransformer
+    
+    model = SentenceTransformer(model_name, device=SEMANTIC_DEVICE)
+    if SEMANTIC_DEVICE == "cuda":
+        model = model.half()
+        precision = "fp16 (CUDA)"
+    else:
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        precision = "int8 (CPU)"
+    logger.info(f"✅ Model loaded: {model_name} [{precision}]")
+    return model
+
+
+def load_dependencies() -> None:
+    """Import torch, sentence-transformers and the RAG pipeline, and load the semantic model."""
+    global torch, np, orjson, util, get_finance_answer, langsmith_client, HAS_LANGSMITH
+    global SEMANTIC_DEVICE, semantic_model, encode_fn
+    
+    import torch
+    import numpy as np
+    import orjson
+    from sentence_transformers import util
     from dotenv import load_dotenv
     
+    # Load environment
+    load_dotenv()
+    
     # Load RAG pipeline
     from app.rag_pipeline import get_finance_answer
     
     # LangSmith tracking
     try:
-        from langsmith import Client, traceable
+        from langsmith import Client
         langsmith_client = Client()
         HAS_LANGSMITH = True
     except ImportError:
         HAS_LANGSMITH = False
         langsmith_client = None
         logger.warning("LangSmith not available")
-        
-except ImportError as e:
-    logger.error(f"Missing dependency: {e}")
-    logger.error("Install with: pip install sentence-transformers pandas")
-    sys.exit(1)
+    
+    # Batched encodes parallelize within each op; one inter-op thread avoids oversubscription
+    torch.set_num_threads(os.cpu_count() or 1)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # Already set, or parallel work has started
+    
+    # Initialize semantic similarity model
+    logger.info("Loading semantic similarity model...")
+    SEMANTIC_DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
+    semantic_model = load_semantic_model(SEMANTIC_MODEL_NAME)
+    
+    # Every encode uses the same options; bind them (and the device) once.
+    # Returns L2-normalized embeddings on SEMANTIC_DEVICE.
+    encode_fn = functools.partial(
+        semantic_model.encode,
+        batch_size=ENCODE_BATCH_SIZE,
+        convert_to_tensor=True,
+        normalize_embeddings=True,
+        show_progress_bar=False,
+        device=SEMANTIC_DEVICE
+    )
 
-# Load environment
-load_dotenv()
 
-# Initialize semantic similarity model
-logger.info("Loading semantic similarity model...")
-semantic_model = SentenceTransformer('all-MiniLM-L6-v2')  # Fast, lightweight model
-logger.info("✅ Model loaded: all-MiniLM-L6-v2")
+METRIC_KEYS = ("faithfulness", "relevancy", "precision", "recall")
+COMPARISON_METRICS = ("Faithfulness", "Relevancy", "Precision", "Recall")
 
 
-def compute_semantic_similarity(text1: str, text2: str) -> float:
-    """
-    Compute semantic similarity between two texts using sentence transformers.
-    
-    Returns:
-        Float between 0.0 and 1.0 (cosine similarity of embeddings)
-    """
-    emb1 = semantic_model.encode(text1, convert_to_tensor=True)
-    emb2 = semantic_model.encode(text2, convert_to_tensor=True)
-    similarity = util.cos_sim(emb1, emb2).item()
-    return similarity
+def _fast_path_similarity(text1: str, text2: str) -> Optional[float]:
+    """Similarity that needs no embedding: 0.0 if either text is empty, 1.0 if equal."""
+    text1, text2 = text1.strip(), text2.strip()
+    if not text1 or not text2:
+        return 0.0
+    if text1 == text2:
+        return 1.0
+    return None
 
 
-def score_semantic_faithfulness(generated: str, expected: str, contexts: List[str]) -> float:
-    """
-    Semantic faithfulness: How well does the generated answer match the expected answer?
-    
-    Uses embedding similarity instead of exact substring matching.
-    """
-    similarity = compute_semantic_similarity(generated, expected)
-    return similarity
+def encode_unique(texts: List[str]) -> Any:
+    """encode_fn() that encodes each distinct text once; duplicates share a row."""
+    row_by_text: Dict[str, int] = {}
+    rows = [row_by_text.setdefault(text, len(row_by_text)) for text in texts]
+    embeddings = encode_fn(list(row_by_text))
+    if len(row_by_text) == len(texts):
+        return embeddings
+    return embeddings[torch.tensor(rows, device=embeddings.device)]
 
 
-def score_semantic_relevancy(generated: str, query: str) -> float:
-    """
-    Semantic relevancy: How well does the answer address the query?
-    
-    Uses embedding similarity between answer and question.
-    """
-    similarity = compute_semantic_similarity(generated, query)
-    return similarity
+def _embedding_cache_key(text: str) -> str:
+    # fp16 (CUDA) and int8 (CPU) embeddings differ, so the device is part of the key
+    key = f"{SEMANTIC_MODEL_NAME}\0{SEMANTIC_DEVICE}\0{text}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
 
 
-def score_semantic_precision(contexts: List[str], expected: str) -> float:
+def encode_cached(texts: List[str]) -> Any:
     """
-    Semantic precision: How relevant are the retrieved contexts?
+    Encode texts, reusing normalized embeddings persisted by earlier runs.
+    
+    The cache is a pair of .npy files under EMBEDDING_CACHE_DIR: blake2b
+    keys of (model, device, text) and float16 vectors, memory-mapped on load so
+    only the rows used are read. Misses are batch-encoded and appended.
     
-    Average similarity of contexts to expected answer.
+    Returns:
+        Tensor of normalized embeddings aligned with texts
     """
-    if not contexts:
-        return 0.0
+    if not texts:
+        return torch.empty(0)
+    
+    keys_path = EMBEDDING_CACHE_DIR / "semantic_embedding_keys.npy"
+    vectors_path = EMBEDDING_CACHE_DIR / "semantic_embedding_vectors.npy"
+    
+    cached_keys = np.empty(0, dtype="U32")
+    cached_vectors = None
+    if keys_path.exists() and vectors_path.exists():
+        try:
+            cached_keys = np.load(keys_path)
+            cached_vectors = np.load(vectors_path, mmap_mode="r")
+        except Exception as e:
+            logger.warning(f"Could not load embedding cache: {e}")
+            cached_keys, cached_vectors = np.empty(0, dtype="U32"), None
+    row_by_key = {key: row for row, key in enumerate(cached_keys.tolist())}
+    
+    keys = [_embedding_cache_key(text) for text in texts]
+    missing = [i for i, key in enumerate(keys) if key not in row_by_key]
+    
+    new_vectors = None
+    if missing:
+        new_vectors = encode_fn([texts[i] for i in missing]).cpu().numpy().astype(np.float16)
+    
+    dim = new_vectors.shape[1] if missing else cached_vectors.shape[1]
+    vectors = np.empty((len(texts), dim), dtype=np.float32)
+    for i, key in enumerate(keys):
+        if key in row_by_key:
+            vectors[i] = cached_vectors[row_by_key[key]]
+    if missing:
+        vectors[missing] = new_vectors
+        
+        # Append misses (deduplicated) to the on-disk cache
+        new_rows = {keys[i]: new_vectors[j] for j, i in enumerate(missing)}
+        try:
+            EMBEDDING_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            all_keys = np.concatenate([cached_keys, np.array(list(new_rows), dtype="U32")])
+            all_vectors = np.stack(list(new_rows.values()))
+            if cached_vectors is not None and len(cached_keys):
+                all_vectors = np.concatenate([np.asarray(cached_vectors), all_vectors])
+            del cached_vectors  # Release the mmap before overwriting the file
+            np.save(keys_path, all_keys)
+            np.save(vectors_path, all_vectors)
+        except Exception as e:
+            logger.warning(f"Could not save embedding cache: {e}")
     
-    similarities = [compute_semantic_similarity(ctx, expected) for ctx in contexts]
-    return sum(similarities) / len(similarities)
+    logger.info(f"Reference embeddings: {len(texts) - len(missing)} cached, {len(missing)} encoded")
+    dtype = next(semantic_model.parameters()).dtype
+    return torch.from_numpy(vectors).to(device=SEMANTIC_DEVICE, dtype=dtype)
 
 
-def score_semantic_recall(contexts: List[str], expected: str) -> float:
+def encode_references(queries: List[Dict[str, str]]) -> Dict[str, Any]:
     """
-    Semantic recall: Do the contexts contain information needed for the answer?
+    Encode every query and expected answer in the dataset once.
     
-    Maximum similarity among contexts (best context relevance).
+    Both retriever passes score against the same references, so these are
+    encoded up front and looked up instead of re-encoded per response.
+    Embeddings persist across runs (see encode_cached()).
+    
+    Returns:
+        Dict mapping text to its normalized embedding tensor
     """
-    if not contexts:
-        return 0.0
+    texts = list(dict.fromkeys(
+        text for q in queries for text in (q["expected_answer"], q["query"])
+    ))
+    embeddings = encode_cached(texts)
+    return dict(zip(texts, embeddings))
+
+
+def semantic_scores(
+    generated: str,
+    expected: str,
+    query: str,
+    contexts: List[str],
+    reference_embeddings: Optional[Dict[str, Any]] = None
+) -> Dict[str, float]:
+    """
+    All four semantic metrics for one response from a single batched encode.
     
-    similarities = [compute_semantic_similarity(ctx, expected) for ctx in contexts]
-    return max(similarities)
+    Embeddings are L2-normalized, so cosine similarity is a dot product.
+    One encode call per query instead of one per text. Pairs with an empty
+    text score 0.0 and identical pairs 1.0 (see _fast_path_similarity());
+    texts only needed for such pairs are never encoded.
+    
+    Args:
+        generated: Generated answer
+        expected: Expected answer
+        query: User query
+        contexts: Retrieved contexts
+        reference_embeddings: Pre-encoded queries/expected answers (see encode_references())
+    
+    Returns:
+        Dict with faithfulness, relevancy, precision and recall
+    """
+    faithfulness = _fast_path_similarity(generated, expected)
+    relevancy = _fast_path_similarity(generated, query)
+    context_scores = [_fast_path_similarity(context, expected) for context in contexts]
+    open_contexts = [context for context, score in zip(contexts, context_scores) if score is None]
+    
+    references = reference_embeddings or {}
+    needed = [
+        (generated, faithfulness is None or relevancy is None),
+        (expected, faithfulness is None or bool(open_contexts)),
+        (query, relevancy is None)
+    ]
+    to_encode = [text for text, is_needed in needed if is_needed and text not in references]
+    to_encode += open_contexts
+    
+    values: List[float] = []
+    # inference_mode is thread-local, so it is entered here rather than in main()
+    with _ENCODE_LOCK, torch.inference_mode():
+        embedding_of = dict(references)
+        if to_encode:
+            embedding_of.update(zip(to_encode, encode_unique(to_encode)))
+        
+        similarities = []
+        if faithfulness is None:
+            similarities.append(embedding_of[generated] @ embedding_of[expected])
+        if relevancy is None:
+            similarities.append(embedding_of[generated] @ embedding_of[query])
+        if open_contexts:
+            context_embs = torch.stack([embedding_of[context] for context in open_contexts])
+            similarities.append(context_embs @ embedding_of[expected])
+        # Transfer every computed similarity with one .tolist()
+        if similarities:
+            values = torch.cat([sim.reshape(-1) for sim in similarities]).float().cpu().tolist()
+    
+    remaining = iter(values)
+    if faithfulness is None:
+        faithfulness = next(remaining)
+    if relevancy is None:
+        relevancy = next(remaining)
+    context_scores = [next(remaining) if score is None else score for score in context_scores]
+    
+    precision = sum(context_scores) / len(context_scores) if context_scores else 0.0
+    recall = max(context_scores, default=0.0)
+    return dict(zip(METRIC_KEYS, (faithfulness, relevancy, precision, recall)))
 
 
 def load_test_dataset(dataset_path: str) -> List[Dict[str, str]]:
     """Load test queries from JSONL file."""
     queries = []
-    with open(dataset_path, 'r') as f:
-        for line in f:
-            if line.strip():
-                data = json.loads(line)
-                queries.append({
-                    "query": data["query"],
-                    "expected_answer": data["expected_answer"]
-                })
+    with open(dataset_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return queries
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                if line.strip():
+                    data = orjson.loads(line)
+                    queries.append({
+                        "query": data["query"],
+                        "expected_answer": data["expected_answer"]
+                    })
     return queries
 
 
 def evaluate_retriever(
     mode: str,
     queries: List[Dict[str, str]],
-    dataset_name: str = "simple"
+    dataset_name: str = "simple",
+    reference_embeddings: Optional[Dict[str, Any]] = None
 ) -> List[Dict[str, Any]]:
     """
     Evaluate a retriever with semantic metrics.
@@ -149,6 +351,7 @@ def evaluate_retriever(
         mode: "base" or "advanced"
         queries: List of query dicts with query and expected_answer
         dataset_name: Name of dataset for logging
+        reference_embeddings: Pre-encoded queries/expected answers (optional)
         
     Returns:
         List of result dicts with metrics
@@ -171,17 +374,19 @@ def evaluate_retriever(
                 query=query,
                 mode=mode,
                 return_context=True,
-                k=5
+                k=5,
+                use_cache=False  # Score the retriever, not a cached answer
             )
             
             generated = response["answer"]
             contexts = response.get("contexts", [])
             
-            # Compute semantic metrics
-            faithfulness = score_semantic_faithfulness(generated, expected, contexts)
-            relevancy = score_semantic_relevancy(generated, query)
-            precision = score_semantic_precision(contexts, expected)
-            recall = score_semantic_recall(contexts, expected)
+            # Compute semantic metrics (one batched encode per query)
+            scores = semantic_scores(generated, expected, query, contexts, reference_embeddings)
+            faithfulness = scores["faithfulness"]
+            relevancy = scores["relevancy"]
+            precision = scores["precision"]
+            recall = scores["recall"]
             
             result = {
                 "query": query,
@@ -223,50 +428,74 @@ def evaluate_retriever(
     return results
 
 
+def metric_means(results: List[Dict[str, Any]]) -> List[float]:
+    """Mean of each metric in METRIC_KEYS over a retriever's results."""
+    scores = np.array([[r[key] for key in METRIC_KEYS] for r in results], dtype=np.float64)
+    return scores.mean(axis=0).tolist()
+
+
 def generate_comparison_report(
     base_results: List[Dict[str, Any]],
     hybrid_results: List[Dict[str, Any]],
     dataset_name: str
-) -> pd.DataFrame:
-    """Generate comparison DataFrame and summary statistics."""
+) -> List[Dict[str, Any]]:
+    """
+    Generate comparison rows (one per retriever) with summary statistics.
+    
+    The hybrid row carries the Δ columns (hybrid minus base); they are None
+    on the base row.
+    """
+    
+    # Calculate averages (one row per result, one column per metric)
+    base_means = metric_means(base_results)
+    hybrid_means = metric_means(hybrid_results)
     
-    # Calculate averages
     base_avg = {
         "Retriever": "Base",
-        "Faithfulness": sum(r["faithfulness"] for r in base_results) / len(base_results),
-        "Relevancy": sum(r["relevancy"] for r in base_results) / len(base_results),
-        "Precision": sum(r["precision"] for r in base_results) / len(base_results),
-        "Recall": sum(r["recall"] for r in base_results) / len(base_results),
+        **dict(zip(COMPARISON_METRICS, base_means)),
         "Queries": len(base_results),
         "Dataset": dataset_name
     }
     
     hybrid_avg = {
         "Retriever": "Hybrid+Rerank",
-        "Faithfulness": sum(r["faithfulness"] for r in hybrid_results) / len(hybrid_results),
-        "Relevancy": sum(r["relevancy"] for r in hybrid_results) / len(hybrid_results),
-        "Precision": sum(r["precision"] for r in hybrid_results) / len(hybrid_results),
-        "Recall": sum(r["recall"] for r in hybrid_results) / len(hybrid_results),
+        **dict(zip(COMPARISON_METRICS, hybrid_means)),
         "Queries": len(hybrid_results),
         "Dataset": dataset_name
     }
     
-    # Create DataFrame
-    df = pd.DataFrame([base_avg, hybrid_avg])
+    # Add improvement columns
+    for metric in COMPARISON_METRICS:
+        base_avg[f"Δ {metric}"] = None
+        hybrid_avg[f"Δ {metric}"] = hybrid_avg[metric] - base_avg[metric]
     
-    # Add improvement column
-    df["Δ Faithfulness"] = df["Faithfulness"].diff()
-    df["Δ Relevancy"] = df["Relevancy"].diff()
-    df["Δ Precision"] = df["Precision"].diff()
-    df["Δ Recall"] = df["Recall"].diff()
+    return [base_avg, hybrid_avg]
+
+
+def format_comparison_table(comparison: List[Dict[str, Any]]) -> str:
+    """Render comparison rows as a Markdown table."""
+    columns = list(comparison[0])
     
-    return df
+    def cell(value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, float):
+            return f"{value:.4f}"
+        return str(value)
+    
+    lines = [
+        "| " + " | ".join(columns) + " |",
+        "|" + "|".join("---" for _ in columns) + "|"
+    ]
+    for row in comparison:
+        lines.append("| " + " | ".join(cell(row[column]) for column in columns) + " |")
+    return "\n".join(lines)
 
 
 def save_results(
     base_results: List[Dict[str, Any]],
     hybrid_results: List[Dict[str, Any]],
-    comparison_df: pd.DataFrame,
+    comparison: List[Dict[str, Any]],
     dataset_name: str
 ):
     """Save all results to files."""
@@ -279,39 +508,44 @@ def save_results(
         "dataset": dataset_name,
         "base_retriever": base_results,
         "hybrid_retriever": hybrid_results,
-        "summary": comparison_df.to_dict(orient="records")
+        "summary": comparison
     }
     
     results_path = f"reports/semantic_evaluation_{dataset_name}_{timestamp}.json"
-    with open(results_path, 'w') as f:
-        json.dump(detailed_results, f, indent=2)
+    with open(results_path, 'wb') as f:
+        f.write(orjson.dumps(detailed_results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     logger.info(f"✅ Detailed results saved: {results_path}")
     
     # Save comparison CSV
     csv_path = f"reports/semantic_comparison_{dataset_name}_{timestamp}.csv"
-    comparison_df.to_csv(csv_path, index=False)
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(comparison[0]))
+        writer.writeheader()
+        writer.writerows(comparison)
     logger.info(f"✅ Comparison CSV saved: {csv_path}")
     
     # Save markdown report
     md_path = f"reports/semantic_evaluation_{dataset_name}_{timestamp}.md"
+    # Extract improvements
+    delta_faith = comparison[1]["Δ Faithfulness"]
+    delta_prec = comparison[1]["Δ Precision"]
+    delta_recall = comparison[1]["Δ Recall"]
+    
+    report = "".join([
+        f"# Semantic RAGAS Evaluation Results\n\n",
+        f"**Dataset:** {dataset_name}\n",
+        f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+        f"**Queries:** {len(base_results)}\n\n",
+        f"## Summary\n\n",
+        format_comparison_table(comparison),
+        f"\n\n## Key Findings\n\n",
+        f"- **Faithfulness:** {delta_faith:+.1%} improvement\n",
+        f"- **Precision:** {delta_prec:+.1%} improvement\n",
+        f"- **Recall:** {delta_recall:+.1%} improvement\n"
+    ])
     with open(md_path, 'w') as f:
-        f.write(f"# Semantic RAGAS Evaluation Results\n\n")
-        f.write(f"**Dataset:** {dataset_name}\n")
-        f.write(f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"**Queries:** {len(base_results)}\n\n")
-        f.write(f"## Summary\n\n")
-        f.write(comparison_df.to_markdown(index=False))
-        f.write(f"\n\n## Key Findings\n\n")
-        
-        # Extract improvements
-        delta_faith = comparison_df.iloc[1]["Δ Faithfulness"]
-        delta_prec = comparison_df.iloc[1]["Δ Precision"]
-        delta_recall = comparison_df.iloc[1]["Δ Recall"]
-        
-        f.write(f"- **Faithfulness:** {delta_faith:+.1%} improvement\n")
-        f.write(f"- **Precision:** {delta_prec:+.1%} improvement\n")
-        f.write(f"- **Recall:** {delta_recall:+.1%} improvement\n")
-        
+        f.write(report)
+    
     logger.info(f"✅ Markdown report saved: {md_path}")
 
 
@@ -334,40 +568,54 @@ def main():
         dataset_path = "evaluation/golden_set_reasoning.jsonl"
         dataset_name = "reasoning"
     
+    if not Path(dataset_path).exists():
+        logger.error(f"Dataset not found: {dataset_path}")
+        sys.exit(1)
+    
+    if not check_dependencies():
+        sys.exit(1)
+    load_dependencies()
+    
     logger.info(f"\n{'='*80}")
     logger.info(f"SEMANTIC RAGAS EVALUATION")
     logger.info(f"{'='*80}")
     logger.info(f"Dataset: {dataset_name}")
     logger.info(f"Path: {dataset_path}")
-    logger.info(f"Semantic Model: all-MiniLM-L6-v2")
+    logger.info(f"Semantic Model: {SEMANTIC_MODEL_NAME}")
     logger.info(f"{'='*80}\n")
     
     # Load test queries
     queries = load_test_dataset(dataset_path)
     logger.info(f"✅ Loaded {len(queries)} test queries\n")
     
-    # Evaluate Base retriever
-    base_results = evaluate_retriever("base", queries, dataset_name)
+    # Encode queries and expected answers once for both retrievers
+    with torch.inference_mode():
+        reference_embeddings = encode_references(queries)
     
-    # Evaluate Hybrid+Rerank retriever
-    hybrid_results = evaluate_retriever("advanced", queries, dataset_name)
+    # Evaluate Base and Hybrid+Rerank retrievers concurrently; both are
+    # dominated by LLM/API waits in get_finance_answer
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        base_future = executor.submit(evaluate_retriever, "base", queries, dataset_name, reference_embeddings)
+        hybrid_future = executor.submit(evaluate_retriever, "advanced", queries, dataset_name, reference_embeddings)
+        base_results = base_future.result()
+        hybrid_results = hybrid_future.result()
     
     # Generate comparison
     logger.info(f"\n{'='*80}")
     logger.info(f"GENERATING COMPARISON REPORT")
     logger.info(f"{'='*80}\n")
     
-    comparison_df = generate_comparison_report(base_results, hybrid_results, dataset_name)
+    comparison = generate_comparison_report(base_results, hybrid_results, dataset_name)
     
     # Print results
     print("\n" + "="*80)
     print("SEMANTIC RAGAS EVALUATION RESULTS")
     print("="*80 + "\n")
-    print(comparison_df.to_string(index=False))
+    print(format_comparison_table(comparison))
     print("\n" + "="*80 + "\n")
     
     # Save results
-    save_results(base_results, hybrid_results, comparison_df, dataset_name)
+    save_results(base_results, hybrid_results, comparison, dataset_name)
     
     logger.info("\n✅ Semantic evaluation complete!")
     logger.info(f"Check reports/ directory for detailed results\n")
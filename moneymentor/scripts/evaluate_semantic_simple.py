@@ -12,10 +12,14 @@ Usage:
 
 import os
 import sys
+import functools
+import hashlib
+import csv
 import json
 import logging
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import argparse
 
@@ -30,118 +34,233 @@ logger = logging.getLogger(__name__)
 
 # Import dependencies
 try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
-    import pandas as pd
+    from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer
     import numpy as np
+    import orjson
+    import joblib
     from dotenv import load_dotenv
     
     # Load RAG pipeline
     from app.rag_pipeline import get_finance_answer
-    
-    # LangSmith tracking
-    try:
-        from langsmith import Client
-        langsmith_client = Client()
-        HAS_LANGSMITH = True
-    except ImportError:
-        HAS_LANGSMITH = False
-        langsmith_client = None
-        logger.warning("LangSmith not available")
         
 except ImportError as e:
     logger.error(f"Missing dependency: {e}")
-    logger.error("Install with: pip install scikit-learn pandas numpy")
+    logger.error("Install with: pip install scikit-learn numpy orjson")
     sys.exit(1)
 
 # Load environment
 load_dotenv()
 
+MAX_WORKERS = 8  # Concurrent get_finance_answer calls per retriever
+METRICS = ["faithfulness", "relevancy", "precision", "recall"]
+CACHE_DIR = Path(".cache")  # Fitted matrices and recorded answers
+
+
+@functools.lru_cache(maxsize=1)
+def _get_langsmith_client() -> Optional[Any]:
+    """
+    LangSmith client for run logging, created on first use.
+    
+    Returns:
+        Client, or None if MONEYMENTOR_DISABLE_LANGSMITH is set or LangSmith is unavailable
+    """
+    if os.getenv("MONEYMENTOR_DISABLE_LANGSMITH"):
+        return None
+    
+    try:
+        from langsmith import Client
+        return Client()
+    except ImportError:
+        logger.warning("LangSmith not available")
+    except Exception as e:
+        logger.warning(f"LangSmith client init failed: {e}")
+    return None
+
+
 # Initialize TF-IDF vectorizer for semantic similarity
 logger.info("Initializing TF-IDF vectorizer for semantic similarity...")
-vectorizer = TfidfVectorizer(
-    max_features=5000,
-    ngram_range=(1, 3),
-    stop_words='english'
-)
+_analyze = TfidfVectorizer(ngram_range=(1, 3), stop_words='english').build_analyzer()
+
+
+@functools.lru_cache(maxsize=4096)
+def cached_analyze(text: str) -> tuple:
+    """
+    Tokenize, drop stop words and build 1-3 grams, memoized per string.
+    
+    Expected answers and many contexts are the same for the base and
+    advanced runs, so each is analyzed once per process.
+    """
+    return tuple(_analyze(text))
+
+
+def build_vectorizer(kind: str = "tfidf") -> Any:
+    """
+    Create the text vectorizer used for similarity.
+    
+    Args:
+        kind: "tfidf" (vocabulary + IDF weights) or "hashing" (stateless
+            hashed term counts; no vocabulary pass, no IDF)
+        
+    Returns:
+        Vectorizer producing L2-normalized float32 rows
+    """
+    if kind == "hashing":
+        return HashingVectorizer(
+            analyzer=cached_analyze,
+            n_features=2**18,
+            alternate_sign=False,
+            norm='l2',
+            dtype=np.float32
+        )
+    return TfidfVectorizer(
+        analyzer=cached_analyze,
+        max_features=5000,
+        dtype=np.float32  # Halves the bytes read by each sparse dot product
+    )
+
+
+vectorizer = build_vectorizer()
 logger.info("✅ TF-IDF vectorizer ready\n")
 
 
-def compute_semantic_similarity(text1: str, text2: str) -> float:
+def _texts_key(texts: List[str]) -> str:
+    """Short content hash of a list of texts."""
+    return hashlib.sha256(b"\0".join(text.encode("utf-8") for text in texts)).hexdigest()[:16]
+
+
+def fit_text_matrix(texts: List[str]) -> Any:
     """
-    Compute semantic similarity using TF-IDF vectors and cosine similarity.
+    Fit TF-IDF once over every text in an evaluation run.
+    
+    IDF is computed over the whole run (queries, expected and generated
+    answers, contexts) instead of over each 2-document pair, and every text
+    is tokenized once. The fitted vectorizer and matrix are saved under
+    CACHE_DIR keyed on the texts, so rerunning on the same texts loads them.
     
     Returns:
-        Float between 0.0 and 1.0
+        Sparse matrix with one L2-normalized row per text (None if no text has any terms)
     """
+    cache_path = CACHE_DIR / f"tfidf_{type(vectorizer).__name__}_{_texts_key(texts)}.joblib"
+    if cache_path.exists():
+        try:
+            _, matrix = joblib.load(cache_path)
+            logger.info(f"⚡ Loaded fitted matrix from {cache_path}")
+            return matrix
+        except Exception as e:
+            logger.warning(f"Could not load {cache_path}: {e}")
+    
+    try:
+        matrix = vectorizer.fit_transform(texts)
+    except ValueError as e:
+        logger.warning(f"TF-IDF fit failed: {e}")
+        return None
+    
     try:
-        vectors = vectorizer.fit_transform([text1, text2])
-        similarity = cosine_similarity(vectors[0:1], vectors[1:2])[0][0]
-        # Ensure positive value (cosine can be negative)
-        return max(0.0, min(1.0, similarity))
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        joblib.dump((vectorizer, matrix), cache_path)
     except Exception as e:
-        logger.warning(f"Similarity computation failed: {e}")
-        return 0.0
+        logger.warning(f"Could not save {cache_path}: {e}")
+    return matrix
+
 
+def _answers_path(mode: str) -> Path:
+    return CACHE_DIR / f"answers_{mode}.jsonl"
 
-def score_semantic_faithfulness(generated: str, expected: str, contexts: List[str]) -> float:
+
+def load_recorded_answers(mode: str) -> Dict[str, Dict[str, Any]]:
     """
-    Semantic faithfulness: How well does the generated answer match the expected answer?
+    Load answers recorded by earlier runs of a retriever.
+    
+    Returns:
+        {query hash: {"answer", "contexts"}}; later records win
     """
-    return compute_semantic_similarity(generated, expected)
+    path = _answers_path(mode)
+    if not path.exists():
+        return {}
+    with open(path, 'rb') as f:
+        return {
+            (record := orjson.loads(line))["key"]: record["response"]
+            for line in f
+            if line.strip()
+        }
 
 
-def score_semantic_relevancy(generated: str, query: str) -> float:
+def record_answers(mode: str, answers: Dict[str, Dict[str, Any]]) -> None:
+    """Append answers ({query hash: {"answer", "contexts"}}) to the retriever's record."""
+    if not answers:
+        return
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_answers_path(mode), 'ab') as f:
+            f.write(b"".join(
+                orjson.dumps({"key": key, "response": response}) + b"\n"
+                for key, response in answers.items()
+            ))
+    except OSError as e:
+        logger.warning(f"Could not record answers: {e}")
+
+
+def pair_similarities(matrix: Any, rows_a: List[int], rows_b: List[int]) -> np.ndarray:
     """
-    Semantic relevancy: How well does the answer address the query?
+    Cosine similarity of every (rows_a[i], rows_b[i]) pair, clamped to [0, 1].
+    
+    Rows are already L2-normalized, so each cosine is a row-wise sparse dot
+    product; all pairs of a run are computed in one elementwise multiply and
+    row sum instead of one small sparse product per query.
     """
-    return compute_semantic_similarity(generated, query)
+    sims = np.zeros(len(rows_a))
+    if matrix is None or not rows_a:
+        return sims
+    
+    # Pairs with an empty row (no terms, e.g. an empty context) stay 0
+    row_nnz = np.diff(matrix.indptr)
+    rows_a, rows_b = np.asarray(rows_a), np.asarray(rows_b)
+    live = (row_nnz[rows_a] > 0) & (row_nnz[rows_b] > 0)
+    if live.any():
+        sims[live] = np.asarray(matrix[rows_a[live]].multiply(matrix[rows_b[live]]).sum(axis=1)).ravel()
+    return np.clip(sims, 0.0, 1.0)
 
 
-def score_semantic_precision(contexts: List[str], expected: str) -> float:
+def score_semantic_precision(context_sims: np.ndarray) -> float:
     """
     Semantic precision: How relevant are the retrieved contexts?
     
     Average similarity of contexts to expected answer.
     """
-    if not contexts:
+    if not len(context_sims):
         return 0.0
     
-    similarities = [compute_semantic_similarity(ctx, expected) for ctx in contexts]
-    return sum(similarities) / len(similarities)
+    return float(context_sims.mean())
 
 
-def score_semantic_recall(contexts: List[str], expected: str) -> float:
+def score_semantic_recall(context_sims: np.ndarray) -> float:
     """
     Semantic recall: Do the contexts contain information needed for the answer?
     
     Maximum similarity among contexts (best context relevance).
     """
-    if not contexts:
+    if not len(context_sims):
         return 0.0
     
-    similarities = [compute_semantic_similarity(ctx, expected) for ctx in contexts]
-    return max(similarities)
+    return float(context_sims.max())
 
 
 def load_test_dataset(dataset_path: str) -> List[Dict[str, str]]:
     """Load test queries from JSONL file."""
-    queries = []
-    with open(dataset_path, 'r') as f:
-        for line in f:
-            if line.strip():
-                data = json.loads(line)
-                queries.append({
-                    "query": data["query"],
-                    "expected_answer": data["expected_answer"]
-                })
-    return queries
+    # orjson parses bytes directly, so skip decoding each line to str
+    with open(dataset_path, 'rb') as f:
+        return [
+            {"query": (data := orjson.loads(line))["query"], "expected_answer": data["expected_answer"]}
+            for line in f
+            if line.strip()
+        ]
 
 
 def evaluate_retriever(
     mode: str,
     queries: List[Dict[str, str]],
-    dataset_name: str = "simple"
+    dataset_name: str = "simple",
+    reuse_answers: bool = False
 ) -> List[Dict[str, Any]]:
     """
     Evaluate a retriever with semantic metrics.
@@ -150,6 +269,9 @@ def evaluate_retriever(
         mode: "base" or "advanced"
         queries: List of query dicts with query and expected_answer
         dataset_name: Name of dataset for logging
+        reuse_answers: Use answers recorded by earlier runs instead of
+            calling the pipeline again (only for re-scoring; retriever
+            changes won't show up)
         
     Returns:
         List of result dicts with metrics
@@ -160,127 +282,224 @@ def evaluate_retriever(
     logger.info(f"Evaluating {mode.upper()} retriever on {dataset_name} dataset")
     logger.info(f"{'='*80}\n")
     
-    for i, query_data in enumerate(queries, 1):
+    # Pass 1: collect answers and contexts, recording each text's row
+    texts: List[str] = []
+    records = []
+    
+    def add_text(text: str) -> int:
+        texts.append(text)
+        return len(texts) - 1
+    
+    recorded = load_recorded_answers(mode) if reuse_answers else {}
+    keys = [_texts_key([query_data["query"]]) for query_data in queries]
+    
+    def run_query(i: int, query_data: Dict[str, str]) -> Optional[Dict[str, Any]]:
         query = query_data["query"]
-        expected = query_data["expected_answer"]
+        
+        if keys[i - 1] in recorded:
+            return recorded[keys[i - 1]]
         
         logger.info(f"[{i}/{len(queries)}] {query[:60]}...")
         
         try:
             # Get answer with contexts
-            response = get_finance_answer(
+            return get_finance_answer(
                 query=query,
                 mode=mode,
                 return_context=True,
-                k=5
+                k=5,
+                use_cache=False  # Score the retriever, not a cached answer
             )
-            
-            generated = response["answer"]
-            contexts = response.get("contexts", [])
-            
-            # Compute semantic metrics
-            faithfulness = score_semantic_faithfulness(generated, expected, contexts)
-            relevancy = score_semantic_relevancy(generated, query)
-            precision = score_semantic_precision(contexts, expected)
-            recall = score_semantic_recall(contexts, expected)
-            
-            result = {
-                "query": query,
-                "expected_answer": expected,
-                "generated_answer": generated,
-                "num_contexts": len(contexts),
-                "faithfulness": round(faithfulness, 3),
-                "relevancy": round(relevancy, 3),
-                "precision": round(precision, 3),
-                "recall": round(recall, 3),
-                "mode": mode,
-                "dataset": dataset_name
-            }
-            
-            results.append(result)
-            
-            logger.info(f"  ✓ Faithfulness: {faithfulness:.3f}")
-            logger.info(f"  ✓ Relevancy: {relevancy:.3f}")
-            logger.info(f"  ✓ Precision: {precision:.3f}")
-            logger.info(f"  ✓ Recall: {recall:.3f}\n")
-            
-            # Log to LangSmith
-            if HAS_LANGSMITH and langsmith_client:
-                try:
-                    run = langsmith_client.create_run(
-                        name=f"Semantic_Eval_{mode}_{dataset_name}",
-                        run_type="evaluation",
-                        inputs={"query": query, "mode": mode, "dataset": dataset_name},
-                        outputs=result,
-                        tags=[
-                            "moneymentor",
-                            "semantic_evaluation_tfidf",
-                            f"retriever={mode}",
-                            f"dataset={dataset_name}"
-                        ]
-                    )
-                    # Close run immediately
-                    langsmith_client.update_run(run.id, end_time=datetime.now().isoformat())
-                except Exception as e:
-                    logger.warning(f"LangSmith logging failed: {e}")
-                    
         except Exception as e:
             logger.error(f"  ❌ Error processing query: {e}")
             import traceback
             traceback.print_exc()
+            return None
+    
+    # Answers are I/O-bound (retrieval + LLM), so run them concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        responses = list(executor.map(run_query, range(1, len(queries) + 1), queries))
+    
+    record_answers(mode, {
+        key: {"answer": response["answer"], "contexts": response.get("contexts", [])}
+        for key, response in zip(keys, responses)
+        if response is not None and key not in recorded and response.get("model") != "error"
+    })
+    
+    for query_data, response in zip(queries, responses):
+        if response is None:
             continue
+        
+        generated = response["answer"]
+        contexts = response.get("contexts", [])
+        
+        records.append({
+            "query": query_data["query"],
+            "expected": query_data["expected_answer"],
+            "generated": generated,
+            "num_contexts": len(contexts),
+            "query_row": add_text(query_data["query"]),
+            "expected_row": add_text(query_data["expected_answer"]),
+            "generated_row": add_text(generated),
+            "context_rows": [add_text(ctx) for ctx in contexts]
+        })
+    
+    # Pass 2: one TF-IDF fit over every text, then score by row index
+    matrix = fit_text_matrix(texts) if texts else None
+    
+    # Per query: (generated, expected) for faithfulness, (generated, query)
+    # for relevancy, then (context, expected) for precision/recall
+    rows_a: List[int] = []
+    rows_b: List[int] = []
+    offsets = []
+    for record in records:
+        offsets.append(len(rows_a))
+        rows_a += [record["generated_row"], record["generated_row"], *record["context_rows"]]
+        rows_b += [record["expected_row"], record["query_row"]] + [record["expected_row"]] * len(record["context_rows"])
+    
+    sims = pair_similarities(matrix, rows_a, rows_b)
+    
+    for record, start in zip(records, offsets):
+        query = record["query"]
+        context_sims = sims[start + 2:start + 2 + len(record["context_rows"])]
+        
+        # Compute semantic metrics (faithfulness, relevancy, precision, recall)
+        scores = np.round([
+            sims[start],
+            sims[start + 1],
+            score_semantic_precision(context_sims),
+            score_semantic_recall(context_sims)
+        ], 3).tolist()
+        
+        result = {
+            "query": query,
+            "expected_answer": record["expected"],
+            "generated_answer": record["generated"],
+            "num_contexts": record["num_contexts"],
+            **dict(zip(METRICS, scores)),
+            "mode": mode,
+            "dataset": dataset_name
+        }
+        
+        results.append(result)
+        
+        logger.info(
+            f"{query[:60]}...\n"
+            f"  ✓ F/R/P/R: {scores[0]:.3f} / {scores[1]:.3f} / {scores[2]:.3f} / {scores[3]:.3f}\n"
+        )
+        
+    # Log to LangSmith
+    langsmith_client = _get_langsmith_client()
+    if langsmith_client:
+        log_langsmith_runs(langsmith_client, results, mode, dataset_name)
     
     return results
 
 
+def log_langsmith_runs(
+    langsmith_client: Any,
+    results: List[Dict[str, Any]],
+    mode: str,
+    dataset_name: str
+) -> None:
+    """
+    Log one LangSmith evaluation run per result, off the scoring loop.
+    
+    Each run is created already closed (end_time set), so it takes one
+    request instead of create + update, and the requests run concurrently.
+    """
+    tags = [
+        "moneymentor",
+        "semantic_evaluation_tfidf",
+        f"retriever={mode}",
+        f"dataset={dataset_name}"
+    ]
+    
+    def create_run(result: Dict[str, Any]) -> None:
+        now = datetime.now()
+        try:
+            langsmith_client.create_run(
+                name=f"Semantic_Eval_{mode}_{dataset_name}",
+                run_type="evaluation",
+                inputs={"query": result["query"], "mode": mode, "dataset": dataset_name},
+                outputs=result,
+                tags=tags,
+                start_time=now,
+                end_time=now
+            )
+        except Exception as e:
+            logger.warning(f"LangSmith logging failed: {e}")
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(create_run, results))
+
+
+def _avg(results: List[Dict[str, Any]], key: str) -> float:
+    """Mean of one metric, read straight into a float array."""
+    return float(np.fromiter((r[key] for r in results), dtype=np.float64, count=len(results)).mean())
+
+
 def generate_comparison_report(
     base_results: List[Dict[str, Any]],
     hybrid_results: List[Dict[str, Any]],
     dataset_name: str
-) -> pd.DataFrame:
-    """Generate comparison DataFrame and summary statistics."""
+) -> List[Dict[str, Any]]:
+    """
+    Generate the comparison table: metric averages per retriever plus deltas.
+    
+    Returns:
+        One row dict per retriever (Base, Hybrid+Rerank); the Δ columns are
+        formatted percentages, empty for the Base row
+    """
     
     # Calculate averages
+    base_means = np.array([_avg(base_results, m) for m in METRICS])
+    hybrid_means = np.array([_avg(hybrid_results, m) for m in METRICS])
+    
+    labels = [m.capitalize() for m in METRICS]
     base_avg = {
         "Retriever": "Base",
-        "Faithfulness": sum(r["faithfulness"] for r in base_results) / len(base_results),
-        "Relevancy": sum(r["relevancy"] for r in base_results) / len(base_results),
-        "Precision": sum(r["precision"] for r in base_results) / len(base_results),
-        "Recall": sum(r["recall"] for r in base_results) / len(base_results),
+        **dict(zip(labels, base_means.tolist())),
         "Queries": len(base_results),
         "Dataset": dataset_name
     }
-    
     hybrid_avg = {
         "Retriever": "Hybrid+Rerank",
-        "Faithfulness": sum(r["faithfulness"] for r in hybrid_results) / len(hybrid_results),
-        "Relevancy": sum(r["relevancy"] for r in hybrid_results) / len(hybrid_results),
-        "Precision": sum(r["precision"] for r in hybrid_results) / len(hybrid_results),
-        "Recall": sum(r["recall"] for r in hybrid_results) / len(hybrid_results),
+        **dict(zip(labels, hybrid_means.tolist())),
         "Queries": len(hybrid_results),
         "Dataset": dataset_name
     }
     
-    # Create DataFrame
-    df = pd.DataFrame([base_avg, hybrid_avg])
-    
     # Add improvement columns
-    df["Δ Faithfulness"] = df["Faithfulness"].diff()
-    df["Δ Relevancy"] = df["Relevancy"].diff()
-    df["Δ Precision"] = df["Precision"].diff()
-    df["Δ Recall"] = df["Recall"].diff()
+    for label, delta in zip(labels, (hybrid_means - base_means).tolist()):
+        base_avg[f"Δ {label}"] = ""
+        hybrid_avg[f"Δ {label}"] = f"{delta:+.1%}"
     
-    # Format percentages
-    for col in ["Δ Faithfulness", "Δ Relevancy", "Δ Precision", "Δ Recall"]:
-        df[col] = df[col].apply(lambda x: f"{x:+.1%}" if pd.notna(x) else "")
-    
-    return df
+    return [base_avg, hybrid_avg]
+
+
+def format_comparison_table(comparison: List[Dict[str, Any]]) -> str:
+    """Render comparison rows as a Markdown table."""
+    columns = list(comparison[0])
+    
+    def cell(value: Any) -> str:
+        if isinstance(value, float):
+            return f"{value:.4f}"
+        return str(value)
+    
+    lines = [
+        "| " + " | ".join(columns) + " |",
+        "|" + "|".join("---" for _ in columns) + "|"
+    ]
+    for row in comparison:
+        lines.append("| " + " | ".join(cell(row[column]) for column in columns) + " |")
+    return "\n".join(lines)
 
 
 def save_results(
     base_results: List[Dict[str, Any]],
     hybrid_results: List[Dict[str, Any]],
-    comparison_df: pd.DataFrame,
+    comparison: List[Dict[str, Any]],
     dataset_name: str
 ):
     """Save all results to files."""
@@ -294,7 +513,7 @@ def save_results(
         "method": "TF-IDF + Cosine Similarity",
         "base_retriever": base_results,
         "hybrid_retriever": hybrid_results,
-        "summary": comparison_df.to_dict(orient="records")
+        "summary": comparison
     }
     
     results_path = f"reports/semantic_evaluation_{dataset_name}_{timestamp}.json"
@@ -304,7 +523,10 @@ def save_results(
     
     # Save comparison CSV
     csv_path = f"reports/semantic_comparison_{dataset_name}_{timestamp}.csv"
-    comparison_df.to_csv(csv_path, index=False)
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(comparison[0]))
+        writer.writeheader()
+        writer.writerows(comparison)
     logger.info(f"✅ Comparison CSV saved: {csv_path}")
     
     # Save markdown report
@@ -316,11 +538,11 @@ def save_results(
         f.write(f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         f.write(f"**Queries:** {len(base_results)}\n\n")
         f.write(f"## Summary\n\n")
-        f.write(comparison_df.to_markdown(index=False))
+        f.write(format_comparison_table(comparison))
         f.write(f"\n\n## Key Findings\n\n")
         
         # Extract improvements
-        hybrid_row = comparison_df.iloc[1]
+        hybrid_row = comparison[1]
         f.write(f"- **Faithfulness:** {hybrid_row['Δ Faithfulness']} improvement\n")
         f.write(f"- **Precision:** {hybrid_row['Δ Precision']} improvement\n")
         f.write(f"- **Recall:** {hybrid_row['Δ Recall']} improvement\n")
@@ -342,8 +564,22 @@ def main():
         choices=["simple", "reasoning"],
         help="Dataset to evaluate (simple or reasoning)"
     )
+    parser.add_argument(
+        "--vectorizer",
+        default="tfidf",
+        choices=["tfidf", "hashing"],
+        help="Text vectorizer (tfidf, or hashing to skip the vocabulary pass)"
+    )
+    parser.add_argument(
+        "--reuse-answers",
+        action="store_true",
+        help="Re-score answers recorded in .cache/ by earlier runs instead of querying again"
+    )
     args = parser.parse_args()
     
+    global vectorizer
+    vectorizer = build_vectorizer(args.vectorizer)
+    
     # Determine dataset path
     if args.dataset == "simple":
         dataset_path = "evaluation/golden_set.jsonl"
@@ -357,7 +593,7 @@ def main():
     logger.info(f"{'='*80}")
     logger.info(f"Dataset: {dataset_name}")
     logger.info(f"Path: {dataset_path}")
-    logger.info(f"Method: TF-IDF + Cosine Similarity")
+    logger.info(f"Method: {args.vectorizer} + Cosine Similarity")
     logger.info(f"{'='*80}\n")
     
     # Load test queries
@@ -365,27 +601,27 @@ def main():
     logger.info(f"✅ Loaded {len(queries)} test queries\n")
     
     # Evaluate Base retriever
-    base_results = evaluate_retriever("base", queries, dataset_name)
+    base_results = evaluate_retriever("base", queries, dataset_name, args.reuse_answers)
     
     # Evaluate Hybrid+Rerank retriever
-    hybrid_results = evaluate_retriever("advanced", queries, dataset_name)
+    hybrid_results = evaluate_retriever("advanced", queries, dataset_name, args.reuse_answers)
     
     # Generate comparison
     logger.info(f"\n{'='*80}")
     logger.info(f"GENERATING COMPARISON REPORT")
     logger.info(f"{'='*80}\n")
     
-    comparison_df = generate_comparison_report(base_results, hybrid_results, dataset_name)
+    comparison = generate_comparison_report(base_results, hybrid_results, dataset_name)
     
     # Print results
     print("\n" + "="*80)
     print("SEMANTIC RAGAS EVALUATION RESULTS")
     print("="*80 + "\n")
-    print(comparison_df.to_string(index=False))
+    print(format_comparison_table(comparison))
     print("\n" + "="*80 + "\n")
     
     # Save results
-    save_results(base_results, hybrid_results, comparison_df, dataset_name)
+    save_results(base_results, hybrid_results, comparison, dataset_name)
     
     logger.info("\n✅ Semantic evaluation complete!")
     logger.info(f"Check reports/ directory for detailed results\n")
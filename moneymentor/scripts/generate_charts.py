@@ -5,6 +5,8 @@ Generate bar charts for semantic evaluation results.
 Creates side-by-side bar charts comparing Base vs Hybrid+Rerank retrievers.
 """
 
+import matplotlib
+matplotlib.use('Agg')  # Files only; skip the GUI backend probe
 import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
@@ -12,6 +14,9 @@ from pathlib import Path
 # Set style for modern, professional charts
 plt.style.use('seaborn-v0_8-darkgrid')
 
+CHART_DPI = 150  # Enough for docs images; 300 made multi-megapixel PNGs
+CHART_MARGINS = dict(left=0.08, right=0.98, top=0.9, bottom=0.1)  # Room for labels, title and subtitle
+
 # Modern color palette (not glaring)
 COLORS = {
     'base': '#4A90E2',        # Soft blue
@@ -52,11 +57,12 @@ REASONING_DATA = {
 }
 
 
-def create_comparison_chart(data, title, filename, dataset_info):
+def create_comparison_chart(ax, data, title, filename, dataset_info):
     """
     Create a side-by-side bar chart comparing Base vs Hybrid+Rerank.
     
     Args:
+        ax: Shared Axes to draw on (cleared first; its figure is saved)
         data: Dictionary with 'Base' and 'Hybrid+Rerank' metrics
         title: Chart title
         filename: Output filename
@@ -67,7 +73,9 @@ def create_comparison_chart(data, title, filename, dataset_info):
     hybrid_values = list(data['Hybrid+Rerank'].values())
     
     # Set up the figure
-    fig, ax = plt.subplots(figsize=(12, 7))
+    ax.clear()
+    fig = ax.figure
+    fig.set_size_inches(12, 7)
     
     # Bar positions
     x = np.arange(len(metrics))
@@ -117,20 +125,23 @@ def create_comparison_chart(data, title, filename, dataset_info):
     ax.spines['left'].set_color(COLORS['grid'])
     ax.spines['bottom'].set_color(COLORS['grid'])
     
-    # Tight layout
-    plt.tight_layout()
+    # Fixed margins (measuring a tight layout costs an extra draw)
+    fig.subplots_adjust(**CHART_MARGINS)
     
     # Save
     output_path = Path('docs/images') / filename
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+    fig.savefig(output_path, dpi=CHART_DPI, facecolor='white')
     print(f"✅ Saved: {output_path}")
-    
-    plt.close()
 
 
-def create_delta_chart(simple_data, reasoning_data):
+def create_delta_chart(ax, simple_data, reasoning_data):
     """
     Create a chart showing improvement deltas for Faithfulness and Relevancy.
+    
+    Args:
+        ax: Shared Axes to draw on (cleared first; its figure is saved)
+        simple_data: Metrics for the simple dataset
+        reasoning_data: Metrics for the reasoning dataset
     """
     # Calculate deltas
     simple_faith_delta = (simple_data['Hybrid+Rerank']['Faithfulness'] - 
@@ -149,7 +160,9 @@ def create_delta_chart(simple_data, reasoning_data):
     reasoning_deltas = [reasoning_faith_delta, reasoning_rel_delta]
     
     # Set up the figure
-    fig, ax = plt.subplots(figsize=(10, 7))
+    ax.clear()
+    fig = ax.figure
+    fig.set_size_inches(10, 7)
     
     # Bar positions
     x = np.arange(len(metrics))
@@ -205,15 +218,13 @@ def create_delta_chart(simple_data, reasoning_data):
     ax.spines['left'].set_color(COLORS['grid'])
     ax.spines['bottom'].set_color(COLORS['grid'])
     
-    # Tight layout
-    plt.tight_layout()
+    # Fixed margins (measuring a tight layout costs an extra draw)
+    fig.subplots_adjust(**CHART_MARGINS)
     
     # Save
     output_path = Path('docs/images') / 'semantic_eval_improvement.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+    fig.savefig(output_path, dpi=CHART_DPI, facecolor='white')
     print(f"✅ Saved: {output_path}")
-    
-    plt.close()
 
 
 def main():
@@ -222,8 +233,12 @@ def main():
     print("📊 GENERATING SEMANTIC EVALUATION CHARTS")
     print("="*80 + "\n")
     
+    # One Figure for all charts; each chart clears and redraws its Axes
+    fig, ax = plt.subplots(figsize=(12, 7))
+    
     # Simple dataset chart
     create_comparison_chart(
+        ax,
         data=SIMPLE_DATA,
         title='Semantic Evaluation Results: Simple Dataset',
         filename='semantic_eval_simple.png',
@@ -232,6 +247,7 @@ def main():
     
     # Reasoning dataset chart
     create_comparison_chart(
+        ax,
         data=REASONING_DATA,
         title='Semantic Evaluation Results: Reasoning Dataset',
         filename='semantic_eval_reasoning.png',
@@ -239,7 +255,9 @@ def main():
     )
     
     # Improvement delta chart
-    create_delta_chart(SIMPLE_DATA, REASONING_DATA)
+    create_delta_chart(ax, SIMPLE_DATA, REASONING_DATA)
+    
+    plt.close(fig)
     
     print("\n" + "="*80)
     print("✅ ALL CHARTS GENERATED SUCCESSFULLY!")
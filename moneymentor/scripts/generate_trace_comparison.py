@@ -5,10 +5,14 @@ Generate a visual comparison diagram for Base vs Hybrid+Rerank traces.
 This serves as an alternative to LangSmith screenshots.
 """
 
+import matplotlib
+matplotlib.use('Agg')  # Files only; skip the GUI backend probe
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from pathlib import Path
 
+CHART_DPI = 150  # Enough for docs images; 300 made multi-megapixel PNGs
+
 # Modern color palette
 COLORS = {
     'base_bg': '#E3F2FD',      # Light blue
@@ -19,6 +23,11 @@ COLORS = {
     'metric_neutral': '#FFC107' # Amber
 }
 
+# Text styles for the panel rows
+FONT_HEADER = {'fontsize': 11, 'fontweight': 'bold', 'color': COLORS['text']}
+FONT_LABEL = {'fontsize': 10, 'color': COLORS['text']}
+FONT_VALUE = {'fontsize': 10, 'fontweight': 'bold'}
+
 
 def create_trace_comparison():
     """Create a side-by-side comparison diagram of traces."""
@@ -68,22 +77,6 @@ def create_trace_comparison():
         ('• Single-stage retrieval', '', 0.9),
     ]
     
-    for label, value, y_pos in base_content:
-        if label and not value:  # Section headers
-            ax_base.text(1.0, y_pos, label, 
-                        fontsize=11, fontweight='bold',
-                        color=COLORS['text'])
-        elif label and value:  # Key-value pairs
-            ax_base.text(1.0, y_pos, label, 
-                        fontsize=10, color=COLORS['text'])
-            ax_base.text(4.5, y_pos, value, 
-                        fontsize=10, fontweight='bold',
-                        color=COLORS['text'])
-        elif label:  # Plain text
-            ax_base.text(1.5, y_pos, label, 
-                        fontsize=9, style='italic',
-                        color=COLORS['text'])
-    
     # HYBRID+RERANK RETRIEVER (Right)
     hybrid_rect = patches.FancyBboxPatch(
         (0.5, 0.5), 8, 9,
@@ -121,22 +114,16 @@ def create_trace_comparison():
         ('• Reranked to top 5', '', 0.9),
     ]
     
-    for label, value, y_pos in hybrid_content:
-        if label and not value:  # Section headers
-            ax_hybrid.text(1.0, y_pos, label, 
-                          fontsize=11, fontweight='bold',
-                          color=COLORS['text'])
-        elif label and value:  # Key-value pairs
-            color = COLORS['metric_good'] if '✓' in value else COLORS['text']
-            ax_hybrid.text(1.0, y_pos, label, 
-                          fontsize=10, color=COLORS['text'])
-            ax_hybrid.text(4.0, y_pos, value, 
-                          fontsize=10, fontweight='bold',
-                          color=color)
-        elif label:  # Plain text
-            ax_hybrid.text(1.5, y_pos, label, 
-                          fontsize=9, style='italic',
-                          color=COLORS['text'])
+    # Panel rows: section headers/plain lines have no value, metrics do
+    for ax, content, value_x in ((ax_base, base_content, 4.5), (ax_hybrid, hybrid_content, 4.0)):
+        rows = [('kv' if value else 'header', label, value, y_pos) for label, value, y_pos in content if label]
+        for kind, label, value, y_pos in rows:
+            if kind == 'header':
+                ax.text(1.0, y_pos, label, fontdict=FONT_HEADER)
+            else:
+                ax.text(1.0, y_pos, label, fontdict=FONT_LABEL)
+                ax.text(value_x, y_pos, value, fontdict=FONT_VALUE,
+                        color=COLORS['metric_good'] if '✓' in value else COLORS['text'])
     
     # Overall title
     fig.suptitle('LangSmith Trace Comparison: Base vs Hybrid+Rerank',
@@ -146,11 +133,12 @@ def create_trace_comparison():
     fig.text(0.5, 0.95, 'Semantic Evaluation on Complex Query (Reasoning Dataset)',
             ha='center', fontsize=12, style='italic', color='gray')
     
-    plt.tight_layout(rect=[0, 0.03, 1, 0.94])
+    # Fixed margins below the titles (measuring a tight layout costs an extra draw)
+    fig.subplots_adjust(left=0.02, right=0.98, top=0.93, bottom=0.03, wspace=0.05)
     
     # Save
     output_path = Path('docs/images') / 'langsmith_trace_comparison.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+    fig.savefig(output_path, dpi=CHART_DPI, facecolor='white')
     print(f"✅ Saved: {output_path}")
     
     plt.close()
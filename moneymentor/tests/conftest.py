@@ -0,0 +1,8 @@
+"""
+Shared pytest setup: app modules import each other as top-level modules
+(e.g. `from vectorstore import ...`), so put app/ on the path.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
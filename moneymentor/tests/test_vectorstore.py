@@ -0,0 +1,60 @@
+"""
+Tests for vectorstore helpers against an in-memory Qdrant instance.
+"""
+import pytest
+
+pytest.importorskip("qdrant_client")
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, PointStruct, SparseVector, VectorParams
+
+import vectorstore
+
+
+@pytest.fixture
+def memory_client(monkeypatch):
+    client = QdrantClient(":memory:")
+    monkeypatch.setattr(vectorstore, "get_qdrant_client", lambda: client)
+    return client
+
+
+def test_fetch_vectors_by_hash_with_sparse_vector(memory_client):
+    """Hybrid collections return named vectors; only the dense one is wanted."""
+    memory_client.create_collection(
+        collection_name="hybrid",
+        vectors_config=VectorParams(size=3, distance=Distance.COSINE),
+        sparse_vectors_config=vectorstore.BM25_SPARSE_CONFIG
+    )
+    memory_client.upsert(
+        collection_name="hybrid",
+        points=[
+            PointStruct(
+                id=1,
+                vector={
+                    "": [0.6, 0.8, 0.0],
+                    vectorstore.BM25_SPARSE_VECTOR: SparseVector(indices=[7], values=[1.0])
+                },
+                payload={"content_hash": "abc"}
+            )
+        ]
+    )
+
+    found = vectorstore.fetch_vectors_by_hash("hybrid", ["abc", "missing"])
+
+    assert list(found) == ["abc"]
+    assert found["abc"] == pytest.approx([0.6, 0.8, 0.0])
+
+
+def test_fetch_vectors_by_hash_dense_only(memory_client):
+    memory_client.create_collection(
+        collection_name="dense",
+        vectors_config=VectorParams(size=3, distance=Distance.DOT)
+    )
+    memory_client.upsert(
+        collection_name="dense",
+        points=[PointStruct(id=1, vector=[0.5, 0.5, 0.0], payload={"content_hash": "abc"})]
+    )
+
+    found = vectorstore.fetch_vectors_by_hash("dense", ["abc"])
+
+    assert found["abc"] == pytest.approx([0.5, 0.5, 0.0])